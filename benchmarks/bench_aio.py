@@ -0,0 +1,75 @@
+"""
+Event-loop responsiveness and throughput of AsyncCompiler vs threads.
+
+Usage:
+    python -m benchmarks.bench_aio [--sources N] [--workers N]
+
+"threads" wraps ASTGenerator.generate() in asyncio.to_thread(), as
+callers had to before; the GIL-bound parse then stalls the event loop.
+"process pool" uses AsyncCompiler. The stall column is the longest gap
+seen by a task that ticks every millisecond while the sources compile.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import expression_heavy_source
+from src.astgen.aio import AsyncCompiler
+from src.astgen.parse_cache import generate_result
+
+
+async def measure(compile_all):
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    tick = asyncio.ensure_future(ticker())
+    start = time.perf_counter()
+    results = await compile_all()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    assert not any(isinstance(r, str) for r in results)
+    return elapsed, stall
+
+
+async def run(args):
+    sources = [expression_heavy_source(4, 6) + f"\nint unique{i}() {{ return {i}; }}\n" for i in range(args.sources)]
+
+    async def threads():
+        return await asyncio.gather(*(asyncio.to_thread(generate_result, s) for s in sources))
+
+    async with AsyncCompiler(args.workers) as compiler:
+        # Start the workers and warm their caches outside the timed region
+        await asyncio.gather(*(compiler.generate(sources[0]) for _ in range(compiler.workers)))
+
+        async def pool():
+            return await asyncio.gather(*(compiler.generate(s) for s in sources))
+
+        generate_result(sources[0])
+        for name, compile_all in (("threads", threads), ("process pool", pool)):
+            elapsed, stall = await measure(compile_all)
+            print(f"{name:<13} {elapsed:>7.2f} s  {args.sources / elapsed:>7.1f} files/s  max stall {stall * 1000:>7.1f} ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--sources", type=int, default=100)
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = arg_parser.parse_args()
+    print(f"{args.sources} sources, {args.workers} workers, {os.cpu_count()} CPUs")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
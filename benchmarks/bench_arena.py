@@ -0,0 +1,65 @@
+"""
+Memory and traversal time of the object AST against the array-backed Arena.
+
+Usage:
+    python -m benchmarks.bench_arena [--statements N]
+
+Object nodes get realistic source positions, since positions past 256 are
+separate int objects. Arena memory is Arena.nbytes(), string and constant
+tables included.
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.bench_ast_memory import synthetic_program
+from benchmarks.common import best_of
+from src.utils import nodes
+from src.utils.arena import Arena
+
+
+def positioned_program(statements: int):
+    program = synthetic_program(nodes, statements)
+    for i, node in enumerate(nodes.walk(program)):
+        node.line = i // 8 + 1
+        node.column = i % 8 * 6
+    return program
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--statements", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    tracemalloc.start()
+    program = positioned_program(args.statements)
+    object_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = sum(1 for _ in nodes.walk(program))
+    arena = Arena.from_node(program)
+    arena_bytes = arena.nbytes()
+
+    print(f"nodes: {count:,} ({len(arena):,} arena entries with LIST/NONE)")
+    print(f"objects {object_bytes / 1e6:>8.1f} MB  {object_bytes / count:>6.1f} bytes/node")
+    print(f"arena   {arena_bytes / 1e6:>8.1f} MB  {arena_bytes / count:>6.1f} bytes/node")
+    print(f"memory: {object_bytes / arena_bytes:.2f}x smaller")
+
+    def count_objects():
+        kinds = {}
+        for node in nodes.walk(program):
+            kinds[type(node)] = kinds.get(type(node), 0) + 1
+
+    def count_arena():
+        kinds = {}
+        for code in arena.kind:
+            kinds[code] = kinds.get(code, 0) + 1
+
+    for label, fn in (("walk()", count_objects), ("arena scan", count_arena)):
+        seconds = best_of(fn, repeat=3)
+        print(f"{label:<11} {seconds * 1000:>8.1f} ms  {seconds / count * 1e9:>6.1f} ns/node")
+    for label, fn in (("from_node", lambda: Arena.from_node(program)), ("to_node", arena.to_node)):
+        print(f"{label:<11} {best_of(fn, repeat=3) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
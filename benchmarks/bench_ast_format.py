@@ -0,0 +1,49 @@
+"""
+Loading a saved AST against lexing and parsing the source again.
+
+Usage:
+    python -m benchmarks.bench_ast_format [--functions N]
+
+"load + to_node" rebuilds the full object AST from the file; "load + scan"
+maps the file and visits every node through the arena's kind column only.
+"""
+
+import argparse
+import os
+import tempfile
+
+from benchmarks.common import best_of, expression_heavy_source
+from src.astgen.ast_generation import generate_ast
+from src.utils import ast_format
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--functions", type=int, default=100)
+    args = arg_parser.parse_args()
+
+    source = expression_heavy_source(args.functions, 20)
+    program = generate_ast(source)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "program.tycast")
+        ast_format.dump(program, path)
+        print(f"source: {len(source) / 1e3:.0f} KB  AST file: {os.path.getsize(path) / 1e3:.0f} KB")
+        assert str(ast_format.load(path).to_node()) == str(program)
+
+        def scan():
+            arena = ast_format.load(path)
+            return sum(1 for _ in arena.walk())
+
+        results = {}
+        for label, fn in (
+            ("parse", lambda: generate_ast(source)),
+            ("load + to_node", lambda: ast_format.load(path).to_node()),
+            ("load + scan", scan),
+        ):
+            results[label] = best_of(fn, repeat=3)
+            print(f"{label:<15} {results[label] * 1000:>9.1f} ms  "
+                  f"{results['parse'] / results[label]:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Memory per AST node for a large synthetic Program.
+
+Usage:
+    python -m benchmarks.bench_ast_memory [--statements N] [--baseline FILE]
+
+FILE is another version of src/utils/nodes.py to compare against, for
+example the dict-based classes from before __slots__:
+    git show <rev>:src/utils/nodes.py > /tmp/nodes_before.py
+"""
+
+import argparse
+import importlib.util
+import tracemalloc
+
+from benchmarks.common import project_root
+
+
+def load_nodes(path: str, tag: str):
+    spec = importlib.util.spec_from_file_location(f"{tag}_nodes", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_program(n, statements: int):
+    """Build a Program of functions holding `statements` statements in total."""
+    decls = []
+    for f in range(max(1, statements // 100)):
+        body = []
+        for s in range(100):
+            name = f"x{s}"
+            body.append(
+                n.VarDecl(
+                    n.IntType(),
+                    name,
+                    n.BinaryOp(
+                        n.BinaryOp(n.Identifier("a"), "+", n.IntLiteral(s)),
+                        "*",
+                        n.MemberAccess(n.Identifier("p"), "y"),
+                    ),
+                )
+            )
+            body.append(
+                n.IfStmt(
+                    n.BinaryOp(n.Identifier(name), "<", n.IntLiteral(f)),
+                    n.ExprStmt(n.AssignExpr(n.Identifier(name), n.FuncCall("g", [n.Identifier(name)]))),
+                )
+            )
+        params = [n.Param(n.IntType(), "a"), n.Param(n.StructType("Point"), "p")]
+        decls.append(n.FuncDecl(n.VoidType(), f"f{f}", params, n.BlockStmt(body)))
+    return n.Program(decls)
+
+
+def count_nodes(n, root) -> int:
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, n.ASTNode):
+            count += 1
+            for name in ("decls", "params", "body", "statements", "var_type", "init_value",
+                         "left", "right", "condition", "then_stmt", "expr", "lhs", "rhs",
+                         "obj", "args", "param_type", "return_type"):
+                stack.append(getattr(node, name, None))
+    return count
+
+
+def measure(label: str, n, statements: int):
+    tracemalloc.start()
+    program = synthetic_program(n, statements)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = count_nodes(n, program)
+    print(f"{label:<10} nodes={nodes:>9,}  total={allocated / 1e6:>8.1f} MB  {allocated / nodes:>6.1f} bytes/node")
+    return allocated / nodes
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--statements", type=int, default=100_000)
+    arg_parser.add_argument("--baseline", help="nodes.py to compare against")
+    args = arg_parser.parse_args()
+
+    current = measure("current", load_nodes(f"{project_root}/src/utils/nodes.py", "current"), args.statements)
+    if args.baseline:
+        baseline = measure("baseline", load_nodes(args.baseline, "baseline"), args.statements)
+        print(f"bytes/node: {baseline / current:.2f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
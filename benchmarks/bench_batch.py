@@ -0,0 +1,42 @@
+"""
+Throughput of compile_files() over a corpus of small files, by worker count.
+
+Usage:
+    python -m benchmarks.bench_batch [--files N] [--workers N ...]
+
+Throughput can only scale up to the number of CPUs.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.common import expression_heavy_source
+from src.astgen.batch import compile_files
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--files", type=int, default=400)
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, os.cpu_count()}))
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(tmp, f"f{i}.tyc")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(expression_heavy_source(2, 3) + f"\nint unique{i}() {{ return {i}; }}\n")
+            paths.append(path)
+        print(f"{args.files} files, {os.cpu_count()} CPUs")
+        for workers in args.workers:
+            start = time.perf_counter()
+            failed = sum(not r["ok"] for r in compile_files(paths, workers, include_ast=False))
+            elapsed = time.perf_counter() - start
+            assert not failed
+            print(f"workers={workers:<3} {elapsed:>7.2f} s  {args.files / elapsed:>8.1f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Cost of return type inference along deep call chains.
+
+Usage:
+    python -m benchmarks.bench_call_graph [--sizes N ...]
+
+Every function has an omitted return type and returns the next one's
+result plus one, and callers are declared before their callees, so no
+return type is known until the end of the chain. A ring of mutually
+recursive functions is timed as well. Time per function should stay flat
+as chains grow.
+"""
+
+import argparse
+import gc
+
+from benchmarks.common import best_of
+from src.astgen.ast_generation import generate_ast
+from src.semantics.call_graph import inference_order
+from src.semantics.type_inference import infer_types
+
+
+def chain_source(n: int, ring: bool = False) -> str:
+    lines = [f"f{i}(int n) {{ if (n) return f{i + 1}(n - 1) + 1; return 0; }}" for i in range(n - 1)]
+    last = "f0(n - 1) + 1" if ring else "n"
+    lines.append(f"f{n - 1}(int n) {{ if (n) return {last}; return 0; }}")
+    lines.append("void main() { printInt(f0(10)); }")
+    return "\n".join(lines)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000])
+    args = arg_parser.parse_args()
+
+    for ring in (False, True):
+        for n in args.sizes:
+            program = generate_ast(chain_source(n, ring))
+            gc.collect()
+            gc.freeze()
+            order = best_of(lambda: inference_order(program), 3)
+            elapsed = best_of(lambda: infer_types(program), 3)
+            shape = "ring " if ring else "chain"
+            print(
+                f"{shape} {n:>6} functions  order {order * 1000:>7.1f} ms"
+                f"  inference {elapsed * 1000:>8.1f} ms  {elapsed / n * 1e6:>6.1f} us/function"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Parse-tree size and parse time on expression-heavy TyC input.
+
+Usage:
+    python -m benchmarks.bench_expr_grammar [--baseline DIR]
+
+DIR is an ANTLR output directory generated from another TyC.g4 (for example
+the grammar before the expression rules were flattened); when given, both
+grammars are measured on the same input.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+from benchmarks.common import build_dir, best_of, expression_heavy_source
+from antlr4 import CommonTokenStream, InputStream, ParserRuleContext
+
+
+def load_generated(directory: str, tag: str):
+    """Load TyCLexer and TyCParser from an ANTLR output directory."""
+    sys.path.insert(0, directory)
+    classes = []
+    for name in ("TyCLexer", "TyCParser"):
+        path = os.path.join(directory, f"{name}.py")
+        spec = importlib.util.spec_from_file_location(f"{tag}_{name}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        classes.append(getattr(module, name))
+    return classes
+
+
+def count_contexts(tree) -> int:
+    """Count rule contexts in a parse tree without recursion."""
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParserRuleContext):
+            count += 1
+            stack.extend(node.children or [])
+    return count
+
+
+def measure(label: str, lexer_cls, parser_cls, source: str):
+    def parse():
+        parser = parser_cls(CommonTokenStream(lexer_cls(InputStream(source))))
+        return parser.program()
+
+    tree = parse()
+    contexts = count_contexts(tree)
+    seconds = best_of(parse, repeat=3)
+    print(f"{label:<10} contexts={contexts:>9,}  parse={seconds * 1000:>9.1f} ms")
+    return contexts, seconds
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--baseline", help="ANTLR output directory to compare against")
+    arg_parser.add_argument("--functions", type=int, default=50)
+    arg_parser.add_argument("--statements", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    source = expression_heavy_source(args.functions, args.statements)
+    print(f"input: {len(source):,} chars")
+
+    current = measure("current", *load_generated(build_dir, "current"), source)
+    if args.baseline:
+        baseline = measure("baseline", *load_generated(args.baseline, "baseline"), source)
+        print(
+            f"contexts: {baseline[0] / current[0]:.2f}x fewer, "
+            f"parse time: {baseline[1] / current[1]:.2f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Re-parsing a large file after a one-line edit inside one function:
+full generate_ast() against IncrementalParser.edit().
+
+Usage:
+    python -m benchmarks.bench_incremental [--functions N] [--statements N]
+
+The edit inserts a statement and a newline, so every declaration after it
+also has its positions shifted.
+"""
+
+import argparse
+
+from benchmarks.common import best_of, expression_heavy_source
+from src.astgen.ast_generation import generate_ast
+from src.astgen.incremental import IncrementalParser
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--functions", type=int, default=200)
+    arg_parser.add_argument("--statements", type=int, default=20, help="per function")
+    args = arg_parser.parse_args()
+
+    source = expression_heavy_source(args.functions, args.statements)
+    parser = IncrementalParser(source)
+    # Inside the body of the middle function
+    at = source.index("{", source.index(f"int f{args.functions // 2}(")) + 1
+    statement = "\n    auto y = a * b;"
+    print(f"source: {len(source) / 1e3:.0f} KB, {len(parser.program.decls)} declarations")
+
+    def edit_and_undo():
+        parser.edit(at, at, statement)
+        parser.edit(at, at + len(statement), "")
+
+    full = best_of(lambda: generate_ast(source), repeat=3)
+    incremental = best_of(edit_and_undo, repeat=20) / 2
+    assert str(parser.program) == str(generate_ast(source))
+    print(f"full parse   {full * 1000:>9.1f} ms")
+    print(f"incremental  {incremental * 1000:>9.1f} ms  ({full / incremental:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Peak RSS of lexing a large file through InputStream and ChunkedInputStream.
+
+Usage:
+    python -m benchmarks.bench_input_memory [--megabytes N] [--tokens N]
+
+Each input path runs in a fresh interpreter so that peak RSS (ru_maxrss)
+belongs to that path alone. --tokens limits how many tokens are lexed; the
+InputStream cost is paid in full before the first token either way.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import expression_heavy_source, project_root
+
+MODES = ("baseline", "inputstream", "chunked", "iter_tokens")
+
+
+def write_source(path: str, megabytes: float):
+    unit = expression_heavy_source(20, 20) + "\n"
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(max(1, int(megabytes * 1e6 / len(unit)))):
+            f.write(unit)
+
+
+def peak_rss_kb() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def child(mode: str, path: str, limit: int):
+    """Lex path with one input path and print the process's peak RSS in KB."""
+    from antlr4 import InputStream
+    from src.utils.fast_lexer import iter_tokens
+    from src.utils.parsing import make_lexer
+    from src.utils.streams import open_source
+
+    count = 0
+    if mode == "inputstream":
+        with open(path, encoding="utf-8") as f:
+            lexer = make_lexer(InputStream(f.read()))
+        while count < limit and lexer.nextToken().type != -1:
+            count += 1
+    elif mode == "chunked":
+        with open_source(path) as stream:
+            lexer = make_lexer(stream)
+            while count < limit and lexer.nextToken().type != -1:
+                count += 1
+    elif mode == "iter_tokens":
+        with open(path, "rb") as f:
+            for _ in iter_tokens(f):
+                count += 1
+                if count >= limit:
+                    break
+    print(peak_rss_kb(), count)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--megabytes", type=float, default=20)
+    arg_parser.add_argument("--tokens", type=int, default=200_000)
+    arg_parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child:
+        child(*args.child, args.tokens)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.tyc")
+        write_source(path, args.megabytes)
+        print(f"input: {os.path.getsize(path) / 1e6:.1f} MB, lexing up to {args.tokens:,} tokens")
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_input_memory",
+                 "--tokens", str(args.tokens), "--child", mode, path],
+                cwd=project_root, check=True, capture_output=True, text=True,
+            ).stdout.split()
+            print(f"{mode:<12} peak RSS {int(out[0]) / 1024:>8.1f} MB  ({int(out[1]):,} tokens)")
+
+
+if __name__ == "__main__":
+    main()
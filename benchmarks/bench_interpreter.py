@@ -0,0 +1,105 @@
+"""
+CPU-bound TyC programs run by the interpreter.
+
+Usage:
+    python -m benchmarks.bench_interpreter [--scale N] [--programs NAME ...]
+
+Each program is parsed and type-checked once, then compiled and run with
+output discarded. "compile" is the closure compilation alone; "run" is a
+whole execution. --scale multiplies every program's workload.
+"""
+
+import argparse
+import gc
+import io
+
+from benchmarks.common import best_of
+from src.astgen.ast_generation import generate_ast
+from src.runtime.interpreter import Console, Interpreter, interpret
+from src.semantics.type_inference import infer_types
+
+PROGRAMS = {
+    "loops": """
+        void main() {
+            int total = 0;
+            for (int i = 0; i < {n}; i++) {
+                for (int j = 0; j < 100; ++j) {
+                    if ((i + j) % 3 == 0) total = total + j; else total = total - 1;
+                }
+            }
+            printInt(total);
+        }
+    """,
+    "factorial": """
+        int factorial(int n) { if (n <= 1) return 1; return n * factorial(n - 1) % 1000003; }
+        void main() {
+            auto total = 0;
+            for (auto i = 0; i < {n}; ++i) total = (total + factorial(i)) % 1000003;
+            printInt(total);
+        }
+    """,
+    "fib": """
+        int fib(int n) { if (n < 2) return n; return fib(n - 1) + fib(n - 2); }
+        void main() { printInt(fib({n})); }
+    """,
+    "structs": """
+        struct Vec { float x; float y; };
+        struct Body { Vec pos; Vec vel; int steps; };
+        Vec add(Vec a, Vec b) { return {a.x + b.x, a.y + b.y}; }
+        Vec scale(Vec v, float k) { return {v.x * k, v.y * k}; }
+        void main() {
+            Body b = {{0.0, 0.0}, {1.0, 0.5}, 0};
+            Vec gravity = {0.0, -0.01};
+            while (b.steps < {n}) {
+                b.vel = add(b.vel, gravity);
+                b.pos = add(b.pos, scale(b.vel, 0.1));
+                if (b.pos.y < 0.0) b.vel.y = -b.vel.y;
+                b.steps++;
+            }
+            printFloat(b.pos.x); printFloat(b.pos.y);
+        }
+    """,
+    "switch": """
+        void main() {
+            int counts = 0;
+            for (int i = 0; i < {n}; ++i) {
+                switch (i % 8) {
+                    case 0: counts = counts + 1;
+                    case 1: case 2: counts = counts + 2; break;
+                    case 3: counts = counts - 1; break;
+                    case 4+1: continue;
+                    default: counts = counts * 1;
+                }
+            }
+            printInt(counts);
+        }
+    """,
+}
+
+WORKLOADS = {"loops": 2000, "factorial": 600, "fib": 22, "structs": 50000, "switch": 200000}
+
+
+def source_for(name: str, scale: int) -> str:
+    n = WORKLOADS[name]
+    # fib grows exponentially, so scale its argument by steps of one
+    n = n + scale - 1 if name == "fib" else n * scale
+    return PROGRAMS[name].replace("{n}", str(n))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--scale", type=int, default=1)
+    arg_parser.add_argument("--programs", nargs="+", choices=list(PROGRAMS), default=list(PROGRAMS))
+    args = arg_parser.parse_args()
+
+    for name in args.programs:
+        program = infer_types(generate_ast(source_for(name, args.scale)))
+        gc.collect()
+        gc.freeze()
+        compile_time = best_of(lambda: Interpreter(Console(io.StringIO(), io.StringIO())).visit(program))
+        run_time = best_of(lambda: interpret(program, io.StringIO(), io.StringIO()), 3)
+        print(f"{name:<10} compile {compile_time * 1000:>6.2f} ms  run {run_time * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Tokenization throughput: generated TyCLexer against the regex FastLexer.
+
+Usage:
+    python -m benchmarks.bench_lexer [--functions N] [--statements N]
+"""
+
+import argparse
+
+from benchmarks.common import best_of, expression_heavy_source
+from antlr4 import InputStream
+from build.TyCLexer import TyCLexer
+from src.utils.fast_lexer import FastLexer
+
+
+def drain(lexer) -> int:
+    count = 0
+    while lexer.nextToken().type != -1:
+        count += 1
+    return count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--functions", type=int, default=200)
+    arg_parser.add_argument("--statements", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    source = expression_heavy_source(args.functions, args.statements)
+    tokens = drain(FastLexer(source))
+    print(f"input: {len(source) / 1e6:.2f} MB, {tokens:,} tokens")
+
+    results = {}
+    for label, make in (
+        ("TyCLexer", lambda: TyCLexer(InputStream(source))),
+        ("FastLexer", lambda: FastLexer(source)),
+    ):
+        seconds = best_of(lambda: drain(make()), repeat=3)
+        results[label] = seconds
+        print(f"{label:<10} {seconds * 1000:>9.1f} ms  {tokens / seconds:>12,.0f} tokens/s")
+    print(f"speedup: {results['TyCLexer'] / results['FastLexer']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
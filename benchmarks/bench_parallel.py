@@ -0,0 +1,37 @@
+"""
+Sequential generate_ast() against parse_parallel() on a large file.
+
+Usage:
+    python -m benchmarks.bench_parallel [--functions N] [--workers N]
+
+The pool is created (and warmed up) once, outside the timed runs. Speedup
+is bounded by the number of CPUs; on a single CPU the parallel path only
+adds the cost of shipping chunks between processes.
+"""
+
+import argparse
+import os
+
+from benchmarks.common import best_of, expression_heavy_source
+from src.astgen.ast_generation import generate_ast
+from src.astgen.parallel import make_executor, parse_parallel
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--functions", type=int, default=200)
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = arg_parser.parse_args()
+
+    source = expression_heavy_source(args.functions, 20)
+    print(f"source: {len(source) / 1e3:.0f} KB, {args.workers} workers, {os.cpu_count()} CPUs")
+    with make_executor(args.workers) as executor:
+        assert str(parse_parallel(source, args.workers, executor)) == str(generate_ast(source))
+        sequential = best_of(lambda: generate_ast(source), repeat=3)
+        parallel = best_of(lambda: parse_parallel(source, args.workers, executor), repeat=3)
+    print(f"sequential {sequential * 1000:>9.1f} ms")
+    print(f"parallel   {parallel * 1000:>9.1f} ms  ({sequential / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Cold and warm runs of ParseCache.generate() over a batch of distinct sources.
+
+Usage:
+    python -m benchmarks.bench_parse_cache [--files N] [--functions N]
+"""
+
+import argparse
+import tempfile
+import time
+
+from benchmarks.common import expression_heavy_source
+from src.astgen.parse_cache import ParseCache
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--files", type=int, default=50)
+    arg_parser.add_argument("--functions", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    base = expression_heavy_source(args.functions, 20)
+    sources = [f"{base}\nint unique{i}() {{ return {i}; }}" for i in range(args.files)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(tmp)
+        results = {}
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            for source in sources:
+                cache.generate(source)
+            results[label] = time.perf_counter() - start
+            print(f"{label:<5} {results[label] * 1000:>9.1f} ms  "
+                  f"{results[label] / args.files * 1000:>7.2f} ms/file")
+        print(f"hits: {cache.hits}  misses: {cache.misses}  "
+              f"speedup: {results['cold'] / results['warm']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
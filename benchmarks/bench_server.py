@@ -0,0 +1,77 @@
+"""
+Latency of compiling one small file: cold process vs the compile server.
+
+Usage:
+    python -m benchmarks.bench_server [--repeat N]
+
+"cold" starts a Python process that imports ANTLR and generates the AST,
+as a one-shot compile would. "client" starts a process running the
+stdlib-only client against a warmed server, and "round trip" is a single
+request on an open connection.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import best_of, build_dir, expression_heavy_source, project_root
+from src.astgen.client import Client
+
+COLD = (
+    "import sys; sys.path[:0] = [{root!r}, {build!r}]\n"
+    "from src.astgen.ast_generation import generate_ast\n"
+    "generate_ast(open(sys.argv[1]).read())\n"
+)
+
+
+def start_server(path):
+    server = subprocess.Popen(
+        [sys.executable, "run.py", "serve", "--socket", path], cwd=project_root, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with Client(path) as client:
+                client.request("ping")
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("compile server did not start")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "main.tyc")
+        with open(source_path, "w", encoding="utf-8") as f:
+            f.write(expression_heavy_source(3, 5))
+        socket_path = os.path.join(tmp, "tyc.sock")
+        server = start_server(socket_path)
+        try:
+            cold_script = COLD.format(root=project_root, build=build_dir)
+            cold = best_of(lambda: subprocess.run([sys.executable, "-c", cold_script, source_path], check=True), args.repeat)
+            client_cmd = [sys.executable, "-m", "src.astgen.client", "compile", source_path, "--socket", socket_path]
+            client = best_of(
+                lambda: subprocess.run(client_cmd, cwd=project_root, check=True, stdout=subprocess.DEVNULL), args.repeat
+            )
+            with open(source_path, encoding="utf-8") as f:
+                source = f.read()
+            with Client(socket_path) as connection:
+                round_trip = best_of(lambda: connection.compile(source), args.repeat)
+                connection.request("shutdown")
+        finally:
+            server.wait(10)
+    print(f"cold process   {cold * 1000:>9.1f} ms")
+    print(f"client process {client * 1000:>9.1f} ms  ({cold / client:.1f}x)")
+    print(f"round trip     {round_trip * 1000:>9.1f} ms  ({cold / round_trip:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
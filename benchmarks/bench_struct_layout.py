@@ -0,0 +1,73 @@
+"""
+Member lookup: linear search of StructDecl.members vs struct layouts.
+
+Usage:
+    python -m benchmarks.bench_struct_layout [--members N ...]
+
+For a struct with N members, every member is looked up by name once per
+round. A linear search walks StructDecl.members comparing names, the
+layout does one dict access, and a MemberAccess whose slot is already
+annotated indexes a flat list of values directly. The last column times
+type inference on a program that reads every member.
+"""
+
+import argparse
+import gc
+
+from benchmarks.common import best_of
+from src.astgen.ast_generation import generate_ast
+from src.semantics.struct_layout import build_layouts
+from src.semantics.type_inference import infer_types
+
+
+def struct_source(n: int) -> str:
+    members = " ".join(f"int m{i};" for i in range(n))
+    reads = " ".join(f"total = total + s.m{i};" for i in range(n))
+    return f"struct S {{ {members} }}; void main() {{ S s; int total = 0; {reads} printInt(total); }}"
+
+
+def linear(decl, names):
+    found = 0
+    for name in names:
+        for index, member in enumerate(decl.members):
+            if member.name == name:
+                found += index
+                break
+    return found
+
+
+def by_layout(layout, names):
+    index = layout.index
+    return sum(index[name][0] for name in names)
+
+
+def by_slot(values, slots):
+    return sum(values[slot] for slot in slots)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--members", type=int, nargs="+", default=[4, 32, 256, 2048])
+    args = arg_parser.parse_args()
+
+    for n in args.members:
+        program = generate_ast(struct_source(n))
+        decl = program.decls[0]
+        layout = build_layouts(program)["S"]
+        names = [f"m{i}" for i in range(n)]
+        slots = [layout.slot(name) for name in names]
+        values = list(range(n))
+        gc.collect()
+        gc.freeze()
+        search = best_of(lambda: linear(decl, names)) / n
+        lookup = best_of(lambda: by_layout(layout, names)) / n
+        indexed = best_of(lambda: by_slot(values, slots)) / n
+        inference = best_of(lambda: infer_types(program), 3)
+        print(
+            f"{n:>5} members  linear {search * 1e9:>8.0f} ns  layout {lookup * 1e9:>4.0f} ns"
+            f"  slot {indexed * 1e9:>4.0f} ns  inference {inference * 1000:>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
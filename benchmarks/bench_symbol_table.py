@@ -0,0 +1,98 @@
+"""
+Name lookup cost: flat symbol table with undo log vs a list of scope dicts.
+
+Usage:
+    python -m benchmarks.bench_symbol_table [--locals N] [--depth N]
+
+The workload is a function with N locals declared across nested blocks
+D levels deep, where every innermost statement reads names declared at
+the outermost level. A list of dicts searched innermost-first pays for
+every level it has to skip; SymbolTable does one dict lookup. The last
+line times NameResolver over the same program as TyC source.
+"""
+
+import argparse
+import gc
+
+from benchmarks.common import best_of
+from src.astgen.ast_generation import generate_ast
+from src.semantics.symbol_table import Symbol, SymbolTable, resolve_names
+
+
+class ScopeChain:
+    """The list-of-dicts scope chain SymbolTable replaces."""
+
+    def __init__(self):
+        self.scopes = []
+
+    def push(self):
+        self.scopes.append({})
+
+    def pop(self):
+        self.scopes.pop()
+
+    def declare(self, symbol):
+        self.scopes[-1][symbol.name] = symbol
+
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            symbol = scope.get(name)
+            if symbol is not None:
+                return symbol
+        return None
+
+
+def workload(table, locals_: int, depth: int) -> int:
+    """Declare locals_ names spread over depth nested scopes, reading the
+    outermost names from the innermost scope after each declaration."""
+    per_level = max(1, locals_ // depth)
+    found = 0
+    table.push()
+    outer = [f"g{i}" for i in range(8)]
+    for i, name in enumerate(outer):
+        table.declare(Symbol(i, name, "Variable", None))
+    for level in range(depth):
+        table.push()
+        for i in range(per_level):
+            table.declare(Symbol(i, f"v{level}_{i}", "Variable", None))
+            for name in outer:
+                found += table.lookup(name) is not None
+    for _ in range(depth + 1):
+        table.pop()
+    return found
+
+
+def tyc_source(locals_: int, depth: int) -> str:
+    per_level = max(1, locals_ // depth)
+    lines = ["void main() {", "int g0 = 0; int g1 = 1;"]
+    for level in range(depth):
+        lines.append("{")
+        for i in range(per_level):
+            lines.append(f"int v{level}_{i} = g0 + g1;")
+    lines.append("}" * depth)
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--locals", type=int, default=4000)
+    arg_parser.add_argument("--depth", type=int, default=64)
+    args = arg_parser.parse_args()
+
+    lookups = (args.locals // args.depth) * args.depth * 8
+    chain = best_of(lambda: workload(ScopeChain(), args.locals, args.depth))
+    flat = best_of(lambda: workload(SymbolTable(), args.locals, args.depth))
+    print(f"{args.locals} locals, depth {args.depth}, {lookups} lookups")
+    print(f"list of dicts  {chain * 1000:>8.1f} ms  {chain / lookups * 1e9:>6.0f} ns/lookup")
+    print(f"SymbolTable    {flat * 1000:>8.1f} ms  {flat / lookups * 1e9:>6.0f} ns/lookup  ({chain / flat:.1f}x)")
+
+    program = generate_ast(tyc_source(args.locals, args.depth))
+    gc.collect()
+    gc.freeze()
+    resolve = best_of(lambda: resolve_names(program), 3)
+    print(f"NameResolver   {resolve * 1000:>8.1f} ms  for {args.locals} locals in one function")
+
+
+if __name__ == "__main__":
+    main()
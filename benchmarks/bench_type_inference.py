@@ -0,0 +1,45 @@
+"""
+Scaling of union-find type inference with function length.
+
+Usage:
+    python -m benchmarks.bench_type_inference [--sizes N ...]
+
+Each function is a chain of auto variables whose type is only known at
+the last statement (auto v1 = v0; ...; v0 = 1.5), the worst case for
+inference that re-scans a function until nothing changes. Time per
+statement should stay flat as the function grows. The tree is moved out
+of the garbage collector's reach first (gc.freeze()), so that collections
+triggered by inference do not re-traverse it.
+"""
+
+import argparse
+import gc
+
+from benchmarks.common import best_of
+from src.astgen.ast_generation import generate_ast
+from src.semantics.type_inference import infer_types
+
+
+def chain_source(n: int) -> str:
+    lines = ["auto v0;"]
+    for i in range(1, n):
+        lines.append(f"auto v{i} = v{i - 1} + v{i // 2};")
+    lines.append("v0 = 1.5;")
+    return "void main() {\n" + "\n".join(lines) + "\n}\n"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000, 32000])
+    args = arg_parser.parse_args()
+
+    for n in args.sizes:
+        program = generate_ast(chain_source(n))
+        gc.collect()
+        gc.freeze()
+        elapsed = best_of(lambda: infer_types(program), 3)
+        print(f"{n:>7} statements  {elapsed * 1000:>9.1f} ms  {elapsed / n * 1e6:>6.2f} us/statement")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Per-node visitor overhead: node.accept() double dispatch against the cached
+(visitor class, node class) handler table.
+
+Usage:
+    python -m benchmarks.bench_visitor_dispatch [--statements N]
+"""
+
+import argparse
+
+from benchmarks.bench_ast_memory import count_nodes, synthetic_program
+from benchmarks.common import best_of
+from src.utils import nodes
+from src.utils.visitor import BaseVisitor
+
+
+class CachedWalk(BaseVisitor):
+    """BaseVisitor traversal, dispatched through the handler cache."""
+
+
+class AcceptWalk(BaseVisitor):
+    """BaseVisitor traversal, dispatched through node.accept()."""
+
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--statements", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    program = synthetic_program(nodes, args.statements)
+    count = count_nodes(nodes, program)
+    print(f"nodes: {count:,}")
+
+    results = {}
+    for label, walker in (("cached", CachedWalk()), ("accept", AcceptWalk())):
+        seconds = best_of(lambda: walker.visit(program), repeat=7)
+        results[label] = seconds
+        print(f"{label:<8} {seconds * 1000:>9.1f} ms  {seconds / count * 1e9:>7.1f} ns/node")
+    print(f"speedup: {results['accept'] / results['cached']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
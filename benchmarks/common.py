@@ -0,0 +1,40 @@
+"""
+Shared helpers for TyC benchmarks.
+Sets up the import path the same way tests/utils.py does and provides
+synthetic source generators and a small timing helper.
+"""
+
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+build_dir = os.path.join(project_root, "build")
+sys.path.insert(0, project_root)
+sys.path.insert(0, build_dir)
+
+
+def expression_heavy_source(functions: int = 50, statements: int = 20) -> str:
+    """Generate a program whose functions are mostly arithmetic expressions."""
+    lines = []
+    for f in range(functions):
+        lines.append(f"int f{f}(int a, int b) {{")
+        for s in range(statements):
+            lines.append(
+                f"    auto x{s} = (a + {s}) * b - a / (b + 1) % 7 + -a"
+                f" && a < b || a >= {s} && !(b == a);"
+            )
+        lines.append("    return a + b;")
+        lines.append("}")
+    lines.append("void main() { printInt(f0(1, 2)); }")
+    return "\n".join(lines)
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    """Return the fastest wall-clock time of fn() over repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,278 @@
+# Generated from /root/package/src/grammar/TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,51,388,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,
+        1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,
+        1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,
+        1,7,1,7,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,
+        1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,
+        1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,
+        1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,17,1,17,1,17,
+        1,18,1,18,1,18,1,19,1,19,1,19,1,20,1,20,1,20,1,21,1,21,1,21,1,22,
+        1,22,1,22,1,23,1,23,1,23,1,24,1,24,1,25,1,25,1,26,1,26,1,27,1,27,
+        1,28,1,28,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,34,
+        1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,38,1,38,1,39,1,39,1,40,1,40,
+        1,41,1,41,1,41,5,41,263,8,41,10,41,12,41,266,9,41,3,41,268,8,41,
+        1,42,1,42,3,42,272,8,42,1,42,4,42,275,8,42,11,42,12,42,276,1,43,
+        1,43,1,43,5,43,282,8,43,10,43,12,43,285,9,43,1,43,3,43,288,8,43,
+        1,43,3,43,291,8,43,1,43,1,43,4,43,295,8,43,11,43,12,43,296,1,43,
+        3,43,300,8,43,3,43,302,8,43,1,44,1,44,1,45,1,45,1,45,1,45,5,45,310,
+        8,45,10,45,12,45,313,9,45,1,45,1,45,1,46,1,46,5,46,319,8,46,10,46,
+        12,46,322,9,46,1,47,1,47,1,47,1,47,5,47,328,8,47,10,47,12,47,331,
+        9,47,1,47,1,47,1,47,1,47,1,47,1,48,1,48,1,48,1,48,5,48,342,8,48,
+        10,48,12,48,345,9,48,1,48,1,48,1,49,4,49,350,8,49,11,49,12,49,351,
+        1,49,1,49,1,50,1,50,1,50,1,50,5,50,360,8,50,10,50,12,50,363,9,50,
+        1,50,1,50,1,50,1,51,1,51,1,51,1,51,5,51,372,8,51,10,51,12,51,375,
+        9,51,1,51,3,51,378,8,51,1,51,3,51,381,8,51,1,51,1,51,3,51,385,8,
+        51,1,52,1,52,1,329,0,53,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,
+        19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,
+        41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,
+        63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,0,
+        85,0,87,42,89,43,91,44,93,45,95,46,97,47,99,48,101,49,103,50,105,
+        51,1,0,11,1,0,49,57,1,0,48,57,2,0,69,69,101,101,2,0,43,43,45,45,
+        4,0,10,10,13,13,34,34,92,92,7,0,34,34,92,92,98,98,102,102,110,110,
+        114,114,116,116,3,0,65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,
+        122,2,0,10,10,13,13,3,0,9,10,12,13,32,32,9,0,10,10,13,13,34,34,92,
+        92,98,98,102,102,110,110,114,114,116,116,408,0,1,1,0,0,0,0,3,1,0,
+        0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,
+        0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,
+        0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,
+        0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,
+        0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,
+        0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,
+        0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,
+        0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,87,1,0,0,
+        0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,
+        0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,1,107,1,
+        0,0,0,3,112,1,0,0,0,5,118,1,0,0,0,7,123,1,0,0,0,9,132,1,0,0,0,11,
+        140,1,0,0,0,13,145,1,0,0,0,15,151,1,0,0,0,17,155,1,0,0,0,19,158,
+        1,0,0,0,21,162,1,0,0,0,23,169,1,0,0,0,25,176,1,0,0,0,27,183,1,0,
+        0,0,29,190,1,0,0,0,31,195,1,0,0,0,33,201,1,0,0,0,35,204,1,0,0,0,
+        37,207,1,0,0,0,39,210,1,0,0,0,41,213,1,0,0,0,43,216,1,0,0,0,45,219,
+        1,0,0,0,47,222,1,0,0,0,49,225,1,0,0,0,51,227,1,0,0,0,53,229,1,0,
+        0,0,55,231,1,0,0,0,57,233,1,0,0,0,59,235,1,0,0,0,61,237,1,0,0,0,
+        63,239,1,0,0,0,65,241,1,0,0,0,67,243,1,0,0,0,69,245,1,0,0,0,71,247,
+        1,0,0,0,73,249,1,0,0,0,75,251,1,0,0,0,77,253,1,0,0,0,79,255,1,0,
+        0,0,81,257,1,0,0,0,83,267,1,0,0,0,85,269,1,0,0,0,87,301,1,0,0,0,
+        89,303,1,0,0,0,91,305,1,0,0,0,93,316,1,0,0,0,95,323,1,0,0,0,97,337,
+        1,0,0,0,99,349,1,0,0,0,101,355,1,0,0,0,103,367,1,0,0,0,105,386,1,
+        0,0,0,107,108,5,97,0,0,108,109,5,117,0,0,109,110,5,116,0,0,110,111,
+        5,111,0,0,111,2,1,0,0,0,112,113,5,98,0,0,113,114,5,114,0,0,114,115,
+        5,101,0,0,115,116,5,97,0,0,116,117,5,107,0,0,117,4,1,0,0,0,118,119,
+        5,99,0,0,119,120,5,97,0,0,120,121,5,115,0,0,121,122,5,101,0,0,122,
+        6,1,0,0,0,123,124,5,99,0,0,124,125,5,111,0,0,125,126,5,110,0,0,126,
+        127,5,116,0,0,127,128,5,105,0,0,128,129,5,110,0,0,129,130,5,117,
+        0,0,130,131,5,101,0,0,131,8,1,0,0,0,132,133,5,100,0,0,133,134,5,
+        101,0,0,134,135,5,102,0,0,135,136,5,97,0,0,136,137,5,117,0,0,137,
+        138,5,108,0,0,138,139,5,116,0,0,139,10,1,0,0,0,140,141,5,101,0,0,
+        141,142,5,108,0,0,142,143,5,115,0,0,143,144,5,101,0,0,144,12,1,0,
+        0,0,145,146,5,102,0,0,146,147,5,108,0,0,147,148,5,111,0,0,148,149,
+        5,97,0,0,149,150,5,116,0,0,150,14,1,0,0,0,151,152,5,102,0,0,152,
+        153,5,111,0,0,153,154,5,114,0,0,154,16,1,0,0,0,155,156,5,105,0,0,
+        156,157,5,102,0,0,157,18,1,0,0,0,158,159,5,105,0,0,159,160,5,110,
+        0,0,160,161,5,116,0,0,161,20,1,0,0,0,162,163,5,114,0,0,163,164,5,
+        101,0,0,164,165,5,116,0,0,165,166,5,117,0,0,166,167,5,114,0,0,167,
+        168,5,110,0,0,168,22,1,0,0,0,169,170,5,115,0,0,170,171,5,116,0,0,
+        171,172,5,114,0,0,172,173,5,105,0,0,173,174,5,110,0,0,174,175,5,
+        103,0,0,175,24,1,0,0,0,176,177,5,115,0,0,177,178,5,116,0,0,178,179,
+        5,114,0,0,179,180,5,117,0,0,180,181,5,99,0,0,181,182,5,116,0,0,182,
+        26,1,0,0,0,183,184,5,115,0,0,184,185,5,119,0,0,185,186,5,105,0,0,
+        186,187,5,116,0,0,187,188,5,99,0,0,188,189,5,104,0,0,189,28,1,0,
+        0,0,190,191,5,118,0,0,191,192,5,111,0,0,192,193,5,105,0,0,193,194,
+        5,100,0,0,194,30,1,0,0,0,195,196,5,119,0,0,196,197,5,104,0,0,197,
+        198,5,105,0,0,198,199,5,108,0,0,199,200,5,101,0,0,200,32,1,0,0,0,
+        201,202,5,61,0,0,202,203,5,61,0,0,203,34,1,0,0,0,204,205,5,33,0,
+        0,205,206,5,61,0,0,206,36,1,0,0,0,207,208,5,60,0,0,208,209,5,61,
+        0,0,209,38,1,0,0,0,210,211,5,62,0,0,211,212,5,61,0,0,212,40,1,0,
+        0,0,213,214,5,124,0,0,214,215,5,124,0,0,215,42,1,0,0,0,216,217,5,
+        38,0,0,217,218,5,38,0,0,218,44,1,0,0,0,219,220,5,43,0,0,220,221,
+        5,43,0,0,221,46,1,0,0,0,222,223,5,45,0,0,223,224,5,45,0,0,224,48,
+        1,0,0,0,225,226,5,43,0,0,226,50,1,0,0,0,227,228,5,45,0,0,228,52,
+        1,0,0,0,229,230,5,42,0,0,230,54,1,0,0,0,231,232,5,47,0,0,232,56,
+        1,0,0,0,233,234,5,37,0,0,234,58,1,0,0,0,235,236,5,60,0,0,236,60,
+        1,0,0,0,237,238,5,62,0,0,238,62,1,0,0,0,239,240,5,33,0,0,240,64,
+        1,0,0,0,241,242,5,61,0,0,242,66,1,0,0,0,243,244,5,46,0,0,244,68,
+        1,0,0,0,245,246,5,123,0,0,246,70,1,0,0,0,247,248,5,125,0,0,248,72,
+        1,0,0,0,249,250,5,40,0,0,250,74,1,0,0,0,251,252,5,41,0,0,252,76,
+        1,0,0,0,253,254,5,59,0,0,254,78,1,0,0,0,255,256,5,44,0,0,256,80,
+        1,0,0,0,257,258,5,58,0,0,258,82,1,0,0,0,259,268,5,48,0,0,260,264,
+        7,0,0,0,261,263,7,1,0,0,262,261,1,0,0,0,263,266,1,0,0,0,264,262,
+        1,0,0,0,264,265,1,0,0,0,265,268,1,0,0,0,266,264,1,0,0,0,267,259,
+        1,0,0,0,267,260,1,0,0,0,268,84,1,0,0,0,269,271,7,2,0,0,270,272,7,
+        3,0,0,271,270,1,0,0,0,271,272,1,0,0,0,272,274,1,0,0,0,273,275,7,
+        1,0,0,274,273,1,0,0,0,275,276,1,0,0,0,276,274,1,0,0,0,276,277,1,
+        0,0,0,277,86,1,0,0,0,278,290,3,83,41,0,279,283,5,46,0,0,280,282,
+        7,1,0,0,281,280,1,0,0,0,282,285,1,0,0,0,283,281,1,0,0,0,283,284,
+        1,0,0,0,284,287,1,0,0,0,285,283,1,0,0,0,286,288,3,85,42,0,287,286,
+        1,0,0,0,287,288,1,0,0,0,288,291,1,0,0,0,289,291,3,85,42,0,290,279,
+        1,0,0,0,290,289,1,0,0,0,291,302,1,0,0,0,292,294,5,46,0,0,293,295,
+        7,1,0,0,294,293,1,0,0,0,295,296,1,0,0,0,296,294,1,0,0,0,296,297,
+        1,0,0,0,297,299,1,0,0,0,298,300,3,85,42,0,299,298,1,0,0,0,299,300,
+        1,0,0,0,300,302,1,0,0,0,301,278,1,0,0,0,301,292,1,0,0,0,302,88,1,
+        0,0,0,303,304,3,83,41,0,304,90,1,0,0,0,305,311,5,34,0,0,306,310,
+        8,4,0,0,307,308,5,92,0,0,308,310,7,5,0,0,309,306,1,0,0,0,309,307,
+        1,0,0,0,310,313,1,0,0,0,311,309,1,0,0,0,311,312,1,0,0,0,312,314,
+        1,0,0,0,313,311,1,0,0,0,314,315,5,34,0,0,315,92,1,0,0,0,316,320,
+        7,6,0,0,317,319,7,7,0,0,318,317,1,0,0,0,319,322,1,0,0,0,320,318,
+        1,0,0,0,320,321,1,0,0,0,321,94,1,0,0,0,322,320,1,0,0,0,323,324,5,
+        47,0,0,324,325,5,42,0,0,325,329,1,0,0,0,326,328,9,0,0,0,327,326,
+        1,0,0,0,328,331,1,0,0,0,329,330,1,0,0,0,329,327,1,0,0,0,330,332,
+        1,0,0,0,331,329,1,0,0,0,332,333,5,42,0,0,333,334,5,47,0,0,334,335,
+        1,0,0,0,335,336,6,47,0,0,336,96,1,0,0,0,337,338,5,47,0,0,338,339,
+        5,47,0,0,339,343,1,0,0,0,340,342,8,8,0,0,341,340,1,0,0,0,342,345,
+        1,0,0,0,343,341,1,0,0,0,343,344,1,0,0,0,344,346,1,0,0,0,345,343,
+        1,0,0,0,346,347,6,48,0,0,347,98,1,0,0,0,348,350,7,9,0,0,349,348,
+        1,0,0,0,350,351,1,0,0,0,351,349,1,0,0,0,351,352,1,0,0,0,352,353,
+        1,0,0,0,353,354,6,49,0,0,354,100,1,0,0,0,355,361,5,34,0,0,356,360,
+        8,4,0,0,357,358,5,92,0,0,358,360,7,5,0,0,359,356,1,0,0,0,359,357,
+        1,0,0,0,360,363,1,0,0,0,361,359,1,0,0,0,361,362,1,0,0,0,362,364,
+        1,0,0,0,363,361,1,0,0,0,364,365,5,92,0,0,365,366,8,10,0,0,366,102,
+        1,0,0,0,367,373,5,34,0,0,368,372,8,4,0,0,369,370,5,92,0,0,370,372,
+        7,5,0,0,371,368,1,0,0,0,371,369,1,0,0,0,372,375,1,0,0,0,373,371,
+        1,0,0,0,373,374,1,0,0,0,374,377,1,0,0,0,375,373,1,0,0,0,376,378,
+        5,92,0,0,377,376,1,0,0,0,377,378,1,0,0,0,378,384,1,0,0,0,379,381,
+        5,13,0,0,380,379,1,0,0,0,380,381,1,0,0,0,381,382,1,0,0,0,382,385,
+        5,10,0,0,383,385,5,0,0,1,384,380,1,0,0,0,384,383,1,0,0,0,385,104,
+        1,0,0,0,386,387,9,0,0,0,387,106,1,0,0,0,24,0,264,267,271,276,283,
+        287,290,296,299,301,309,311,320,329,343,351,359,361,371,373,377,
+        380,384,1,6,0,0
+    ]
+
+class TyCLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    AUTO = 1
+    BREAK = 2
+    CASE = 3
+    CONTINUE = 4
+    DEFAULT = 5
+    ELSE = 6
+    FLOAT = 7
+    FOR = 8
+    IF = 9
+    INT = 10
+    RETURN = 11
+    STRING = 12
+    STRUCT = 13
+    SWITCH = 14
+    VOID = 15
+    WHILE = 16
+    EQ = 17
+    NEQ = 18
+    LTE = 19
+    GTE = 20
+    OR = 21
+    AND = 22
+    INC = 23
+    DEC = 24
+    PLUS = 25
+    MINUS = 26
+    MUL = 27
+    DIV = 28
+    MOD = 29
+    LT = 30
+    GT = 31
+    NOT = 32
+    ASSIGN = 33
+    DOT = 34
+    LBRACE = 35
+    RBRACE = 36
+    LPAREN = 37
+    RPAREN = 38
+    SEMI = 39
+    COMMA = 40
+    COLON = 41
+    FLOATLIT = 42
+    INTLIT = 43
+    STRINGLIT = 44
+    ID = 45
+    BLOCK_COMMENT = 46
+    LINE_COMMENT = 47
+    WS = 48
+    ILLEGAL_ESCAPE = 49
+    UNCLOSE_STRING = 50
+    ERROR_CHAR = 51
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'auto'", "'break'", "'case'", "'continue'", "'default'", "'else'", 
+            "'float'", "'for'", "'if'", "'int'", "'return'", "'string'", 
+            "'struct'", "'switch'", "'void'", "'while'", "'=='", "'!='", 
+            "'<='", "'>='", "'||'", "'&&'", "'++'", "'--'", "'+'", "'-'", 
+            "'*'", "'/'", "'%'", "'<'", "'>'", "'!'", "'='", "'.'", "'{'", 
+            "'}'", "'('", "')'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FLOAT", 
+            "FOR", "IF", "INT", "RETURN", "STRING", "STRUCT", "SWITCH", 
+            "VOID", "WHILE", "EQ", "NEQ", "LTE", "GTE", "OR", "AND", "INC", 
+            "DEC", "PLUS", "MINUS", "MUL", "DIV", "MOD", "LT", "GT", "NOT", 
+            "ASSIGN", "DOT", "LBRACE", "RBRACE", "LPAREN", "RPAREN", "SEMI", 
+            "COMMA", "COLON", "FLOATLIT", "INTLIT", "STRINGLIT", "ID", "BLOCK_COMMENT", 
+            "LINE_COMMENT", "WS", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    ruleNames = [ "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", 
+                  "FLOAT", "FOR", "IF", "INT", "RETURN", "STRING", "STRUCT", 
+                  "SWITCH", "VOID", "WHILE", "EQ", "NEQ", "LTE", "GTE", 
+                  "OR", "AND", "INC", "DEC", "PLUS", "MINUS", "MUL", "DIV", 
+                  "MOD", "LT", "GT", "NOT", "ASSIGN", "DOT", "LBRACE", "RBRACE", 
+                  "LPAREN", "RPAREN", "SEMI", "COMMA", "COLON", "Intpart", 
+                  "Snotation", "FLOATLIT", "INTLIT", "STRINGLIT", "ID", 
+                  "BLOCK_COMMENT", "LINE_COMMENT", "WS", "ILLEGAL_ESCAPE", 
+                  "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    grammarFileName = "TyC.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def emit(self):
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            raise UncloseString(result.text[1:]);
+        elif tk == self.ILLEGAL_ESCAPE:
+            result = super().emit();
+            raise IllegalEscape(result.text[1:]);
+        elif tk == self.ERROR_CHAR:
+            result = super().emit();
+            raise ErrorToken(result.text); 
+        elif tk == self.STRINGLIT:
+            result = super().emit();
+            result.text = result.text[1:-1];
+            return result;
+        else:
+            return super().emit();
+
+
@@ -0,0 +1,3027 @@
+# Generated from /root/package/src/grammar/TyC.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,51,371,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,1,0,
+        5,0,68,8,0,10,0,12,0,71,9,0,1,0,1,0,1,1,1,1,3,1,77,8,1,1,2,1,2,1,
+        3,1,3,1,3,1,3,5,3,85,8,3,10,3,12,3,88,9,3,1,3,1,3,1,3,1,4,1,4,1,
+        4,1,4,1,5,1,5,3,5,99,8,5,1,6,3,6,102,8,6,1,6,1,6,1,6,3,6,107,8,6,
+        1,6,1,6,1,6,1,7,1,7,1,7,3,7,115,8,7,1,8,1,8,1,8,1,8,1,8,1,8,5,8,
+        123,8,8,10,8,12,8,126,9,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,
+        9,3,9,138,8,9,1,10,1,10,1,10,1,11,1,11,3,11,145,8,11,1,11,1,11,1,
+        11,3,11,150,8,11,1,11,1,11,1,11,1,11,3,11,156,8,11,3,11,158,8,11,
+        1,12,1,12,5,12,162,8,12,10,12,12,12,165,9,12,1,12,1,12,1,13,1,13,
+        1,13,1,13,1,14,1,14,1,14,5,14,176,8,14,10,14,12,14,179,9,14,1,15,
+        1,15,1,15,1,15,1,15,1,15,1,15,3,15,188,8,15,1,16,1,16,1,16,1,16,
+        1,16,1,16,1,17,1,17,1,17,3,17,199,8,17,1,17,1,17,3,17,203,8,17,1,
+        17,1,17,3,17,207,8,17,1,17,1,17,1,17,1,18,1,18,3,18,214,8,18,1,19,
+        1,19,3,19,218,8,19,1,20,1,20,1,20,1,20,1,20,3,20,225,8,20,1,21,1,
+        21,1,21,1,21,1,21,1,21,5,21,233,8,21,10,21,12,21,236,9,21,1,21,3,
+        21,239,8,21,1,21,5,21,242,8,21,10,21,12,21,245,9,21,1,21,1,21,1,
+        22,1,22,1,22,1,22,5,22,253,8,22,10,22,12,22,256,9,22,1,23,1,23,1,
+        23,5,23,261,8,23,10,23,12,23,264,9,23,1,24,1,24,1,24,1,25,1,25,1,
+        25,1,26,1,26,3,26,274,8,26,1,26,1,26,1,27,1,27,1,27,1,28,1,28,1,
+        28,1,28,1,28,3,28,286,8,28,1,29,1,29,5,29,290,8,29,10,29,12,29,293,
+        9,29,1,29,5,29,296,8,29,10,29,12,29,299,9,29,1,29,1,29,1,29,1,29,
+        5,29,305,8,29,10,29,12,29,308,9,29,3,29,310,8,29,1,29,5,29,313,8,
+        29,10,29,12,29,316,9,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,
+        1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,5,29,336,8,29,
+        10,29,12,29,339,9,29,1,30,1,30,1,30,3,30,344,8,30,1,30,1,30,1,31,
+        1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,3,31,358,8,31,1,31,
+        3,31,361,8,31,1,32,1,32,1,32,5,32,366,8,32,10,32,12,32,369,9,32,
+        1,32,0,1,58,33,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,
+        36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,0,7,3,0,7,7,10,10,12,
+        12,1,0,23,24,2,0,25,26,32,32,1,0,27,29,1,0,25,26,2,0,19,20,30,31,
+        1,0,17,18,394,0,69,1,0,0,0,2,76,1,0,0,0,4,78,1,0,0,0,6,80,1,0,0,
+        0,8,92,1,0,0,0,10,98,1,0,0,0,12,101,1,0,0,0,14,114,1,0,0,0,16,116,
+        1,0,0,0,18,137,1,0,0,0,20,139,1,0,0,0,22,157,1,0,0,0,24,159,1,0,
+        0,0,26,168,1,0,0,0,28,172,1,0,0,0,30,180,1,0,0,0,32,189,1,0,0,0,
+        34,195,1,0,0,0,36,213,1,0,0,0,38,217,1,0,0,0,40,224,1,0,0,0,42,226,
+        1,0,0,0,44,248,1,0,0,0,46,257,1,0,0,0,48,265,1,0,0,0,50,268,1,0,
+        0,0,52,271,1,0,0,0,54,277,1,0,0,0,56,285,1,0,0,0,58,287,1,0,0,0,
+        60,340,1,0,0,0,62,360,1,0,0,0,64,362,1,0,0,0,66,68,3,2,1,0,67,66,
+        1,0,0,0,68,71,1,0,0,0,69,67,1,0,0,0,69,70,1,0,0,0,70,72,1,0,0,0,
+        71,69,1,0,0,0,72,73,5,0,0,1,73,1,1,0,0,0,74,77,3,6,3,0,75,77,3,12,
+        6,0,76,74,1,0,0,0,76,75,1,0,0,0,77,3,1,0,0,0,78,79,7,0,0,0,79,5,
+        1,0,0,0,80,81,5,13,0,0,81,82,5,45,0,0,82,86,5,35,0,0,83,85,3,8,4,
+        0,84,83,1,0,0,0,85,88,1,0,0,0,86,84,1,0,0,0,86,87,1,0,0,0,87,89,
+        1,0,0,0,88,86,1,0,0,0,89,90,5,36,0,0,90,91,5,39,0,0,91,7,1,0,0,0,
+        92,93,3,10,5,0,93,94,5,45,0,0,94,95,5,39,0,0,95,9,1,0,0,0,96,99,
+        3,4,2,0,97,99,5,45,0,0,98,96,1,0,0,0,98,97,1,0,0,0,99,11,1,0,0,0,
+        100,102,3,14,7,0,101,100,1,0,0,0,101,102,1,0,0,0,102,103,1,0,0,0,
+        103,104,5,45,0,0,104,106,5,37,0,0,105,107,3,16,8,0,106,105,1,0,0,
+        0,106,107,1,0,0,0,107,108,1,0,0,0,108,109,5,38,0,0,109,110,3,24,
+        12,0,110,13,1,0,0,0,111,115,3,4,2,0,112,115,5,15,0,0,113,115,5,45,
+        0,0,114,111,1,0,0,0,114,112,1,0,0,0,114,113,1,0,0,0,115,15,1,0,0,
+        0,116,117,3,10,5,0,117,124,5,45,0,0,118,119,5,40,0,0,119,120,3,10,
+        5,0,120,121,5,45,0,0,121,123,1,0,0,0,122,118,1,0,0,0,123,126,1,0,
+        0,0,124,122,1,0,0,0,124,125,1,0,0,0,125,17,1,0,0,0,126,124,1,0,0,
+        0,127,138,3,20,10,0,128,138,3,24,12,0,129,138,3,30,15,0,130,138,
+        3,32,16,0,131,138,3,34,17,0,132,138,3,42,21,0,133,138,3,48,24,0,
+        134,138,3,50,25,0,135,138,3,52,26,0,136,138,3,54,27,0,137,127,1,
+        0,0,0,137,128,1,0,0,0,137,129,1,0,0,0,137,130,1,0,0,0,137,131,1,
+        0,0,0,137,132,1,0,0,0,137,133,1,0,0,0,137,134,1,0,0,0,137,135,1,
+        0,0,0,137,136,1,0,0,0,138,19,1,0,0,0,139,140,3,22,11,0,140,141,5,
+        39,0,0,141,21,1,0,0,0,142,145,5,1,0,0,143,145,3,4,2,0,144,142,1,
+        0,0,0,144,143,1,0,0,0,145,146,1,0,0,0,146,149,5,45,0,0,147,148,5,
+        33,0,0,148,150,3,56,28,0,149,147,1,0,0,0,149,150,1,0,0,0,150,158,
+        1,0,0,0,151,152,5,45,0,0,152,155,5,45,0,0,153,154,5,33,0,0,154,156,
+        3,56,28,0,155,153,1,0,0,0,155,156,1,0,0,0,156,158,1,0,0,0,157,144,
+        1,0,0,0,157,151,1,0,0,0,158,23,1,0,0,0,159,163,5,35,0,0,160,162,
+        3,18,9,0,161,160,1,0,0,0,162,165,1,0,0,0,163,161,1,0,0,0,163,164,
+        1,0,0,0,164,166,1,0,0,0,165,163,1,0,0,0,166,167,5,36,0,0,167,25,
+        1,0,0,0,168,169,3,28,14,0,169,170,5,33,0,0,170,171,3,56,28,0,171,
+        27,1,0,0,0,172,177,5,45,0,0,173,174,5,34,0,0,174,176,5,45,0,0,175,
+        173,1,0,0,0,176,179,1,0,0,0,177,175,1,0,0,0,177,178,1,0,0,0,178,
+        29,1,0,0,0,179,177,1,0,0,0,180,181,5,9,0,0,181,182,5,37,0,0,182,
+        183,3,56,28,0,183,184,5,38,0,0,184,187,3,18,9,0,185,186,5,6,0,0,
+        186,188,3,18,9,0,187,185,1,0,0,0,187,188,1,0,0,0,188,31,1,0,0,0,
+        189,190,5,16,0,0,190,191,5,37,0,0,191,192,3,56,28,0,192,193,5,38,
+        0,0,193,194,3,18,9,0,194,33,1,0,0,0,195,196,5,8,0,0,196,198,5,37,
+        0,0,197,199,3,36,18,0,198,197,1,0,0,0,198,199,1,0,0,0,199,200,1,
+        0,0,0,200,202,5,39,0,0,201,203,3,56,28,0,202,201,1,0,0,0,202,203,
+        1,0,0,0,203,204,1,0,0,0,204,206,5,39,0,0,205,207,3,38,19,0,206,205,
+        1,0,0,0,206,207,1,0,0,0,207,208,1,0,0,0,208,209,5,38,0,0,209,210,
+        3,18,9,0,210,35,1,0,0,0,211,214,3,22,11,0,212,214,3,26,13,0,213,
+        211,1,0,0,0,213,212,1,0,0,0,214,37,1,0,0,0,215,218,3,26,13,0,216,
+        218,3,40,20,0,217,215,1,0,0,0,217,216,1,0,0,0,218,39,1,0,0,0,219,
+        220,7,1,0,0,220,225,3,28,14,0,221,222,3,28,14,0,222,223,7,1,0,0,
+        223,225,1,0,0,0,224,219,1,0,0,0,224,221,1,0,0,0,225,41,1,0,0,0,226,
+        227,5,14,0,0,227,228,5,37,0,0,228,229,3,56,28,0,229,230,5,38,0,0,
+        230,234,5,35,0,0,231,233,3,44,22,0,232,231,1,0,0,0,233,236,1,0,0,
+        0,234,232,1,0,0,0,234,235,1,0,0,0,235,238,1,0,0,0,236,234,1,0,0,
+        0,237,239,3,46,23,0,238,237,1,0,0,0,238,239,1,0,0,0,239,243,1,0,
+        0,0,240,242,3,44,22,0,241,240,1,0,0,0,242,245,1,0,0,0,243,241,1,
+        0,0,0,243,244,1,0,0,0,244,246,1,0,0,0,245,243,1,0,0,0,246,247,5,
+        36,0,0,247,43,1,0,0,0,248,249,5,3,0,0,249,250,3,56,28,0,250,254,
+        5,41,0,0,251,253,3,18,9,0,252,251,1,0,0,0,253,256,1,0,0,0,254,252,
+        1,0,0,0,254,255,1,0,0,0,255,45,1,0,0,0,256,254,1,0,0,0,257,258,5,
+        5,0,0,258,262,5,41,0,0,259,261,3,18,9,0,260,259,1,0,0,0,261,264,
+        1,0,0,0,262,260,1,0,0,0,262,263,1,0,0,0,263,47,1,0,0,0,264,262,1,
+        0,0,0,265,266,5,2,0,0,266,267,5,39,0,0,267,49,1,0,0,0,268,269,5,
+        4,0,0,269,270,5,39,0,0,270,51,1,0,0,0,271,273,5,11,0,0,272,274,3,
+        56,28,0,273,272,1,0,0,0,273,274,1,0,0,0,274,275,1,0,0,0,275,276,
+        5,39,0,0,276,53,1,0,0,0,277,278,3,56,28,0,278,279,5,39,0,0,279,55,
+        1,0,0,0,280,281,3,28,14,0,281,282,5,33,0,0,282,283,3,56,28,0,283,
+        286,1,0,0,0,284,286,3,58,29,0,285,280,1,0,0,0,285,284,1,0,0,0,286,
+        57,1,0,0,0,287,291,6,29,-1,0,288,290,7,2,0,0,289,288,1,0,0,0,290,
+        293,1,0,0,0,291,289,1,0,0,0,291,292,1,0,0,0,292,297,1,0,0,0,293,
+        291,1,0,0,0,294,296,7,1,0,0,295,294,1,0,0,0,296,299,1,0,0,0,297,
+        295,1,0,0,0,297,298,1,0,0,0,298,309,1,0,0,0,299,297,1,0,0,0,300,
+        310,3,60,30,0,301,306,3,62,31,0,302,303,5,34,0,0,303,305,5,45,0,
+        0,304,302,1,0,0,0,305,308,1,0,0,0,306,304,1,0,0,0,306,307,1,0,0,
+        0,307,310,1,0,0,0,308,306,1,0,0,0,309,300,1,0,0,0,309,301,1,0,0,
+        0,310,314,1,0,0,0,311,313,7,1,0,0,312,311,1,0,0,0,313,316,1,0,0,
+        0,314,312,1,0,0,0,314,315,1,0,0,0,315,337,1,0,0,0,316,314,1,0,0,
+        0,317,318,10,7,0,0,318,319,7,3,0,0,319,336,3,58,29,8,320,321,10,
+        6,0,0,321,322,7,4,0,0,322,336,3,58,29,7,323,324,10,5,0,0,324,325,
+        7,5,0,0,325,336,3,58,29,6,326,327,10,4,0,0,327,328,7,6,0,0,328,336,
+        3,58,29,5,329,330,10,3,0,0,330,331,5,22,0,0,331,336,3,58,29,4,332,
+        333,10,2,0,0,333,334,5,21,0,0,334,336,3,58,29,3,335,317,1,0,0,0,
+        335,320,1,0,0,0,335,323,1,0,0,0,335,326,1,0,0,0,335,329,1,0,0,0,
+        335,332,1,0,0,0,336,339,1,0,0,0,337,335,1,0,0,0,337,338,1,0,0,0,
+        338,59,1,0,0,0,339,337,1,0,0,0,340,341,5,45,0,0,341,343,5,37,0,0,
+        342,344,3,64,32,0,343,342,1,0,0,0,343,344,1,0,0,0,344,345,1,0,0,
+        0,345,346,5,38,0,0,346,61,1,0,0,0,347,361,5,45,0,0,348,361,5,43,
+        0,0,349,361,5,42,0,0,350,361,5,44,0,0,351,352,5,37,0,0,352,353,3,
+        56,28,0,353,354,5,38,0,0,354,361,1,0,0,0,355,357,5,35,0,0,356,358,
+        3,64,32,0,357,356,1,0,0,0,357,358,1,0,0,0,358,359,1,0,0,0,359,361,
+        5,36,0,0,360,347,1,0,0,0,360,348,1,0,0,0,360,349,1,0,0,0,360,350,
+        1,0,0,0,360,351,1,0,0,0,360,355,1,0,0,0,361,63,1,0,0,0,362,367,3,
+        56,28,0,363,364,5,40,0,0,364,366,3,56,28,0,365,363,1,0,0,0,366,369,
+        1,0,0,0,367,365,1,0,0,0,367,368,1,0,0,0,368,65,1,0,0,0,369,367,1,
+        0,0,0,40,69,76,86,98,101,106,114,124,137,144,149,155,157,163,177,
+        187,198,202,206,213,217,224,234,238,243,254,262,273,285,291,297,
+        306,309,314,335,337,343,357,360,367
+    ]
+
+class TyCParser ( Parser ):
+
+    grammarFileName = "TyC.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'auto'", "'break'", "'case'", "'continue'", 
+                     "'default'", "'else'", "'float'", "'for'", "'if'", 
+                     "'int'", "'return'", "'string'", "'struct'", "'switch'", 
+                     "'void'", "'while'", "'=='", "'!='", "'<='", "'>='", 
+                     "'||'", "'&&'", "'++'", "'--'", "'+'", "'-'", "'*'", 
+                     "'/'", "'%'", "'<'", "'>'", "'!'", "'='", "'.'", "'{'", 
+                     "'}'", "'('", "')'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>", "AUTO", "BREAK", "CASE", "CONTINUE", 
+                      "DEFAULT", "ELSE", "FLOAT", "FOR", "IF", "INT", "RETURN", 
+                      "STRING", "STRUCT", "SWITCH", "VOID", "WHILE", "EQ", 
+                      "NEQ", "LTE", "GTE", "OR", "AND", "INC", "DEC", "PLUS", 
+                      "MINUS", "MUL", "DIV", "MOD", "LT", "GT", "NOT", "ASSIGN", 
+                      "DOT", "LBRACE", "RBRACE", "LPAREN", "RPAREN", "SEMI", 
+                      "COMMA", "COLON", "FLOATLIT", "INTLIT", "STRINGLIT", 
+                      "ID", "BLOCK_COMMENT", "LINE_COMMENT", "WS", "ILLEGAL_ESCAPE", 
+                      "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_declaration = 1
+    RULE_primitiveType = 2
+    RULE_structDecl = 3
+    RULE_memberDecl = 4
+    RULE_paraType = 5
+    RULE_functionDecl = 6
+    RULE_returnType = 7
+    RULE_paraList = 8
+    RULE_stmt = 9
+    RULE_varDeclStmt = 10
+    RULE_varDecl = 11
+    RULE_blockStmt = 12
+    RULE_assignment = 13
+    RULE_lvalue = 14
+    RULE_ifStmt = 15
+    RULE_whileStmt = 16
+    RULE_forStmt = 17
+    RULE_forInit = 18
+    RULE_forUpdate = 19
+    RULE_incDec = 20
+    RULE_switchStmt = 21
+    RULE_caseSwitch = 22
+    RULE_defaultSwitch = 23
+    RULE_breakStmt = 24
+    RULE_continueStmt = 25
+    RULE_returnStmt = 26
+    RULE_exprStmt = 27
+    RULE_expression = 28
+    RULE_expr = 29
+    RULE_call = 30
+    RULE_primary = 31
+    RULE_argList = 32
+
+    ruleNames =  [ "program", "declaration", "primitiveType", "structDecl", 
+                   "memberDecl", "paraType", "functionDecl", "returnType", 
+                   "paraList", "stmt", "varDeclStmt", "varDecl", "blockStmt", 
+                   "assignment", "lvalue", "ifStmt", "whileStmt", "forStmt", 
+                   "forInit", "forUpdate", "incDec", "switchStmt", "caseSwitch", 
+                   "defaultSwitch", "breakStmt", "continueStmt", "returnStmt", 
+                   "exprStmt", "expression", "expr", "call", "primary", 
+                   "argList" ]
+
+    EOF = Token.EOF
+    AUTO=1
+    BREAK=2
+    CASE=3
+    CONTINUE=4
+    DEFAULT=5
+    ELSE=6
+    FLOAT=7
+    FOR=8
+    IF=9
+    INT=10
+    RETURN=11
+    STRING=12
+    STRUCT=13
+    SWITCH=14
+    VOID=15
+    WHILE=16
+    EQ=17
+    NEQ=18
+    LTE=19
+    GTE=20
+    OR=21
+    AND=22
+    INC=23
+    DEC=24
+    PLUS=25
+    MINUS=26
+    MUL=27
+    DIV=28
+    MOD=29
+    LT=30
+    GT=31
+    NOT=32
+    ASSIGN=33
+    DOT=34
+    LBRACE=35
+    RBRACE=36
+    LPAREN=37
+    RPAREN=38
+    SEMI=39
+    COMMA=40
+    COLON=41
+    FLOATLIT=42
+    INTLIT=43
+    STRINGLIT=44
+    ID=45
+    BLOCK_COMMENT=46
+    LINE_COMMENT=47
+    WS=48
+    ILLEGAL_ESCAPE=49
+    UNCLOSE_STRING=50
+    ERROR_CHAR=51
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EOF(self):
+            return self.getToken(TyCParser.EOF, 0)
+
+        def declaration(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.DeclarationContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.DeclarationContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = TyCParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 69
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 35184372135040) != 0):
+                self.state = 66
+                self.declaration()
+                self.state = 71
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 72
+            self.match(TyCParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DeclarationContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def structDecl(self):
+            return self.getTypedRuleContext(TyCParser.StructDeclContext,0)
+
+
+        def functionDecl(self):
+            return self.getTypedRuleContext(TyCParser.FunctionDeclContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_declaration
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDeclaration" ):
+                return visitor.visitDeclaration(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def declaration(self):
+
+        localctx = TyCParser.DeclarationContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_declaration)
+        try:
+            self.state = 76
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [13]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 74
+                self.structDecl()
+                pass
+            elif token in [7, 10, 12, 15, 45]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 75
+                self.functionDecl()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimitiveTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(TyCParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(TyCParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(TyCParser.STRING, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_primitiveType
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimitiveType" ):
+                return visitor.visitPrimitiveType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primitiveType(self):
+
+        localctx = TyCParser.PrimitiveTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_primitiveType)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 78
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 5248) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRUCT(self):
+            return self.getToken(TyCParser.STRUCT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def memberDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.MemberDeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.MemberDeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructDecl" ):
+                return visitor.visitStructDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structDecl(self):
+
+        localctx = TyCParser.StructDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_structDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 80
+            self.match(TyCParser.STRUCT)
+            self.state = 81
+            self.match(TyCParser.ID)
+            self.state = 82
+            self.match(TyCParser.LBRACE)
+            self.state = 86
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 35184372094080) != 0):
+                self.state = 83
+                self.memberDecl()
+                self.state = 88
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 89
+            self.match(TyCParser.RBRACE)
+            self.state = 90
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemberDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def paraType(self):
+            return self.getTypedRuleContext(TyCParser.ParaTypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_memberDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemberDecl" ):
+                return visitor.visitMemberDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def memberDecl(self):
+
+        localctx = TyCParser.MemberDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_memberDecl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 92
+            self.paraType()
+            self.state = 93
+            self.match(TyCParser.ID)
+            self.state = 94
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParaTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primitiveType(self):
+            return self.getTypedRuleContext(TyCParser.PrimitiveTypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_paraType
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParaType" ):
+                return visitor.visitParaType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paraType(self):
+
+        localctx = TyCParser.ParaTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_paraType)
+        try:
+            self.state = 98
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [7, 10, 12]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 96
+                self.primitiveType()
+                pass
+            elif token in [45]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 97
+                self.match(TyCParser.ID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FunctionDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def blockStmt(self):
+            return self.getTypedRuleContext(TyCParser.BlockStmtContext,0)
+
+
+        def returnType(self):
+            return self.getTypedRuleContext(TyCParser.ReturnTypeContext,0)
+
+
+        def paraList(self):
+            return self.getTypedRuleContext(TyCParser.ParaListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_functionDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctionDecl" ):
+                return visitor.visitFunctionDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def functionDecl(self):
+
+        localctx = TyCParser.FunctionDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_functionDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 101
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
+            if la_ == 1:
+                self.state = 100
+                self.returnType()
+
+
+            self.state = 103
+            self.match(TyCParser.ID)
+            self.state = 104
+            self.match(TyCParser.LPAREN)
+            self.state = 106
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 35184372094080) != 0):
+                self.state = 105
+                self.paraList()
+
+
+            self.state = 108
+            self.match(TyCParser.RPAREN)
+            self.state = 109
+            self.blockStmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primitiveType(self):
+            return self.getTypedRuleContext(TyCParser.PrimitiveTypeContext,0)
+
+
+        def VOID(self):
+            return self.getToken(TyCParser.VOID, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnType
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnType" ):
+                return visitor.visitReturnType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnType(self):
+
+        localctx = TyCParser.ReturnTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_returnType)
+        try:
+            self.state = 114
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [7, 10, 12]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 111
+                self.primitiveType()
+                pass
+            elif token in [15]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 112
+                self.match(TyCParser.VOID)
+                pass
+            elif token in [45]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 113
+                self.match(TyCParser.ID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParaListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def paraType(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ParaTypeContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ParaTypeContext,i)
+
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.ID)
+            else:
+                return self.getToken(TyCParser.ID, i)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_paraList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParaList" ):
+                return visitor.visitParaList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paraList(self):
+
+        localctx = TyCParser.ParaListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_paraList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 116
+            self.paraType()
+            self.state = 117
+            self.match(TyCParser.ID)
+            self.state = 124
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==40:
+                self.state = 118
+                self.match(TyCParser.COMMA)
+                self.state = 119
+                self.paraType()
+                self.state = 120
+                self.match(TyCParser.ID)
+                self.state = 126
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDeclStmt(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclStmtContext,0)
+
+
+        def blockStmt(self):
+            return self.getTypedRuleContext(TyCParser.BlockStmtContext,0)
+
+
+        def ifStmt(self):
+            return self.getTypedRuleContext(TyCParser.IfStmtContext,0)
+
+
+        def whileStmt(self):
+            return self.getTypedRuleContext(TyCParser.WhileStmtContext,0)
+
+
+        def forStmt(self):
+            return self.getTypedRuleContext(TyCParser.ForStmtContext,0)
+
+
+        def switchStmt(self):
+            return self.getTypedRuleContext(TyCParser.SwitchStmtContext,0)
+
+
+        def breakStmt(self):
+            return self.getTypedRuleContext(TyCParser.BreakStmtContext,0)
+
+
+        def continueStmt(self):
+            return self.getTypedRuleContext(TyCParser.ContinueStmtContext,0)
+
+
+        def returnStmt(self):
+            return self.getTypedRuleContext(TyCParser.ReturnStmtContext,0)
+
+
+        def exprStmt(self):
+            return self.getTypedRuleContext(TyCParser.ExprStmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_stmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmt" ):
+                return visitor.visitStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmt(self):
+
+        localctx = TyCParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_stmt)
+        try:
+            self.state = 137
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 127
+                self.varDeclStmt()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 128
+                self.blockStmt()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 129
+                self.ifStmt()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 130
+                self.whileStmt()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 131
+                self.forStmt()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 132
+                self.switchStmt()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 133
+                self.breakStmt()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 134
+                self.continueStmt()
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 135
+                self.returnStmt()
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 136
+                self.exprStmt()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDeclStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDeclStmt" ):
+                return visitor.visitVarDeclStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDeclStmt(self):
+
+        localctx = TyCParser.VarDeclStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_varDeclStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 139
+            self.varDecl()
+            self.state = 140
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.ID)
+            else:
+                return self.getToken(TyCParser.ID, i)
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def primitiveType(self):
+            return self.getTypedRuleContext(TyCParser.PrimitiveTypeContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDecl" ):
+                return visitor.visitVarDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDecl(self):
+
+        localctx = TyCParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 157
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [1, 7, 10, 12]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 144
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [1]:
+                    self.state = 142
+                    self.match(TyCParser.AUTO)
+                    pass
+                elif token in [7, 10, 12]:
+                    self.state = 143
+                    self.primitiveType()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 146
+                self.match(TyCParser.ID)
+                self.state = 149
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 147
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 148
+                    self.expression()
+
+
+                pass
+            elif token in [45]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 151
+                self.match(TyCParser.ID)
+                self.state = 152
+                self.match(TyCParser.ID)
+                self.state = 155
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 153
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 154
+                    self.expression()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_blockStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockStmt" ):
+                return visitor.visitBlockStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockStmt(self):
+
+        localctx = TyCParser.BlockStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_blockStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 159
+            self.match(TyCParser.LBRACE)
+            self.state = 163
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917244822) != 0):
+                self.state = 160
+                self.stmt()
+                self.state = 165
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 166
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignmentContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_assignment
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignment" ):
+                return visitor.visitAssignment(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assignment(self):
+
+        localctx = TyCParser.AssignmentContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_assignment)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 168
+            self.lvalue()
+            self.state = 169
+            self.match(TyCParser.ASSIGN)
+            self.state = 170
+            self.expression()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LvalueContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.ID)
+            else:
+                return self.getToken(TyCParser.ID, i)
+
+        def DOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DOT)
+            else:
+                return self.getToken(TyCParser.DOT, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_lvalue
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLvalue" ):
+                return visitor.visitLvalue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lvalue(self):
+
+        localctx = TyCParser.LvalueContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_lvalue)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 172
+            self.match(TyCParser.ID)
+            self.state = 177
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==34:
+                self.state = 173
+                self.match(TyCParser.DOT)
+                self.state = 174
+                self.match(TyCParser.ID)
+                self.state = 179
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(TyCParser.IF, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(TyCParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_ifStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfStmt" ):
+                return visitor.visitIfStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifStmt(self):
+
+        localctx = TyCParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_ifStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 180
+            self.match(TyCParser.IF)
+            self.state = 181
+            self.match(TyCParser.LPAREN)
+            self.state = 182
+            self.expression()
+            self.state = 183
+            self.match(TyCParser.RPAREN)
+            self.state = 184
+            self.stmt()
+            self.state = 187
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
+            if la_ == 1:
+                self.state = 185
+                self.match(TyCParser.ELSE)
+                self.state = 186
+                self.stmt()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class WhileStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def WHILE(self):
+            return self.getToken(TyCParser.WHILE, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_whileStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhileStmt" ):
+                return visitor.visitWhileStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def whileStmt(self):
+
+        localctx = TyCParser.WhileStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_whileStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 189
+            self.match(TyCParser.WHILE)
+            self.state = 190
+            self.match(TyCParser.LPAREN)
+            self.state = 191
+            self.expression()
+            self.state = 192
+            self.match(TyCParser.RPAREN)
+            self.state = 193
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(TyCParser.FOR, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.SEMI)
+            else:
+                return self.getToken(TyCParser.SEMI, i)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def forInit(self):
+            return self.getTypedRuleContext(TyCParser.ForInitContext,0)
+
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def forUpdate(self):
+            return self.getTypedRuleContext(TyCParser.ForUpdateContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForStmt" ):
+                return visitor.visitForStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forStmt(self):
+
+        localctx = TyCParser.ForStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_forStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 195
+            self.match(TyCParser.FOR)
+            self.state = 196
+            self.match(TyCParser.LPAREN)
+            self.state = 198
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 35184372094082) != 0):
+                self.state = 197
+                self.forInit()
+
+
+            self.state = 200
+            self.match(TyCParser.SEMI)
+            self.state = 202
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917154816) != 0):
+                self.state = 201
+                self.expression()
+
+
+            self.state = 204
+            self.match(TyCParser.SEMI)
+            self.state = 206
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 35184397254656) != 0):
+                self.state = 205
+                self.forUpdate()
+
+
+            self.state = 208
+            self.match(TyCParser.RPAREN)
+            self.state = 209
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForInitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def assignment(self):
+            return self.getTypedRuleContext(TyCParser.AssignmentContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forInit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForInit" ):
+                return visitor.visitForInit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forInit(self):
+
+        localctx = TyCParser.ForInitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_forInit)
+        try:
+            self.state = 213
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 211
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 212
+                self.assignment()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForUpdateContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def assignment(self):
+            return self.getTypedRuleContext(TyCParser.AssignmentContext,0)
+
+
+        def incDec(self):
+            return self.getTypedRuleContext(TyCParser.IncDecContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forUpdate
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForUpdate" ):
+                return visitor.visitForUpdate(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forUpdate(self):
+
+        localctx = TyCParser.ForUpdateContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_forUpdate)
+        try:
+            self.state = 217
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 215
+                self.assignment()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 216
+                self.incDec()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IncDecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_incDec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIncDec" ):
+                return visitor.visitIncDec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def incDec(self):
+
+        localctx = TyCParser.IncDecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_incDec)
+        self._la = 0 # Token type
+        try:
+            self.state = 224
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [23, 24]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 219
+                _la = self._input.LA(1)
+                if not(_la==23 or _la==24):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 220
+                self.lvalue()
+                pass
+            elif token in [45]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 221
+                self.lvalue()
+                self.state = 222
+                _la = self._input.LA(1)
+                if not(_la==23 or _la==24):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SWITCH(self):
+            return self.getToken(TyCParser.SWITCH, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def caseSwitch(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CaseSwitchContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CaseSwitchContext,i)
+
+
+        def defaultSwitch(self):
+            return self.getTypedRuleContext(TyCParser.DefaultSwitchContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchStmt" ):
+                return visitor.visitSwitchStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchStmt(self):
+
+        localctx = TyCParser.SwitchStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_switchStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 226
+            self.match(TyCParser.SWITCH)
+            self.state = 227
+            self.match(TyCParser.LPAREN)
+            self.state = 228
+            self.expression()
+            self.state = 229
+            self.match(TyCParser.RPAREN)
+            self.state = 230
+            self.match(TyCParser.LBRACE)
+            self.state = 234
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 231
+                    self.caseSwitch() 
+                self.state = 236
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+
+            self.state = 238
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==5:
+                self.state = 237
+                self.defaultSwitch()
+
+
+            self.state = 243
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==3:
+                self.state = 240
+                self.caseSwitch()
+                self.state = 245
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 246
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CaseSwitchContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CASE(self):
+            return self.getToken(TyCParser.CASE, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_caseSwitch
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCaseSwitch" ):
+                return visitor.visitCaseSwitch(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def caseSwitch(self):
+
+        localctx = TyCParser.CaseSwitchContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_caseSwitch)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 248
+            self.match(TyCParser.CASE)
+            self.state = 249
+            self.expression()
+            self.state = 250
+            self.match(TyCParser.COLON)
+            self.state = 254
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917244822) != 0):
+                self.state = 251
+                self.stmt()
+                self.state = 256
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefaultSwitchContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DEFAULT(self):
+            return self.getToken(TyCParser.DEFAULT, 0)
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_defaultSwitch
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefaultSwitch" ):
+                return visitor.visitDefaultSwitch(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def defaultSwitch(self):
+
+        localctx = TyCParser.DefaultSwitchContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_defaultSwitch)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 257
+            self.match(TyCParser.DEFAULT)
+            self.state = 258
+            self.match(TyCParser.COLON)
+            self.state = 262
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917244822) != 0):
+                self.state = 259
+                self.stmt()
+                self.state = 264
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(TyCParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_breakStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakStmt" ):
+                return visitor.visitBreakStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakStmt(self):
+
+        localctx = TyCParser.BreakStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_breakStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 265
+            self.match(TyCParser.BREAK)
+            self.state = 266
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinueStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CONTINUE(self):
+            return self.getToken(TyCParser.CONTINUE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_continueStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinueStmt" ):
+                return visitor.visitContinueStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continueStmt(self):
+
+        localctx = TyCParser.ContinueStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_continueStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 268
+            self.match(TyCParser.CONTINUE)
+            self.state = 269
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(TyCParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnStmt" ):
+                return visitor.visitReturnStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnStmt(self):
+
+        localctx = TyCParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_returnStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 271
+            self.match(TyCParser.RETURN)
+            self.state = 273
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917154816) != 0):
+                self.state = 272
+                self.expression()
+
+
+            self.state = 275
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_exprStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprStmt" ):
+                return visitor.visitExprStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprStmt(self):
+
+        localctx = TyCParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_exprStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 277
+            self.expression()
+            self.state = 278
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_expression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpression" ):
+                return visitor.visitExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expression(self):
+
+        localctx = TyCParser.ExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_expression)
+        try:
+            self.state = 285
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,28,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 280
+                self.lvalue()
+                self.state = 281
+                self.match(TyCParser.ASSIGN)
+                self.state = 282
+                self.expression()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 284
+                self.expr(0)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class EqExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+        def EQ(self):
+            return self.getToken(TyCParser.EQ, 0)
+        def NEQ(self):
+            return self.getToken(TyCParser.NEQ, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEqExpr" ):
+                return visitor.visitEqExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AddExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAddExpr" ):
+                return visitor.visitAddExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MulExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+        def MUL(self):
+            return self.getToken(TyCParser.MUL, 0)
+        def DIV(self):
+            return self.getToken(TyCParser.DIV, 0)
+        def MOD(self):
+            return self.getToken(TyCParser.MOD, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMulExpr" ):
+                return visitor.visitMulExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class OrExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+        def OR(self):
+            return self.getToken(TyCParser.OR, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrExpr" ):
+                return visitor.visitOrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class OperandExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def call(self):
+            return self.getTypedRuleContext(TyCParser.CallContext,0)
+
+        def primary(self):
+            return self.getTypedRuleContext(TyCParser.PrimaryContext,0)
+
+        def NOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.NOT)
+            else:
+                return self.getToken(TyCParser.NOT, i)
+        def MINUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MINUS)
+            else:
+                return self.getToken(TyCParser.MINUS, i)
+        def PLUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.PLUS)
+            else:
+                return self.getToken(TyCParser.PLUS, i)
+        def INC(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.INC)
+            else:
+                return self.getToken(TyCParser.INC, i)
+        def DEC(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DEC)
+            else:
+                return self.getToken(TyCParser.DEC, i)
+        def DOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DOT)
+            else:
+                return self.getToken(TyCParser.DOT, i)
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.ID)
+            else:
+                return self.getToken(TyCParser.ID, i)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOperandExpr" ):
+                return visitor.visitOperandExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class RelationalExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+        def LT(self):
+            return self.getToken(TyCParser.LT, 0)
+        def LTE(self):
+            return self.getToken(TyCParser.LTE, 0)
+        def GT(self):
+            return self.getToken(TyCParser.GT, 0)
+        def GTE(self):
+            return self.getToken(TyCParser.GTE, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationalExpr" ):
+                return visitor.visitRelationalExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AndExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+        def AND(self):
+            return self.getToken(TyCParser.AND, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAndExpr" ):
+                return visitor.visitAndExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = TyCParser.ExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 58
+        self.enterRecursionRule(localctx, 58, self.RULE_expr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx = TyCParser.OperandExprContext(self, localctx)
+            self._ctx = localctx
+            _prevctx = localctx
+
+            self.state = 291
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4395630592) != 0):
+                self.state = 288
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 4395630592) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 293
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 297
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==23 or _la==24:
+                self.state = 294
+                _la = self._input.LA(1)
+                if not(_la==23 or _la==24):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 299
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 309
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,32,self._ctx)
+            if la_ == 1:
+                self.state = 300
+                self.call()
+                pass
+
+            elif la_ == 2:
+                self.state = 301
+                self.primary()
+                self.state = 306
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,31,self._ctx)
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt==1:
+                        self.state = 302
+                        self.match(TyCParser.DOT)
+                        self.state = 303
+                        self.match(TyCParser.ID) 
+                    self.state = 308
+                    self._errHandler.sync(self)
+                    _alt = self._interp.adaptivePredict(self._input,31,self._ctx)
+
+                pass
+
+
+            self.state = 314
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,33,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 311
+                    _la = self._input.LA(1)
+                    if not(_la==23 or _la==24):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume() 
+                self.state = 316
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,33,self._ctx)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 337
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,35,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 335
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,34,self._ctx)
+                    if la_ == 1:
+                        localctx = TyCParser.MulExprContext(self, TyCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 317
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 318
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 939524096) != 0)):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 319
+                        self.expr(8)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = TyCParser.AddExprContext(self, TyCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 320
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 321
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not(_la==25 or _la==26):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 322
+                        self.expr(7)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = TyCParser.RelationalExprContext(self, TyCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 323
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 324
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3222798336) != 0)):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 325
+                        self.expr(6)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = TyCParser.EqExprContext(self, TyCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 326
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 327
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not(_la==17 or _la==18):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 328
+                        self.expr(5)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = TyCParser.AndExprContext(self, TyCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 329
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 330
+                        localctx.op = self.match(TyCParser.AND)
+                        self.state = 331
+                        self.expr(4)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = TyCParser.OrExprContext(self, TyCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 332
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 333
+                        localctx.op = self.match(TyCParser.OR)
+                        self.state = 334
+                        self.expr(3)
+                        pass
+
+             
+                self.state = 339
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,35,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class CallContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_call
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCall" ):
+                return visitor.visitCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def call(self):
+
+        localctx = TyCParser.CallContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_call)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 340
+            self.match(TyCParser.ID)
+            self.state = 341
+            self.match(TyCParser.LPAREN)
+            self.state = 343
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917154816) != 0):
+                self.state = 342
+                self.argList()
+
+
+            self.state = 345
+            self.match(TyCParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_primary
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class IntLitExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.PrimaryContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def INTLIT(self):
+            return self.getToken(TyCParser.INTLIT, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIntLitExpr" ):
+                return visitor.visitIntLitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StringLitExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.PrimaryContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def STRINGLIT(self):
+            return self.getToken(TyCParser.STRINGLIT, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStringLitExpr" ):
+                return visitor.visitStringLitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class StructLitExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.PrimaryContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructLitExpr" ):
+                return visitor.visitStructLitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class FloatLitExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.PrimaryContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def FLOATLIT(self):
+            return self.getToken(TyCParser.FLOATLIT, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFloatLitExpr" ):
+                return visitor.visitFloatLitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ParenExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.PrimaryContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+        def expression(self):
+            return self.getTypedRuleContext(TyCParser.ExpressionContext,0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParenExpr" ):
+                return visitor.visitParenExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IdExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.PrimaryContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdExpr" ):
+                return visitor.visitIdExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def primary(self):
+
+        localctx = TyCParser.PrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_primary)
+        self._la = 0 # Token type
+        try:
+            self.state = 360
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [45]:
+                localctx = TyCParser.IdExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 347
+                self.match(TyCParser.ID)
+                pass
+            elif token in [43]:
+                localctx = TyCParser.IntLitExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 348
+                self.match(TyCParser.INTLIT)
+                pass
+            elif token in [42]:
+                localctx = TyCParser.FloatLitExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 349
+                self.match(TyCParser.FLOATLIT)
+                pass
+            elif token in [44]:
+                localctx = TyCParser.StringLitExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 350
+                self.match(TyCParser.STRINGLIT)
+                pass
+            elif token in [37]:
+                localctx = TyCParser.ParenExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 351
+                self.match(TyCParser.LPAREN)
+                self.state = 352
+                self.expression()
+                self.state = 353
+                self.match(TyCParser.RPAREN)
+                pass
+            elif token in [35]:
+                localctx = TyCParser.StructLitExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 355
+                self.match(TyCParser.LBRACE)
+                self.state = 357
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 66146917154816) != 0):
+                    self.state = 356
+                    self.argList()
+
+
+                self.state = 359
+                self.match(TyCParser.RBRACE)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArgListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExpressionContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_argList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArgList" ):
+                return visitor.visitArgList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def argList(self):
+
+        localctx = TyCParser.ArgListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_argList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 362
+            self.expression()
+            self.state = 367
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==40:
+                self.state = 363
+                self.match(TyCParser.COMMA)
+                self.state = 364
+                self.expression()
+                self.state = 369
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[29] = self.expr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def expr_sempred(self, localctx:ExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 7)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 4)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 2)
+         
+
+
+
+
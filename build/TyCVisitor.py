@@ -0,0 +1,233 @@
+# Generated from /root/package/src/grammar/TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .TyCParser import TyCParser
+else:
+    from TyCParser import TyCParser
+
+# This class defines a complete generic visitor for a parse tree produced by TyCParser.
+
+class TyCVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by TyCParser#program.
+    def visitProgram(self, ctx:TyCParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#declaration.
+    def visitDeclaration(self, ctx:TyCParser.DeclarationContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#primitiveType.
+    def visitPrimitiveType(self, ctx:TyCParser.PrimitiveTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structDecl.
+    def visitStructDecl(self, ctx:TyCParser.StructDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#memberDecl.
+    def visitMemberDecl(self, ctx:TyCParser.MemberDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#paraType.
+    def visitParaType(self, ctx:TyCParser.ParaTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#functionDecl.
+    def visitFunctionDecl(self, ctx:TyCParser.FunctionDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnType.
+    def visitReturnType(self, ctx:TyCParser.ReturnTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#paraList.
+    def visitParaList(self, ctx:TyCParser.ParaListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#stmt.
+    def visitStmt(self, ctx:TyCParser.StmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDeclStmt.
+    def visitVarDeclStmt(self, ctx:TyCParser.VarDeclStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDecl.
+    def visitVarDecl(self, ctx:TyCParser.VarDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#blockStmt.
+    def visitBlockStmt(self, ctx:TyCParser.BlockStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#assignment.
+    def visitAssignment(self, ctx:TyCParser.AssignmentContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#lvalue.
+    def visitLvalue(self, ctx:TyCParser.LvalueContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ifStmt.
+    def visitIfStmt(self, ctx:TyCParser.IfStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#whileStmt.
+    def visitWhileStmt(self, ctx:TyCParser.WhileStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forStmt.
+    def visitForStmt(self, ctx:TyCParser.ForStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forInit.
+    def visitForInit(self, ctx:TyCParser.ForInitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forUpdate.
+    def visitForUpdate(self, ctx:TyCParser.ForUpdateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#incDec.
+    def visitIncDec(self, ctx:TyCParser.IncDecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchStmt.
+    def visitSwitchStmt(self, ctx:TyCParser.SwitchStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#caseSwitch.
+    def visitCaseSwitch(self, ctx:TyCParser.CaseSwitchContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#defaultSwitch.
+    def visitDefaultSwitch(self, ctx:TyCParser.DefaultSwitchContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#breakStmt.
+    def visitBreakStmt(self, ctx:TyCParser.BreakStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#continueStmt.
+    def visitContinueStmt(self, ctx:TyCParser.ContinueStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnStmt.
+    def visitReturnStmt(self, ctx:TyCParser.ReturnStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#exprStmt.
+    def visitExprStmt(self, ctx:TyCParser.ExprStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#expression.
+    def visitExpression(self, ctx:TyCParser.ExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#eqExpr.
+    def visitEqExpr(self, ctx:TyCParser.EqExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#addExpr.
+    def visitAddExpr(self, ctx:TyCParser.AddExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#mulExpr.
+    def visitMulExpr(self, ctx:TyCParser.MulExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#orExpr.
+    def visitOrExpr(self, ctx:TyCParser.OrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#operandExpr.
+    def visitOperandExpr(self, ctx:TyCParser.OperandExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#relationalExpr.
+    def visitRelationalExpr(self, ctx:TyCParser.RelationalExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#andExpr.
+    def visitAndExpr(self, ctx:TyCParser.AndExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#call.
+    def visitCall(self, ctx:TyCParser.CallContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#idExpr.
+    def visitIdExpr(self, ctx:TyCParser.IdExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#intLitExpr.
+    def visitIntLitExpr(self, ctx:TyCParser.IntLitExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#floatLitExpr.
+    def visitFloatLitExpr(self, ctx:TyCParser.FloatLitExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#stringLitExpr.
+    def visitStringLitExpr(self, ctx:TyCParser.StringLitExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#parenExpr.
+    def visitParenExpr(self, ctx:TyCParser.ParenExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structLitExpr.
+    def visitStructLitExpr(self, ctx:TyCParser.StructLitExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#argList.
+    def visitArgList(self, ctx:TyCParser.ArgListContext):
+        return self.visitChildren(ctx)
+
+
+
+del TyCParser
\ No newline at end of file
@@ -13,6 +13,9 @@ Usage:
     python run.py test-lexer
     python run.py test-parser
     python run.py test-ast
+    python run.py compile "examples/**/*.tyc" --workers 8
+    python run.py serve --socket /tmp/tyc.sock
+    python run.py run program.tyc
     python run.py clean
 
     # On macOS/Linux:
@@ -22,15 +25,20 @@ Usage:
     python3 run.py test-lexer
     python3 run.py test-parser
     python3 run.py test-ast
+    python3 run.py compile "examples/**/*.tyc" --workers 8
+    python3 run.py serve --socket /tmp/tyc.sock
+    python3 run.py run program.tyc
     python3 run.py clean
 """
 
 import argparse
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import time
 import urllib.request
 from pathlib import Path
 
@@ -196,6 +204,33 @@ class TyCBuilder:
             )
         )
         print()
+        print(self.colors.green("Compiling:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py compile PATH... - Generate ASTs for files, directories or globs"
+            )
+        )
+        print(
+            "      --workers N   worker processes (default: CPU count)\n"
+            "      --cache DIR   reuse results from an on-disk parse cache\n"
+            "      --no-ast      report status and timings only"
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py serve          - Run a warmed compile server on a Unix socket"
+            )
+        )
+        print(
+            "      --socket PATH socket path (default: $TYC_SOCKET or a per-user path)\n"
+            "      --cache DIR   reuse results from an on-disk parse cache\n"
+            "      Clients: python3 -m src.astgen.client compile|parse|tokenize FILE..."
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py run FILE       - Type-check and interpret a program"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -493,6 +528,74 @@ class TyCBuilder:
         )
         self.clean_cache()
 
+    def compile_sources(self, patterns, workers=None, cache=None, include_ast=True):
+        """Generate ASTs for many files, printing one JSON line per file."""
+        self._import_paths()
+        from src.astgen.batch import compile_files, expand_paths
+
+        paths = expand_paths(patterns)
+        if not paths:
+            print(self.colors.red("No input files matched."), file=sys.stderr)
+            sys.exit(1)
+
+        start = time.perf_counter()
+        failed = 0
+        for result in compile_files(paths, workers, cache, include_ast):
+            failed += not result["ok"]
+            print(json.dumps(result), flush=True)
+        elapsed = time.perf_counter() - start
+
+        summary = f"Compiled {len(paths)} files in {elapsed:.2f}s, {failed} failed."
+        color = self.colors.red if failed else self.colors.green
+        print(color(summary), file=sys.stderr)
+        if failed:
+            sys.exit(1)
+
+    def _import_paths(self):
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first..."),
+                file=sys.stderr,
+            )
+            self.build_grammar()
+        sys.path.insert(0, str(self.root_dir))
+        sys.path.insert(0, str(self.build_dir))
+
+    def serve(self, socket_path=None, cache=None):
+        """Run the compile server until a client sends shutdown."""
+        self._import_paths()
+        from src.astgen.client import default_socket_path
+        from src.astgen.server import serve
+
+        path = socket_path or default_socket_path()
+        print(self.colors.green(f"TyC compile server listening on {path}"), file=sys.stderr, flush=True)
+        serve(path, cache)
+
+    def run_program(self, paths):
+        """Type-check and run one TyC program on stdin and stdout."""
+        if len(paths) != 1:
+            print(self.colors.red("run takes exactly one source file."), file=sys.stderr)
+            sys.exit(1)
+        self._import_paths()
+        from build.TyCLexer import LexerError
+        from src.astgen.ast_generation import generate_ast
+        from src.runtime.interpreter import interpret
+        from src.runtime.runtime_error import TyCRuntimeError
+        from src.semantics.static_error import StaticError
+        from src.utils.error_listener import SyntaxException
+
+        try:
+            with open(paths[0], encoding="utf-8") as source:
+                text = source.read()
+        except OSError as error:
+            print(self.colors.red(f"Cannot read {paths[0]}: {error.strerror}"), file=sys.stderr)
+            sys.exit(1)
+        try:
+            interpret(generate_ast(text))
+        except (LexerError, SyntaxException, StaticError, TyCRuntimeError) as error:
+            print(self.colors.red(str(error)), file=sys.stderr)
+            sys.exit(1)
+
 
 def main():
     """Main entry point."""
@@ -517,9 +620,19 @@ def main():
             "test-lexer",
             "test-parser",
             "test-ast",
+            "compile",
+            "serve",
+            "run",
         ],
         help="Command to execute",
     )
+    parser.add_argument("paths", nargs="*", help="Files, directories or globs (compile); a source file (run)")
+    parser.add_argument("--workers", type=int, help="Worker processes (compile)")
+    parser.add_argument("--cache", help="Parse cache directory (compile, serve)")
+    parser.add_argument("--socket", help="Server socket path (serve)")
+    parser.add_argument(
+        "--no-ast", dest="ast", action="store_false", help="Omit ASTs from the output (compile)"
+    )
 
     args = parser.parse_args()
 
@@ -537,6 +650,9 @@ def main():
         "test-lexer": builder.test_lexer,
         "test-parser": builder.test_parser,
         "test-ast": builder.test_ast,
+        "compile": lambda: builder.compile_sources(args.paths, args.workers, args.cache, args.ast),
+        "serve": lambda: builder.serve(args.socket, args.cache),
+        "run": lambda: builder.run_program(args.paths),
     }
 
     if args.command in commands:
@@ -0,0 +1,142 @@
+"""
+Asyncio entry points for lexing, parsing and AST generation.
+AsyncCompiler runs the work on a pool of worker processes, so hundreds of
+files can be in flight without blocking the event loop:
+
+    async with AsyncCompiler(max_concurrency=64) as compiler:
+        program = await compiler.generate(source)
+        async for path, result in compiler.generate_files(paths):
+            ...
+
+generate() returns what ASTGenerator.generate() returns: a Program, or the
+"AST Generation Error: ..." string. Workers send ASTs back as AST files
+(see ast_format.py), which are cheaper to pickle than node objects.
+
+At most max_concurrency requests are submitted to the pool at a time; the
+rest wait on the event loop. Cancelling a request that is still waiting
+or queued in the pool drops it; one a worker has already started runs to
+completion and its result is discarded.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
+
+from src.astgen import batch
+from src.astgen.parse_cache import generate_result
+from src.utils import ast_format
+from src.utils.nodes import Program
+
+
+def _generate(source: str, deep: bool) -> Union[bytes, str]:
+    """Worker: an AST file for source, or its error string."""
+    cache = batch._worker_cache
+    outcome = cache.generate(source, deep) if cache is not None else generate_result(source, deep)
+    return outcome if isinstance(outcome, str) else ast_format.dumps(outcome)
+
+
+def _generate_file(path: str, deep: bool) -> Union[bytes, str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return f"{type(e).__name__}: {e}"
+    return _generate(source, deep)
+
+
+def _tokenize(source: str) -> Union[list, str]:
+    """Worker: tokens as the compile server reports them, or the lexer error."""
+    from src.astgen.server import tokenize
+
+    try:
+        return tokenize(source)
+    except Exception as e:
+        return str(e)
+
+
+def _check_syntax(source: str) -> Optional[str]:
+    from src.astgen.server import check_syntax
+
+    try:
+        check_syntax(source)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _result(outcome: Union[bytes, str]) -> Union[Program, str]:
+    return outcome if isinstance(outcome, str) else ast_format.loads(outcome).to_node()
+
+
+class AsyncCompiler:
+    """Awaitable lexing, parsing and AST generation on a process pool.
+
+    With a cache directory, workers share a ParseCache. The pool's workers
+    warm their DFA caches on start-up unless warm is False.
+    """
+
+    def __init__(self, workers: int = None, max_concurrency: int = None, cache_dir=None, warm: bool = True):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.workers * batch.TASKS_PER_WORKER
+        self.executor = ProcessPoolExecutor(self.workers, initializer=batch._init_worker, initargs=(cache_dir, warm))
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def _run(self, fn, *args):
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+            finally:
+                self.in_flight -= 1
+
+    async def generate(self, source: str, deep: bool = False) -> Union[Program, str]:
+        """The Program for source, or its error string."""
+        return _result(await self._run(_generate, source, deep))
+
+    async def generate_file(self, path, deep: bool = False) -> Union[Program, str]:
+        """Like generate(), reading the file in the worker; read errors are
+        returned as strings too."""
+        return _result(await self._run(_generate_file, os.fspath(path), deep))
+
+    async def generate_files(self, paths, deep: bool = False):
+        """Yield (path, result) for each path in completion order.
+
+        Only max_concurrency files are scheduled at a time, so paths may be
+        a long or lazy iterable. Leaving the loop early cancels the rest.
+        """
+        paths = iter(paths)
+        pending = {}
+        try:
+            while True:
+                for path in paths:
+                    pending[asyncio.ensure_future(self.generate_file(path, deep))] = path
+                    if len(pending) >= self.max_concurrency:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def tokenize(self, source: str) -> Union[List[list], str]:
+        """[type name, text, line, column] for every token, or the lexer error."""
+        return await self._run(_tokenize, source)
+
+    async def check_syntax(self, source: str) -> Optional[str]:
+        """None if source parses, otherwise the lexer or syntax error."""
+        return await self._run(_check_syntax, source)
+
+    async def close(self) -> None:
+        """Cancel queued work and wait for the workers to exit."""
+        await asyncio.to_thread(self.executor.shutdown, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -5,12 +5,315 @@ into Abstract Syntax Trees using the visitor pattern.
 """
 
 from functools import reduce
+from antlr4 import CommonTokenStream, InputStream, ParserRuleContext
+from antlr4.tree.Tree import TerminalNode
 from build.TyCVisitor import TyCVisitor
 from build.TyCParser import TyCParser
 from src.utils.nodes import *
+from src.astgen.interning import NameTable, PRIMITIVE_TYPES, VOID_TYPE
+from src.utils.parsing import make_lexer, make_parser, parse_program, run_deep
 
 
 class ASTGeneration(TyCVisitor):
-    """AST Generation visitor for TyC language."""
+    """AST Generation visitor for TyC language.
 
-    pass
+    Primitive type nodes are shared instances from interning.PRIMITIVE_TYPES
+    and every name is interned in self.names, one table per generator.
+    """
+
+    def __init__(self, names: NameTable = None):
+        super().__init__()
+        self.names = NameTable() if names is None else names
+
+    def _name(self, terminal) -> str:
+        """Interned text of an ID terminal."""
+        return self.names.intern(terminal.getText())
+
+    def _at(self, node, ctx):
+        """Stamp node with the line and column where ctx starts."""
+        token = ctx.symbol if isinstance(ctx, TerminalNode) else ctx.start
+        node.line = token.line
+        node.column = token.column
+        return node
+
+    # ======== Program and declarations ========
+
+    def visitProgram(self, ctx: TyCParser.ProgramContext):
+        decls = [self.visit(decl) for decl in ctx.declaration()]
+        return self._at(Program(decls), ctx)
+
+    def visitDeclaration(self, ctx: TyCParser.DeclarationContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitPrimitiveType(self, ctx: TyCParser.PrimitiveTypeContext):
+        return PRIMITIVE_TYPES[ctx.getText()]
+
+    def visitStructDecl(self, ctx: TyCParser.StructDeclContext):
+        members = [self.visit(member) for member in ctx.memberDecl()]
+        return self._at(StructDecl(self._name(ctx.ID()), members), ctx)
+
+    def visitMemberDecl(self, ctx: TyCParser.MemberDeclContext):
+        member_type = self.visit(ctx.paraType())
+        return self._at(MemberDecl(member_type, self._name(ctx.ID())), ctx)
+
+    def visitParaType(self, ctx: TyCParser.ParaTypeContext):
+        if ctx.primitiveType():
+            return self.visit(ctx.primitiveType())
+        return self._at(StructType(self._name(ctx.ID())), ctx)
+
+    def visitFunctionDecl(self, ctx: TyCParser.FunctionDeclContext):
+        return_type = self.visit(ctx.returnType()) if ctx.returnType() else None
+        params = self.visit(ctx.paraList()) if ctx.paraList() else []
+        body = self.visit(ctx.blockStmt())
+        return self._at(FuncDecl(return_type, self._name(ctx.ID()), params, body), ctx)
+
+    def visitReturnType(self, ctx: TyCParser.ReturnTypeContext):
+        if ctx.primitiveType():
+            return self.visit(ctx.primitiveType())
+        if ctx.VOID():
+            return VOID_TYPE
+        return self._at(StructType(self._name(ctx.ID())), ctx)
+
+    def visitParaList(self, ctx: TyCParser.ParaListContext):
+        return [
+            self._at(Param(self.visit(para_type), self._name(name)), para_type)
+            for para_type, name in zip(ctx.paraType(), ctx.ID())
+        ]
+
+    # ======== Statements ========
+
+    def visitStmt(self, ctx: TyCParser.StmtContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitVarDeclStmt(self, ctx: TyCParser.VarDeclStmtContext):
+        return self.visit(ctx.varDecl())
+
+    def visitVarDecl(self, ctx: TyCParser.VarDeclContext):
+        ids = ctx.ID()
+        if ctx.AUTO():
+            var_type = None
+        elif ctx.primitiveType():
+            var_type = self.visit(ctx.primitiveType())
+        else:
+            var_type = self._at(StructType(self._name(ids[0])), ids[0])
+        init_value = self.visit(ctx.expression()) if ctx.expression() else None
+        return self._at(VarDecl(var_type, self._name(ids[-1]), init_value), ctx)
+
+    def visitBlockStmt(self, ctx: TyCParser.BlockStmtContext):
+        return self._at(BlockStmt([self.visit(stmt) for stmt in ctx.stmt()]), ctx)
+
+    def visitAssignment(self, ctx: TyCParser.AssignmentContext):
+        lhs = self.visit(ctx.lvalue())
+        return self._at(AssignExpr(lhs, self.visit(ctx.expression())), ctx)
+
+    def visitLvalue(self, ctx: TyCParser.LvalueContext):
+        ids = ctx.ID()
+        return reduce(
+            lambda obj, member: self._at(MemberAccess(obj, self._name(member)), ctx),
+            ids[1:],
+            self._at(Identifier(self._name(ids[0])), ctx),
+        )
+
+    def visitIfStmt(self, ctx: TyCParser.IfStmtContext):
+        stmts = ctx.stmt()
+        else_stmt = self.visit(stmts[1]) if len(stmts) > 1 else None
+        node = IfStmt(self.visit(ctx.expression()), self.visit(stmts[0]), else_stmt)
+        return self._at(node, ctx)
+
+    def visitWhileStmt(self, ctx: TyCParser.WhileStmtContext):
+        node = WhileStmt(self.visit(ctx.expression()), self.visit(ctx.stmt()))
+        return self._at(node, ctx)
+
+    def visitForStmt(self, ctx: TyCParser.ForStmtContext):
+        init = self.visit(ctx.forInit()) if ctx.forInit() else None
+        condition = self.visit(ctx.expression()) if ctx.expression() else None
+        update = self.visit(ctx.forUpdate()) if ctx.forUpdate() else None
+        node = ForStmt(init, condition, update, self.visit(ctx.stmt()))
+        return self._at(node, ctx)
+
+    def visitForInit(self, ctx: TyCParser.ForInitContext):
+        if ctx.varDecl():
+            return self.visit(ctx.varDecl())
+        return self._at(ExprStmt(self.visit(ctx.assignment())), ctx)
+
+    def visitForUpdate(self, ctx: TyCParser.ForUpdateContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitIncDec(self, ctx: TyCParser.IncDecContext):
+        operand = self.visit(ctx.lvalue())
+        operator = (ctx.INC() or ctx.DEC()).getText()
+        if ctx.getChild(0) is ctx.lvalue():
+            return self._at(PostfixOp(operator, operand), ctx)
+        return self._at(PrefixOp(operator, operand), ctx)
+
+    def visitSwitchStmt(self, ctx: TyCParser.SwitchStmtContext):
+        cases = [self.visit(case) for case in ctx.caseSwitch()]
+        default = self.visit(ctx.defaultSwitch()) if ctx.defaultSwitch() else None
+        # The default may sit between cases; fall-through follows source order
+        index = 0
+        for child in ctx.children:
+            if isinstance(child, TyCParser.DefaultSwitchContext):
+                break
+            index += isinstance(child, TyCParser.CaseSwitchContext)
+        switch = SwitchStmt(self.visit(ctx.expression()), cases, default, index)
+        return self._at(switch, ctx)
+
+    def visitCaseSwitch(self, ctx: TyCParser.CaseSwitchContext):
+        stmts = [self.visit(stmt) for stmt in ctx.stmt()]
+        return self._at(CaseStmt(self.visit(ctx.expression()), stmts), ctx)
+
+    def visitDefaultSwitch(self, ctx: TyCParser.DefaultSwitchContext):
+        return self._at(DefaultStmt([self.visit(stmt) for stmt in ctx.stmt()]), ctx)
+
+    def visitBreakStmt(self, ctx: TyCParser.BreakStmtContext):
+        return self._at(BreakStmt(), ctx)
+
+    def visitContinueStmt(self, ctx: TyCParser.ContinueStmtContext):
+        return self._at(ContinueStmt(), ctx)
+
+    def visitReturnStmt(self, ctx: TyCParser.ReturnStmtContext):
+        expr = self.visit(ctx.expression()) if ctx.expression() else None
+        return self._at(ReturnStmt(expr), ctx)
+
+    def visitExprStmt(self, ctx: TyCParser.ExprStmtContext):
+        return self._at(ExprStmt(self.visit(ctx.expression())), ctx)
+
+    # ======== Expressions ========
+
+    def visitExpression(self, ctx: TyCParser.ExpressionContext):
+        if ctx.expr():
+            return self.visit(ctx.expr())
+        lhs = self.visit(ctx.lvalue())
+        return self._at(AssignExpr(lhs, self.visit(ctx.expression())), ctx)
+
+    def _binary(self, ctx):
+        left = self.visit(ctx.expr(0))
+        right = self.visit(ctx.expr(1))
+        return self._at(BinaryOp(left, ctx.op.text, right), ctx)
+
+    def visitOperandExpr(self, ctx: TyCParser.OperandExprContext):
+        # Children: prefix operator tokens, a call or primary, then DOT ID
+        # pairs and postfix ++/--, innermost first
+        children = ctx.children
+        start = 0
+        while isinstance(children[start], TerminalNode):
+            start += 1
+        operand = children[start]
+        node = self.visit(operand)
+        i = start + 1
+        while i < len(children):
+            token = children[i].symbol
+            if token.type == TyCParser.DOT:
+                node = self._at(MemberAccess(node, self._name(children[i + 1])), operand)
+                i += 2
+            else:
+                node = self._at(PostfixOp(token.text, node), operand)
+                i += 1
+        for op in reversed(children[:start]):
+            node = self._at(PrefixOp(op.getText(), node), op)
+        return node
+
+    def visitCall(self, ctx: TyCParser.CallContext):
+        args = self.visit(ctx.argList()) if ctx.argList() else []
+        return self._at(FuncCall(self._name(ctx.ID()), args), ctx)
+
+    def visitMulExpr(self, ctx: TyCParser.MulExprContext):
+        return self._binary(ctx)
+
+    def visitAddExpr(self, ctx: TyCParser.AddExprContext):
+        return self._binary(ctx)
+
+    def visitRelationalExpr(self, ctx: TyCParser.RelationalExprContext):
+        return self._binary(ctx)
+
+    def visitEqExpr(self, ctx: TyCParser.EqExprContext):
+        return self._binary(ctx)
+
+    def visitAndExpr(self, ctx: TyCParser.AndExprContext):
+        return self._binary(ctx)
+
+    def visitOrExpr(self, ctx: TyCParser.OrExprContext):
+        return self._binary(ctx)
+
+    def visitIdExpr(self, ctx: TyCParser.IdExprContext):
+        return self._at(Identifier(self._name(ctx.ID())), ctx)
+
+    def visitIntLitExpr(self, ctx: TyCParser.IntLitExprContext):
+        return self._at(IntLiteral(int(ctx.INTLIT().getText())), ctx)
+
+    def visitFloatLitExpr(self, ctx: TyCParser.FloatLitExprContext):
+        return self._at(FloatLiteral(float(ctx.FLOATLIT().getText())), ctx)
+
+    def visitStringLitExpr(self, ctx: TyCParser.StringLitExprContext):
+        return self._at(StringLiteral(ctx.STRINGLIT().getText()), ctx)
+
+    def visitParenExpr(self, ctx: TyCParser.ParenExprContext):
+        return self.visit(ctx.expression())
+
+    def visitStructLitExpr(self, ctx: TyCParser.StructLitExprContext):
+        values = self.visit(ctx.argList()) if ctx.argList() else []
+        return self._at(StructLiteral(values), ctx)
+
+    def visitArgList(self, ctx: TyCParser.ArgListContext):
+        return [self.visit(expr) for expr in ctx.expression()]
+
+
+class IterativeASTGeneration(ASTGeneration):
+    """ASTGeneration that never recurses on the parse tree.
+
+    visit() first walks the subtree with an explicit stack and runs the
+    ordinary visitXxx method of every rule context in post-order, storing
+    each result. When a visitXxx method then visits a child, the stored
+    result is returned instead of descending, so Python stack depth stays
+    constant however deeply the input nests. Once a context's result is
+    stored, its children's results are dropped, so only the results still
+    waiting for their parent are held at any time.
+    """
+
+    def __init__(self, names: NameTable = None):
+        super().__init__(names)
+        self._results = {}
+        self._depth = 0
+
+    def visit(self, tree):
+        results = self._results
+        if tree in results:
+            return results.pop(tree)
+        self._depth += 1
+        try:
+            stack = [(tree, False)]
+            while stack:
+                ctx, children_done = stack.pop()
+                if children_done:
+                    results[ctx] = ctx.accept(self)
+                    # Drop child results the visitXxx method did not ask for
+                    for child in ctx.children or ():
+                        results.pop(child, None)
+                else:
+                    stack.append((ctx, True))
+                    for child in ctx.children or ():
+                        if isinstance(child, ParserRuleContext):
+                            stack.append((child, False))
+            return results.pop(tree)
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                # Nothing is left after a clean run; this is for exceptions
+                results.clear()
+
+
+def generate_ast(source, deep: bool = False) -> Program:
+    """Parse TyC source (a str or character stream) and return its AST.
+
+    Syntax and lexer errors propagate as exceptions. With deep=True the
+    parse runs under run_deep() and the tree is converted by
+    IterativeASTGeneration, so nesting depth is bounded by memory rather
+    than the Python recursion limit.
+    """
+    stream = InputStream(source) if isinstance(source, str) else source
+    parser = make_parser(CommonTokenStream(make_lexer(stream)))
+    if deep:
+        tree, _ = run_deep(parse_program, parser)
+        return IterativeASTGeneration().visit(tree)
+    tree, _ = parse_program(parser)
+    return ASTGeneration().visit(tree)
@@ -0,0 +1,139 @@
+"""
+Client for the TyC compile server (see server.py).
+Requests and responses are JSON objects, each sent as a frame: a 4-byte
+big-endian length followed by that many bytes of UTF-8 JSON. A connection
+may carry any number of request/response pairs.
+
+This module uses only the standard library, so a client call costs an
+interpreter start-up and a socket round trip, not an ANTLR import:
+
+    python -m src.astgen.client compile a.tyc b.tyc
+    python -m src.astgen.client tokenize - < a.tyc
+"""
+
+import argparse
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+
+_LENGTH = struct.Struct(">I")
+MAX_FRAME = 64 << 20
+
+
+def default_socket_path() -> str:
+    """$TYC_SOCKET, or a per-user socket in the temporary directory."""
+    uid = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return os.environ.get("TYC_SOCKET") or os.path.join(tempfile.gettempdir(), f"tyc-{uid}.sock")
+
+
+class ProtocolError(Exception):
+    """A peer sent a malformed or oversized frame."""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed mid-frame" if data else "connection closed")
+        data += chunk
+    return bytes(data)
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    if len(payload) > MAX_FRAME:
+        raise ProtocolError(f"message of {len(payload)} bytes exceeds {MAX_FRAME}")
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    (size,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    if size > MAX_FRAME:
+        raise ProtocolError(f"frame of {size} bytes exceeds {MAX_FRAME}")
+    try:
+        message = json.loads(_recv_exact(sock, size))
+    except ValueError as e:
+        raise ProtocolError(f"bad JSON frame: {e}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("frame is not a JSON object")
+    return message
+
+
+class Client:
+    """One connection to a compile server."""
+
+    def __init__(self, path: str = None, timeout: float = None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(path or default_socket_path())
+        except OSError:
+            self.sock.close()
+            raise
+
+    def request(self, op: str, **fields) -> dict:
+        """Send one request and return the server's response."""
+        send_message(self.sock, {"op": op, **fields})
+        return recv_message(self.sock)
+
+    def compile(self, source: str, include_ast: bool = True) -> dict:
+        return self.request("compile", source=source, ast=include_ast)
+
+    def parse(self, source: str) -> dict:
+        return self.request("parse", source=source)
+
+    def tokenize(self, source: str) -> dict:
+        return self.request("tokenize", source=source)
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read(path: str) -> str:
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Send requests to a TyC compile server.")
+    arg_parser.add_argument("op", choices=["compile", "parse", "tokenize", "ping", "stats", "shutdown"])
+    arg_parser.add_argument("files", nargs="*", help="source files, - for stdin")
+    arg_parser.add_argument("--socket", help="server socket (default: $TYC_SOCKET or a per-user path)")
+    arg_parser.add_argument("--no-ast", dest="ast", action="store_false", help="compile: omit the AST")
+    args = arg_parser.parse_args(argv)
+
+    def requests():
+        if args.op in ("ping", "stats", "shutdown"):
+            yield None, {}
+            return
+        for path in args.files:
+            fields = {"source": _read(path)}
+            if args.op == "compile":
+                fields["ast"] = args.ast
+            yield path, fields
+
+    failed = False
+    with Client(args.socket) as client:
+        for path, fields in requests():
+            response = client.request(args.op, **fields)
+            if path is not None:
+                response = {"file": path, **response}
+            failed |= not response.get("ok")
+            print(json.dumps(response), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
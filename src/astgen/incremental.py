@@ -0,0 +1,203 @@
+"""
+Incremental re-parsing of edited TyC sources.
+A program is a flat sequence of struct and function declarations, so an
+edit can only change the declarations it touches. IncrementalParser keeps
+the source text, the Program and the character span of each top-level
+declaration, along with a flat list of each declaration's nodes for
+moving positions quickly. edit() re-lexes and re-parses only the text between the
+nearest untouched declarations on either side and splices the resulting
+declarations into Program.decls, shifting the source positions of the
+declarations after the edit.
+
+Region tokens get absolute lines and columns because the lexer starts at
+the region's position in the file. Any lexer or syntax error in the region
+falls back to a full parse, which reports the error exactly as a
+non-incremental parse would. So does an edit that leaves a token running
+past the end of the region, such as a line comment, an unclosed block
+comment or a string swallowing the next declaration's first characters:
+the region then no longer ends where a full lex of the text would.
+"""
+
+from antlr4 import CommonTokenStream, InputStream
+from src.astgen.ast_generation import ASTGeneration
+from src.astgen.interning import NameTable
+from src.utils.fast_lexer import MASTER_PATTERN
+from src.utils.nodes import Program, walk
+from src.utils.parsing import make_lexer, make_parser, parse_program
+
+
+def _position(text: str, index: int):
+    """ANTLR (line, column) of text[index]."""
+    line_start = text.rfind("\n", 0, index) + 1
+    return text.count("\n", 0, index) + 1, index - line_start
+
+
+def _ends_on_token_boundary(text: str, start: int, end: int) -> bool:
+    """Whether lexing text from start reaches end between two tokens.
+
+    Comments count as tokens here, so a comment or string that starts
+    before end and finishes after it makes the boundary unclean.
+    """
+    if end >= len(text):
+        return True
+    match = MASTER_PATTERN.match
+    pos = start
+    while pos < end:
+        m = match(text, pos)
+        if m.start(m.lastindex) >= end:
+            return True
+        if m.end() == pos:
+            # Only the end-of-input alternative matches nothing
+            return False
+        pos = m.end()
+    return pos == end
+
+
+def parse_declarations(text: str, line: int = 1, column: int = 0, names: NameTable = None):
+    """Parse text as a sequence of declarations starting at (line, column).
+
+    Returns (ProgramContext, Program). Tokens and nodes get positions as if
+    text sat at that line and column of a larger file; character indices in
+    the tree stay relative to text.
+    """
+    lexer = make_lexer(InputStream(text))
+    lexer._interp.line, lexer._interp.column = line, column
+    tree, _ = parse_program(make_parser(CommonTokenStream(lexer)))
+    return tree, ASTGeneration(names).visit(tree)
+
+
+def _parse(text: str, names: NameTable, start: int = 0, end: int = None):
+    """Parse text[start:end] as declarations; return (Program, declaration
+    spans). Spans are (first char, one past the last char) in text.
+    """
+    tree, program = parse_declarations(text[start:end], *_position(text, start), names)
+    spans = [
+        (start + decl.start.start, start + decl.stop.stop + 1) for decl in tree.declaration()
+    ]
+    return program, spans
+
+
+def _positioned(decl):
+    """The nodes under decl that carry a source position, in a flat list.
+
+    Shared primitive type nodes have no position and are left out, so
+    shifting positions never touches them.
+    """
+    return [node for node in walk(decl) if node.line is not None]
+
+
+class IncrementalParser:
+    """A parsed TyC source that can be edited and re-parsed incrementally.
+
+    program is updated in place: edit() replaces entries of program.decls
+    and leaves the other declaration nodes as they are, apart from their
+    line and column.
+    """
+
+    def __init__(self, text: str):
+        self.names = NameTable()
+        self.text = text
+        self.program = None
+        self.spans = []
+        self._nodes = []
+        # Indices in program.decls of the declarations the last edit built
+        self.last_reparsed = range(0)
+        self.full_parses = 0
+        self._full_parse()
+
+    @classmethod
+    def from_tree(cls, text: str, tree, program: Program) -> "IncrementalParser":
+        """Adopt an existing parse of text: its ProgramContext and AST."""
+        self = cls.__new__(cls)
+        self.names = NameTable()
+        self.text = text
+        self.program = program
+        self.spans = [(decl.start.start, decl.stop.stop + 1) for decl in tree.declaration()]
+        self._nodes = [_positioned(decl) for decl in program.decls]
+        self.last_reparsed = range(0)
+        self.full_parses = 0
+        return self
+
+    def _full_parse(self):
+        self.full_parses += 1
+        self.program = None
+        program, self.spans = _parse(self.text, self.names)
+        self._nodes = [_positioned(decl) for decl in program.decls]
+        self.program = program
+        self.last_reparsed = range(len(program.decls))
+
+    def edit(self, start: int, end: int, new_text: str) -> Program:
+        """Replace text[start:end] with new_text and return the updated Program.
+
+        Lexer and syntax errors are raised as by a full parse. After an
+        error the next edit parses the whole text again.
+        """
+        old_text = self.text
+        self.text = text = old_text[:start] + new_text + old_text[end:]
+        if self.program is None:
+            self._full_parse()
+            return self.program
+
+        # Declarations overlapping or touching the edit are re-parsed
+        spans = self.spans
+        first = 0
+        while first < len(spans) and spans[first][1] < start:
+            first += 1
+        last = first
+        while last < len(spans) and spans[last][0] <= end:
+            last += 1
+        region_start = spans[first - 1][1] if first else 0
+        old_region_end = spans[last][0] if last < len(spans) else len(old_text)
+        delta = len(new_text) - (end - start)
+        region_end = old_region_end + delta
+
+        if not _ends_on_token_boundary(text, region_start, region_end):
+            self._full_parse()
+            return self.program
+        try:
+            region, region_spans = _parse(text, self.names, region_start, region_end)
+        except Exception:
+            self._full_parse()
+            return self.program
+
+        program = self.program
+        program.decls[first:last] = region.decls
+        self.spans[first:last] = region_spans
+        self._nodes[first:last] = [_positioned(decl) for decl in region.decls]
+        self.last_reparsed = range(first, first + len(region.decls))
+        following = first + len(region.decls)
+        self._shift(following, old_text, old_region_end, text, region_end, delta)
+        self._place_program()
+        return program
+
+    def _shift(self, following: int, old_text: str, old_end: int, text: str, new_end: int, delta: int):
+        """Move spans and node positions of the declarations after an edit."""
+        spans = self.spans
+        if delta:
+            for i in range(following, len(spans)):
+                spans[i] = (spans[i][0] + delta, spans[i][1] + delta)
+        if following == len(spans):
+            return
+        old_line, old_column = _position(old_text, old_end)
+        new_line, new_column = _position(text, new_end)
+        lines, columns = new_line - old_line, new_column - old_column
+        if not lines and not columns:
+            return
+        for decl, nodes in zip(self.program.decls[following:], self._nodes[following:]):
+            if decl.line == old_line:
+                # Declarations starting on the edit's last line also move sideways
+                for node in nodes:
+                    if node.line == old_line:
+                        node.column += columns
+                    node.line += lines
+            elif lines:
+                for node in nodes:
+                    node.line += lines
+
+    def _place_program(self):
+        """Give Program the position a full parse would: its first token."""
+        program = self.program
+        if program.decls:
+            program.line, program.column = program.decls[0].line, program.decls[0].column
+        else:
+            program.line, program.column = _position(self.text, len(self.text))
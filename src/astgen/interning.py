@@ -0,0 +1,43 @@
+"""
+Interning for AST construction.
+Primitive types carry no state, so ASTGeneration reuses one instance of each
+instead of allocating a node per declaration. Shared type nodes have no
+source position and must not be modified.
+
+NameTable interns identifier strings for one compilation, so every
+occurrence of a name in the AST is the same str object and name comparisons
+between nodes can use ``is``.
+"""
+
+from src.utils.nodes import FloatType, IntType, StringType, VoidType
+
+INT_TYPE = IntType()
+FLOAT_TYPE = FloatType()
+STRING_TYPE = StringType()
+VOID_TYPE = VoidType()
+
+PRIMITIVE_TYPES = {
+    "int": INT_TYPE,
+    "float": FLOAT_TYPE,
+    "string": STRING_TYPE,
+    "void": VOID_TYPE,
+}
+
+
+class NameTable:
+    """Per-compilation table of interned identifier and member names."""
+
+    __slots__ = ("_names",)
+
+    def __init__(self):
+        self._names = {}
+
+    def intern(self, name: str) -> str:
+        """Return the table's copy of name, adding it on first sight."""
+        return self._names.setdefault(name, name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -0,0 +1,146 @@
+"""
+Parallel parsing of TyC sources across processes.
+Top-level struct and function declarations parse independently, so
+parse_parallel() splits a file at declaration boundaries found by a cheap
+pre-scan that only balances braces (skipping strings and comments), parses
+the chunks in a ProcessPoolExecutor and joins the declarations into one
+Program in source order. Each chunk is lexed from its absolute line and
+column, so positions match a sequential parse.
+
+Chunks come back as AST files (see ast_format.py), which are compact to
+send between processes and decode without recursion. If any chunk fails,
+the whole file is parsed again sequentially, so the error raised is the one
+a sequential parse reports first.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from src.astgen.ast_generation import generate_ast
+from src.astgen.incremental import parse_declarations
+from src.utils import ast_format
+from src.utils.nodes import Program
+
+# Strings, comments and the three characters that end declarations
+_STRUCTURE = re.compile(r'"(?:[^"\\\n]|\\.)*"?|//[^\n]*|/\*.*?(?:\*/|\Z)|[{};]', re.DOTALL)
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_CHARS = 4096
+
+
+def split_declarations(text: str):
+    """Offsets at which text can be cut between top-level declarations.
+
+    A declaration ends after a ';' at brace depth 0, or after a '}' that
+    returns to depth 0 unless a ';' follows it (as in "struct S {...};").
+    Offsets are ascending and exclude 0 and len(text). Text with unbalanced
+    braces gives fewer cuts, never wrong ones that a parse would accept.
+    """
+    cuts = []
+    depth = 0
+    pending = None
+    for match in _STRUCTURE.finditer(text):
+        token = match.group()
+        if token not in ("{", "}", ";"):
+            continue
+        if pending is not None:
+            if token == ";" and depth == 0:
+                pending = None  # the ';' ends the declaration instead
+            else:
+                cuts.append(pending)
+                pending = None
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                pending = match.end()
+        elif depth == 0:
+            cuts.append(match.end())
+    if pending is not None:
+        cuts.append(pending)
+    return [cut for cut in cuts if cut < len(text)]
+
+
+def plan_chunks(text: str, chunks: int, min_chars: int = MIN_CHUNK_CHARS):
+    """Up to `chunks` (start, end) ranges of roughly equal size covering text."""
+    target = max(min_chars, len(text) // max(1, chunks))
+    ranges = []
+    start = 0
+    for cut in split_declarations(text):
+        if cut - start >= target:
+            ranges.append((start, cut))
+            start = cut
+    ranges.append((start, len(text)))
+    return ranges
+
+
+def _parse_chunk(chunk: str, line: int, column: int) -> bytes:
+    """Worker: parse one chunk and return its declarations as an AST file."""
+    _, program = parse_declarations(chunk, line, column)
+    return ast_format.dumps(program)
+
+
+def make_executor(workers: int = None) -> ProcessPoolExecutor:
+    """A process pool whose workers warm their DFA caches on start-up.
+
+    Reusing one pool across files avoids paying process start-up and DFA
+    warm-up per file.
+    """
+    from src.utils.warmup import warm_up
+
+    return ProcessPoolExecutor(workers, initializer=warm_up)
+
+
+def parse_parallel(source: str, workers: int = None, executor: ProcessPoolExecutor = None) -> Program:
+    """Parse source into a Program using several processes.
+
+    Returns the same AST, with the same positions, as generate_ast(source)
+    and raises the same error for invalid input. Sources too small to split
+    are parsed in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = plan_chunks(source, workers * CHUNKS_PER_WORKER)
+    if workers == 1 or len(ranges) == 1:
+        return generate_ast(source)
+
+    positions = []
+    line, line_start = 1, 0
+    previous = 0
+    for start, _ in ranges:
+        line += source.count("\n", previous, start)
+        line_start = source.rfind("\n", 0, start) + 1
+        positions.append((line, start - line_start))
+        previous = start
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(min(workers, len(ranges)))
+    try:
+        futures = [
+            executor.submit(_parse_chunk, source[start:end], line, column)
+            for (start, end), (line, column) in zip(ranges, positions)
+        ]
+        try:
+            parts = [future.result() for future in futures]
+        except Exception:
+            for future in futures:
+                future.cancel()
+            parts = None
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+    if parts is None:
+        # Report the error a sequential parse reports first
+        return generate_ast(source)
+    decls = []
+    for part in parts:
+        decls.extend(ast_format.loads(part).to_node().decls)
+    program = Program(decls)
+    if decls:
+        program.line, program.column = decls[0].line, decls[0].column
+    else:
+        program.line = source.count("\n") + 1
+        program.column = len(source) - (source.rfind("\n") + 1)
+    return program
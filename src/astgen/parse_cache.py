@@ -0,0 +1,205 @@
+"""
+Content-addressed on-disk cache of AST generation results.
+Entries are keyed by a SHA-256 of the source text and of everything that
+shapes its AST: the grammar and node schema (ast_format.schema_digest()),
+the AST file format version and the AST generation sources, and by
+whether the deep (iterative) generator was asked for. A successful parse is
+stored as an AST file (see ast_format.py) and a lexer or syntax error as its
+error string, so a hit returns exactly what ASTGenerator.generate() would
+without running the lexer or parser. Other failures, such as a
+RecursionError, depend on the recursion limit and stack size rather than on
+the source; they are reported but never stored.
+
+The cache directory may be shared between processes. Writes are atomic
+renames, a hit refreshes the entry's mtime, and once the entries exceed
+max_bytes the least recently used ones are deleted.
+"""
+
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import Callable, Optional, Union
+
+from src.utils import ast_format
+from src.utils.nodes import Program
+
+DEFAULT_MAX_BYTES = 256 << 20
+AST_SUFFIX = ".tycast"
+ERROR_SUFFIX = ".err"
+_GENERATOR_SOURCES = ("ast_generation.py", "interning.py")
+
+Result = Union[Program, str]
+
+
+@lru_cache(maxsize=None)
+def generator_digest() -> bytes:
+    """SHA-256 over the grammar/schema digest, format version and AST
+    generation sources; changes to any of them invalidate every entry."""
+    digest = hashlib.sha256(ast_format.schema_digest())
+    digest.update(str(ast_format.FORMAT_VERSION).encode())
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in _GENERATOR_SOURCES:
+        with open(os.path.join(here, name), "rb") as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def error_result(error: Exception) -> str:
+    """error as ASTGenerator.generate() reports it."""
+    return f"AST Generation Error: {str(error)}"
+
+
+def is_source_error(error: Exception) -> bool:
+    """True for lexer and syntax errors, which depend only on the source."""
+    # Imported here so that runs with only cache hits never load ANTLR
+    from build.TyCLexer import LexerError
+    from src.utils.error_listener import SyntaxException
+
+    return isinstance(error, (LexerError, SyntaxException))
+
+
+def generate_result(source: str, deep: bool = False) -> Result:
+    """The Program for source, or its error as ASTGenerator.generate()
+    reports it."""
+    from src.astgen.ast_generation import generate_ast
+
+    try:
+        return generate_ast(source, deep)
+    except Exception as e:
+        return error_result(e)
+
+
+class ParseCache:
+    """LRU cache of generate() results in a directory, bounded by size."""
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(size for _, _, size in self._entries())
+
+    def key(self, source: str, deep: bool = False) -> str:
+        digest = hashlib.sha256(generator_digest())
+        digest.update(b"deep" if deep else b"flat")
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, source: str, deep: bool = False) -> Optional[Result]:
+        """The cached result for source, or None on a miss."""
+        key = self.key(source, deep)
+        for suffix in (AST_SUFFIX, ERROR_SUFFIX):
+            path = self._path(key, suffix)
+            try:
+                if suffix == AST_SUFFIX:
+                    result = ast_format.load(path).to_node()
+                else:
+                    with open(path, encoding="utf-8") as f:
+                        result = f.read()
+            except FileNotFoundError:
+                continue
+            except (ast_format.ASTFormatError, UnicodeDecodeError):
+                # Torn or foreign file; drop it and parse again
+                self._remove(path)
+                continue
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass  # evicted since it was read; the result is still good
+            self.hits += 1
+            return result
+        self.misses += 1
+        return None
+
+    def put(self, source: str, result: Result, deep: bool = False) -> None:
+        """Store the result of generating source, then evict if over budget."""
+        if isinstance(result, str):
+            data, suffix = result.encode("utf-8"), ERROR_SUFFIX
+        else:
+            data, suffix = ast_format.dumps(result), AST_SUFFIX
+        path = self._path(self.key(source, deep), suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            try:
+                replaced = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._size += len(data) - replaced
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def fetch(self, source: str, build: Callable[[], Program], deep: bool = False) -> Result:
+        """The cached result for source, calling build() on a miss. Its
+        Program or lexer/syntax error is stored; any other exception is
+        returned as an error string without being stored."""
+        result = self.get(source, deep)
+        if result is None:
+            try:
+                result = build()
+            except Exception as e:
+                result = error_result(e)
+                if not is_source_error(e):
+                    return result
+            self.put(source, result, deep)
+        return result
+
+    def generate(self, source: str, deep: bool = False) -> Result:
+        """Cached equivalent of ASTGenerator(source, deep).generate()."""
+        from src.astgen.ast_generation import generate_ast
+
+        return self.fetch(source, lambda: generate_ast(source, deep), deep)
+
+    def _entries(self):
+        """(mtime, path, size) of every entry currently on disk."""
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith((AST_SUFFIX, ERROR_SUFFIX)):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield stat.st_mtime_ns, entry.path, stat.st_size
+
+    def _remove(self, path: str) -> int:
+        try:
+            size = os.path.getsize(path)
+            os.unlink(path)
+        except FileNotFoundError:
+            return 0
+        return size
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes.
+
+        Sizes are re-read from disk, so entries written by other processes
+        count too.
+        """
+        entries = sorted(self._entries())
+        self._size = sum(size for _, _, size in entries)
+        for _, path, _ in entries:
+            if self._size <= self.max_bytes:
+                break
+            self._size -= self._remove(path)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for _, path, _ in list(self._entries()):
+            self._remove(path)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
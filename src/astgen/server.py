@@ -0,0 +1,192 @@
+"""
+Long-running TyC compile server on a Unix domain socket.
+The server imports ANTLR and warms the shared lexer and parser DFA caches
+once (see warmup.py), then answers requests framed as described in
+client.py:
+
+    {"op": "compile", "source": ..., "ast": true}  -> {"ok", "ast" | "error", "ms"}
+    {"op": "parse", "source": ...}                  -> {"ok", "mode" | "error", "ms"}
+    {"op": "tokenize", "source": ...}               -> {"ok", "tokens" | "error", "ms"}
+    {"op": "ping"}, {"op": "stats"}, {"op": "shutdown"}
+
+Tokens are [type name, text, line, column]. Connections are served on
+threads, but requests run one at a time, since the shared DFA caches are
+not safe to grow from several threads.
+
+Start one with ``python3 run.py serve [--socket PATH] [--cache DIR]``.
+"""
+
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.Token import Token
+from build.TyCLexer import TyCLexer
+from src.astgen.client import ProtocolError, default_socket_path, recv_message, send_message
+from src.astgen.parse_cache import ParseCache, generate_result
+from src.utils.parsing import make_lexer, make_parser, parse_program
+
+
+def tokenize(source: str):
+    """[type name, text, line, column] for every token up to EOF."""
+    lexer = make_lexer(InputStream(source))
+    names = TyCLexer.symbolicNames
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        if token.type == Token.EOF:
+            return tokens
+        tokens.append([names[token.type], token.text, token.line, token.column])
+
+
+def check_syntax(source: str) -> str:
+    """Parse source without building an AST; return the prediction mode."""
+    _, mode = parse_program(make_parser(CommonTokenStream(make_lexer(InputStream(source)))))
+    return mode
+
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server answering compile, parse and tokenize requests."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, cache_dir=None):
+        self.path = path
+        self.cache = ParseCache(cache_dir) if cache_dir else None
+        self.work_lock = threading.Lock()
+        self.requests = 0
+        self.started = time.time()
+        if os.path.exists(path):
+            _remove_stale_socket(path)
+        super().__init__(path, _Handler)
+
+    def handle_request_message(self, message: dict) -> dict:
+        op = message.get("op")
+        handler = _OPS.get(op)
+        if handler is None:
+            return {"ok": False, "error": f"unknown op {op!r}"}
+        if op in _SOURCE_OPS and not isinstance(message.get("source"), str):
+            return {"ok": False, "error": f"{op} needs a string 'source'"}
+        start = time.perf_counter()
+        with self.work_lock:
+            self.requests += 1
+            response = handler(self, message)
+        response["ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return response
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: str):
+    """Remove a socket file left by a dead server; refuse to replace a live
+    one or anything that is not a socket."""
+    if not stat.S_ISSOCK(os.stat(path).st_mode):
+        raise OSError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+    else:
+        raise OSError(f"a server is already listening on {path}")
+    finally:
+        probe.close()
+
+
+def _compile(server, message):
+    if server.cache is not None:
+        outcome = server.cache.generate(message["source"])
+    else:
+        outcome = generate_result(message["source"])
+    if isinstance(outcome, str):
+        return {"ok": False, "error": outcome}
+    response = {"ok": True}
+    if message.get("ast", True):
+        response["ast"] = str(outcome)
+    return response
+
+
+def _parse(server, message):
+    try:
+        return {"ok": True, "mode": check_syntax(message["source"])}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+def _tokenize(server, message):
+    try:
+        return {"ok": True, "tokens": tokenize(message["source"])}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+def _ping(server, message):
+    return {"ok": True, "pid": os.getpid()}
+
+
+def _stats(server, message):
+    stats = {"ok": True, "requests": server.requests, "uptime": round(time.time() - server.started, 3)}
+    if server.cache is not None:
+        stats.update(cache_hits=server.cache.hits, cache_misses=server.cache.misses)
+    return stats
+
+
+def _shutdown(server, message):
+    # shutdown() waits for serve_forever() to return, so it cannot run on
+    # the thread serving this request
+    threading.Thread(target=server.shutdown, daemon=True).start()
+    return {"ok": True}
+
+
+_OPS = {
+    "compile": _compile,
+    "parse": _parse,
+    "tokenize": _tokenize,
+    "ping": _ping,
+    "stats": _stats,
+    "shutdown": _shutdown,
+}
+_SOURCE_OPS = ("compile", "parse", "tokenize")
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                message = recv_message(self.request)
+            except ConnectionError:
+                return
+            except ProtocolError as e:
+                send_message(self.request, {"ok": False, "error": str(e)})
+                return
+            response = self.server.handle_request_message(message)
+            try:
+                send_message(self.request, response)
+            except ProtocolError as e:
+                # The response is too large for one frame
+                send_message(self.request, {"ok": False, "error": str(e)})
+
+
+def serve(path: str = None, cache_dir=None, warm: bool = True, ready=None):
+    """Run a compile server on path until a shutdown request arrives.
+
+    ready, if given, is a threading.Event set once the socket accepts
+    connections.
+    """
+    if warm:
+        from src.utils.warmup import warm_up
+
+        warm_up()
+    with CompileServer(path or default_socket_path(), cache_dir) as server:
+        if ready is not None:
+            ready.set()
+        server.serve_forever()
@@ -54,7 +54,6 @@ paraList: paraType ID (COMMA paraType ID)*;
 // Statements
 stmt: varDeclStmt
     | blockStmt
-    | assignStmt
     | ifStmt
     | whileStmt
     | forStmt
@@ -72,7 +71,9 @@ varDecl: (AUTO | primitiveType) ID (ASSIGN expression)?
 
 blockStmt: LBRACE stmt* RBRACE;
 
-assignStmt: assignment SEMI;
+// Assignment statements are expression statements; a separate
+// `assignment SEMI` alternative would match the same tokens and force
+// prediction to scan every assignment up to its semicolon.
 assignment   : lvalue ASSIGN expression ;
 lvalue       : ID (DOT ID)* ;
 
@@ -98,27 +99,32 @@ returnStmt: RETURN expression? SEMI;
 exprStmt: expression SEMI;
 
 // Expressions
-expression: assignExpr;
-assignExpr: lvalue ASSIGN assignExpr | orExpr;
-orExpr: orExpr OR andExpr | andExpr;
-andExpr: andExpr AND eqExpr | eqExpr;
-eqExpr: eqExpr (EQ | NEQ) relationalExpr | relationalExpr;
-relationalExpr: relationalExpr (LT | LTE | GT | GTE) addExpr | addExpr;
-addExpr: addExpr (PLUS | MINUS) mulExpr | mulExpr;
-mulExpr: mulExpr (MUL | DIV | MOD) unaryExpr | unaryExpr;
-unaryExpr: (NOT | MINUS | PLUS) unaryExpr | prefixExpr;
-prefixExpr: (INC | DEC) prefixExpr | postfixExpr;
-postfixExpr: postfixExpr (INC | DEC)
-            | postfixExpr argFuncList //function call;
-            | primaryExpr;
-primaryExpr: primaryExpr DOT ID
-            | ID | FLOATLIT | INTLIT | STRINGLIT 
-            | LPAREN expression RPAREN
-            | structInit;
-
-argFuncList: LPAREN argList? RPAREN;     // can empty (), use for function     
+// Binary operators share one left-recursive rule whose alternatives are
+// ordered from highest to lowest precedence. An operand is one flat
+// alternative: unary operators, then ++/--, then a call or a primary with
+// its member accesses, then postfix ++/--. Only a function name can be
+// called, as FuncCall requires.
+// Assignment stays outside expr so that only an lvalue may appear on its left.
+expression: lvalue ASSIGN expression | expr;
+expr: expr op=(MUL | DIV | MOD) expr            # mulExpr
+    | expr op=(PLUS | MINUS) expr               # addExpr
+    | expr op=(LT | LTE | GT | GTE) expr        # relationalExpr
+    | expr op=(EQ | NEQ) expr                   # eqExpr
+    | expr op=AND expr                          # andExpr
+    | expr op=OR expr                           # orExpr
+    | (NOT | MINUS | PLUS)* (INC | DEC)*
+      (call | primary (DOT ID)*) (INC | DEC)*   # operandExpr
+    ;
+call: ID LPAREN argList? RPAREN;
+primary: ID                                     # idExpr
+       | INTLIT                                 # intLitExpr
+       | FLOATLIT                               # floatLitExpr
+       | STRINGLIT                              # stringLitExpr
+       | LPAREN expression RPAREN               # parenExpr
+       | LBRACE argList? RBRACE                 # structLitExpr
+       ;
+
 argList: expression (COMMA expression)*;
-structInit : LBRACE argList? RBRACE ;
 
 
 // ======== Lexer ==========
@@ -0,0 +1,3 @@
+"""
+Interpreter for TyC language
+"""
@@ -0,0 +1,765 @@
+"""
+Interpreter for TyC programs.
+Interpreter is an ASTVisitor that walks a type-checked Program once and
+turns every statement and expression into a Python closure taking the
+current frame. Running the program calls those closures, so no node is
+dispatched on, and no name is looked up, more than once.
+
+Each function call gets a flat frame: a list holding the return value in
+slot 0, then one slot per parameter and local variable of the function.
+Slots are assigned by symbol ID (see symbol_table.py) before any body is
+compiled, so an Identifier compiles to a constant index. A struct value is
+a list in the slot order of its StructLayout, and a member access indexes
+it with the slot annotated by type inference (see struct_layout.py).
+
+Values are Python ints, floats and strs; relational operators give bools,
+which behave as the ints 0 and 1. Integer / and % truncate toward zero as
+in C. Assigning, passing or returning a struct copies it. A variable
+declared without an initializer starts as 0, 0.0, "" or a struct of those.
+
+Statement closures return None to carry on with the next statement, or
+BREAK, CONTINUE or RETURN (with the value in slot 0 of the frame) to
+unwind to the enclosing loop, switch or call. A switch jumps to its first
+matching case, or else to its default, and falls through the clauses after
+it in source order, the default included wherever it is written; a table
+built at compile time finds the case when every label is a constant
+expression.
+
+The I/O builtins read one line of input each, flushing pending output
+first, and print one value per line. Output is buffered and written in
+large chunks and when the program ends.
+
+Calls run on the Python stack. interpret() runs the program under
+run_deep() (see parsing.py), so TyC recursion can go hundreds of thousands
+of calls deep; a runaway recursion raises Stack Overflow.
+"""
+
+import re
+import sys
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from src.astgen.interning import INT_TYPE, VOID_TYPE
+from src.runtime.runtime_error import DivisionByZero, InvalidInput, StackOverflow
+from src.semantics.static_error import Undeclared
+from src.semantics.symbol_table import FUNCTION
+from src.semantics.type_inference import infer_types
+from src.utils.nodes import (
+    AssignExpr,
+    BinaryOp,
+    FloatLiteral,
+    FuncDecl,
+    Identifier,
+    IntLiteral,
+    MemberAccess,
+    PostfixOp,
+    PrefixOp,
+    Program,
+    StructDecl,
+    StructType,
+    VarDecl,
+    walk,
+)
+from src.utils.parsing import run_deep
+from src.utils.visitor import ASTVisitor
+
+BREAK = 1
+CONTINUE = 2
+RETURN = 3
+
+_ESCAPES = {"b": "\b", "f": "\f", "r": "\r", "n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+_ESCAPE = re.compile(r"\\(.)")
+
+# Operators whose closures need no type information
+_BINARY = {
+    "+": lambda left, right: lambda frame: left(frame) + right(frame),
+    "-": lambda left, right: lambda frame: left(frame) - right(frame),
+    "*": lambda left, right: lambda frame: left(frame) * right(frame),
+    "<": lambda left, right: lambda frame: left(frame) < right(frame),
+    "<=": lambda left, right: lambda frame: left(frame) <= right(frame),
+    ">": lambda left, right: lambda frame: left(frame) > right(frame),
+    ">=": lambda left, right: lambda frame: left(frame) >= right(frame),
+    "==": lambda left, right: lambda frame: left(frame) == right(frame),
+    "!=": lambda left, right: lambda frame: left(frame) != right(frame),
+    "&&": lambda left, right: lambda frame: 1 if left(frame) and right(frame) else 0,
+    "||": lambda left, right: lambda frame: 1 if left(frame) or right(frame) else 0,
+}
+
+# The same with a constant right operand, as in i < n - 1 or i + 1
+_BINARY_CONSTANT = {
+    "+": lambda left, c: lambda frame: left(frame) + c,
+    "-": lambda left, c: lambda frame: left(frame) - c,
+    "*": lambda left, c: lambda frame: left(frame) * c,
+    "<": lambda left, c: lambda frame: left(frame) < c,
+    "<=": lambda left, c: lambda frame: left(frame) <= c,
+    ">": lambda left, c: lambda frame: left(frame) > c,
+    ">=": lambda left, c: lambda frame: left(frame) >= c,
+    "==": lambda left, c: lambda frame: left(frame) == c,
+    "!=": lambda left, c: lambda frame: left(frame) != c,
+}
+
+_CONSTANT_NODES = (IntLiteral, FloatLiteral, BinaryOp, PrefixOp)
+
+
+def _copy(value: list) -> list:
+    """A copy of a struct value, nested structs included."""
+    return [_copy(item) if type(item) is list else item for item in value]
+
+
+def _is_constant(node) -> bool:
+    return all(
+        isinstance(part, _CONSTANT_NODES) and getattr(part, "operator", None) not in ("++", "--")
+        for part in walk(node)
+    )
+
+
+class Console:
+    """Buffered standard input and output for the I/O builtins."""
+
+    __slots__ = ("_stdin", "_stdout", "_pending", "_size", "_limit")
+
+    def __init__(self, stdin: TextIO, stdout: TextIO, limit: int = 1 << 16):
+        self._stdin = stdin
+        self._stdout = stdout
+        self._pending: List[str] = []
+        self._size = 0
+        self._limit = limit
+
+    def write(self, text: str) -> None:
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size >= self._limit:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._stdout.write("".join(self._pending))
+            self._pending.clear()
+            self._size = 0
+        self._stdout.flush()
+
+    def readline(self) -> str:
+        """The next line of input without its line break; "" at the end."""
+        if self._pending:
+            self.flush()
+        line = self._stdin.readline()
+        if line.endswith("\n"):
+            line = line[:-1]
+        if line.endswith("\r"):
+            line = line[:-1]
+        return line
+
+    def read_int(self) -> int:
+        line = self.readline()
+        try:
+            return int(line.strip())
+        except ValueError:
+            raise InvalidInput("readInt", line) from None
+
+    def read_float(self) -> float:
+        line = self.readline()
+        try:
+            return float(line.strip())
+        except ValueError:
+            raise InvalidInput("readFloat", line) from None
+
+    def read_string(self) -> str:
+        return self.readline()
+
+
+class _Function:
+    """A compiled user function. run executes the body on a frame; it is
+    filled in after every signature is known, so calls may come first."""
+
+    __slots__ = ("name", "size", "params", "run")
+
+    def __init__(self, name: str, size: int, params: int):
+        self.name = name
+        self.size = size
+        self.params = params
+        self.run: Optional[Callable] = None
+
+
+class Interpreter(ASTVisitor):
+    """Compiles a type-checked Program into closures; see the module
+    docstring.
+
+    visit(program) returns a function that runs main() once and flushes
+    the output. Types must already be inferred (see interpret()).
+    """
+
+    def __init__(self, console: Console):
+        self.console = console
+        self._slots: Dict[int, int] = {}  # symbol ID of a local -> frame slot
+        self._functions: Dict[int, _Function] = {}  # by symbol ID
+        self._layouts: Dict[int, Any] = {}  # StructLayout by symbol ID
+        self._builtins = {
+            "readInt": self._read(console.read_int),
+            "readFloat": self._read(console.read_float),
+            "readString": self._read(console.read_string),
+            "printInt": self._print("%d\n"),
+            "printFloat": self._print("%r\n"),
+            "printString": self._print("%s\n"),
+        }
+
+    # ========== Helpers ==========
+
+    def _read(self, read):
+        return lambda args: lambda frame: read()
+
+    def _print(self, template):
+        write = self.console.write
+
+        def compile_print(args):
+            (value,) = args
+
+            def print_(frame):
+                write(template % value(frame))
+
+            return print_
+
+        return compile_print
+
+    def _value(self, node):
+        """The closure of an expression whose value is stored somewhere
+        else: structs read from a variable or member are copied."""
+        code = self.visit(node)
+        if isinstance(node.inferred_type, StructType) and isinstance(node, (Identifier, MemberAccess, AssignExpr)):
+            return lambda frame: _copy(code(frame))
+        return code
+
+    def _sequence(self, statements):
+        codes = [self.visit(stmt) for stmt in statements]
+        if len(codes) == 1:
+            return codes[0]
+        if len(codes) == 2:
+            first, second = codes
+
+            def run_two(frame):
+                signal = first(frame)
+                if signal is not None:
+                    return signal
+                return second(frame)
+
+            return run_two
+
+        def run(frame):
+            for code in codes:
+                signal = code(frame)
+                if signal is not None:
+                    return signal
+
+        return run
+
+    # ========== Program and declarations ==========
+
+    def visit_program(self, node: Program, o: Any = None):
+        for decl in node.decls:
+            if isinstance(decl, StructDecl):
+                self._layouts[decl.symbol_id] = decl.layout
+        # Slots and frame sizes first, so calls can be compiled before the
+        # functions they call
+        for decl in node.decls:
+            if isinstance(decl, FuncDecl):
+                size = 1
+                for param in decl.params:
+                    self._slots[param.symbol_id] = size
+                    size += 1
+                for part in walk(decl.body):
+                    if type(part) is VarDecl:
+                        self._slots[part.symbol_id] = size
+                        size += 1
+                self._functions[decl.symbol_id] = _Function(decl.name, size, len(decl.params))
+        main = None
+        for decl in node.decls:
+            if isinstance(decl, FuncDecl):
+                self.visit(decl)
+                if decl.name == "main":
+                    main = self._functions[decl.symbol_id]
+        if main is None:
+            raise Undeclared(FUNCTION, "main")
+        console = self.console
+
+        def run_main():
+            try:
+                main.run([None] * main.size)
+            finally:
+                console.flush()
+
+        return run_main
+
+    def visit_struct_decl(self, node, o: Any = None):
+        return None
+
+    def visit_member_decl(self, node, o: Any = None):
+        return None
+
+    def visit_func_decl(self, node: FuncDecl, o: Any = None):
+        function = self._functions[node.symbol_id]
+        function.run = self._sequence(node.body.statements)
+        return function
+
+    def visit_param(self, node, o: Any = None):
+        return None
+
+    # ========== Types ==========
+    # A type compiles to its zero value, or a struct type to a function
+    # making a zero-valued struct
+
+    def visit_int_type(self, node, o: Any = None):
+        return 0
+
+    def visit_float_type(self, node, o: Any = None):
+        return 0.0
+
+    def visit_string_type(self, node, o: Any = None):
+        return ""
+
+    def visit_void_type(self, node, o: Any = None):
+        return None
+
+    def visit_struct_type(self, node, o: Any = None):
+        layout = self._layouts[node.symbol_id]
+        template = []
+        nested = []
+        for slot, type_ in enumerate(layout.types):
+            zero = self.visit(type_)
+            if isinstance(type_, StructType):
+                nested.append((slot, zero))
+                zero = None
+            template.append(zero)
+
+        def make():
+            value = template.copy()
+            for slot, make_member in nested:
+                value[slot] = make_member()
+            return value
+
+        return make
+
+    # ========== Statements ==========
+
+    def visit_block_stmt(self, node, o: Any = None):
+        return self._sequence(node.statements)
+
+    def visit_var_decl(self, node, o: Any = None):
+        slot = self._slots[node.symbol_id]
+        if node.init_value is not None:
+            value = self._value(node.init_value)
+
+            def declare(frame):
+                frame[slot] = value(frame)
+
+            return declare
+        type_ = node.inferred_type
+        if isinstance(type_, StructType):
+            make = self.visit(type_)
+
+            def declare_struct(frame):
+                frame[slot] = make()
+
+            return declare_struct
+        zero = None if type_ is None else self.visit(type_)
+
+        def declare_zero(frame):
+            frame[slot] = zero
+
+        return declare_zero
+
+    def visit_assign_stmt(self, node, o: Any = None):
+        pass
+
+    def visit_if_stmt(self, node, o: Any = None):
+        condition = self.visit(node.condition)
+        then = self.visit(node.then_stmt)
+        if node.else_stmt is None:
+
+            def if_then(frame):
+                if condition(frame):
+                    return then(frame)
+
+            return if_then
+        otherwise = self.visit(node.else_stmt)
+
+        def if_else(frame):
+            if condition(frame):
+                return then(frame)
+            return otherwise(frame)
+
+        return if_else
+
+    def visit_while_stmt(self, node, o: Any = None):
+        condition = self.visit(node.condition)
+        body = self.visit(node.body)
+
+        def while_(frame):
+            while condition(frame):
+                signal = body(frame)
+                if signal is not None:
+                    if signal == BREAK:
+                        break
+                    if signal == RETURN:
+                        return signal
+
+        return while_
+
+    def visit_for_stmt(self, node, o: Any = None):
+        init = self.visit(node.init) if node.init is not None else None
+        condition = self.visit(node.condition) if node.condition is not None else (lambda frame: 1)
+        update = self._effect(node.update) if node.update is not None else (lambda frame: None)
+        body = self.visit(node.body)
+
+        def for_(frame):
+            if init is not None:
+                init(frame)
+            while condition(frame):
+                signal = body(frame)
+                if signal is not None:
+                    if signal == BREAK:
+                        break
+                    if signal == RETURN:
+                        return signal
+                update(frame)
+
+        return for_
+
+    def visit_switch_stmt(self, node, o: Any = None):
+        value = self.visit(node.expr)
+        codes = []
+        labels = []  # (label closure, index of its first statement)
+        default = None
+        # Clauses in source order, so fall-through may pass the default
+        for clause in node.clauses():
+            if clause is node.default_case:
+                default = len(codes)
+            else:
+                labels.append((self.visit(clause), len(codes)))
+            codes.extend(self.visit(stmt) for stmt in clause.statements)
+        count = len(codes)
+        if default is None:
+            default = count
+
+        def run_from(frame, start):
+            for index in range(start, count):
+                signal = codes[index](frame)
+                if signal is not None:
+                    return None if signal == BREAK else signal
+
+        if all(_is_constant(case.expr) for case in node.cases):
+            table = {}
+            for label, start in labels:
+                try:
+                    table.setdefault(label(None), start)
+                except DivisionByZero:
+                    break
+            else:
+
+                def switch(frame):
+                    return run_from(frame, table.get(value(frame), default))
+
+                return switch
+
+        def switch_labels(frame):
+            key = value(frame)
+            for label, start in labels:
+                if label(frame) == key:
+                    return run_from(frame, start)
+            return run_from(frame, default)
+
+        return switch_labels
+
+    def visit_case_stmt(self, node, o: Any = None):
+        # The label; the statements are compiled by visit_switch_stmt
+        return self.visit(node.expr)
+
+    def visit_default_stmt(self, node, o: Any = None):
+        return self._sequence(node.statements)
+
+    def visit_break_stmt(self, node, o: Any = None):
+        return lambda frame: BREAK
+
+    def visit_continue_stmt(self, node, o: Any = None):
+        return lambda frame: CONTINUE
+
+    def visit_return_stmt(self, node, o: Any = None):
+        if node.expr is None:
+            return lambda frame: RETURN
+        value = self._value(node.expr)
+
+        def return_(frame):
+            frame[0] = value(frame)
+            return RETURN
+
+        return return_
+
+    def visit_expr_stmt(self, node, o: Any = None):
+        return self._effect(node.expr)
+
+    def _effect(self, node):
+        """A closure evaluating node for its side effects that returns None,
+        as statement closures must."""
+        if isinstance(node, AssignExpr):
+            return self.visit_assign_expr(node, True)
+        if isinstance(node, (PrefixOp, PostfixOp)) and node.operator in ("++", "--"):
+            return self._step(node, False, True)
+        code = self.visit(node)
+        if node.inferred_type is VOID_TYPE:
+            return code
+
+        def discard(frame):
+            code(frame)
+
+        return discard
+
+    # ========== Expressions ==========
+
+    def visit_binary_op(self, node, o: Any = None):
+        operator = node.operator
+        left = self.visit(node.left)
+        if operator == "/" or operator == "%":
+            return self._division(node, left, self.visit(node.right))
+        right = node.right
+        if isinstance(right, (IntLiteral, FloatLiteral)) and operator in _BINARY_CONSTANT:
+            return _BINARY_CONSTANT[operator](left, right.value)
+        return _BINARY[operator](left, self.visit(right))
+
+    def _division(self, node, left, right):
+        divisor = node.right
+        if isinstance(divisor, IntLiteral) and divisor.value != 0:
+            return self._division_by_constant(node, left, divisor.value)
+        if node.operator == "%":
+
+            def remainder(frame):
+                a = left(frame)
+                b = right(frame)
+                if b == 0:
+                    raise DivisionByZero(node)
+                r = a % b
+                # Python's remainder takes the divisor's sign, C's the dividend's
+                if r and (a < 0) != (b < 0):
+                    r -= b
+                return r
+
+            return remainder
+        if node.inferred_type is INT_TYPE:
+
+            def divide_int(frame):
+                a = left(frame)
+                b = right(frame)
+                if b == 0:
+                    raise DivisionByZero(node)
+                q = a // b
+                # Round toward zero rather than down
+                if q < 0 and q * b != a:
+                    q += 1
+                return q
+
+            return divide_int
+
+        def divide(frame):
+            a = left(frame)
+            b = right(frame)
+            if b == 0:
+                raise DivisionByZero(node)
+            return a / b
+
+        return divide
+
+    def _division_by_constant(self, node, left, c: int):
+        negative = c < 0
+        if node.operator == "%":
+
+            def remainder_constant(frame):
+                a = left(frame)
+                r = a % c
+                if r and (a < 0) != negative:
+                    r -= c
+                return r
+
+            return remainder_constant
+        if node.inferred_type is INT_TYPE:
+
+            def divide_int_constant(frame):
+                a = left(frame)
+                q = a // c
+                if q < 0 and q * c != a:
+                    q += 1
+                return q
+
+            return divide_int_constant
+        return lambda frame: left(frame) / c
+
+    def visit_prefix_op(self, node, o: Any = None):
+        operator = node.operator
+        if operator in ("++", "--"):
+            return self._step(node, False)
+        operand = self.visit(node.operand)
+        if operator == "+":
+            return operand
+        if operator == "-":
+            return lambda frame: -operand(frame)
+        return lambda frame: 0 if operand(frame) else 1
+
+    def visit_postfix_op(self, node, o: Any = None):
+        return self._step(node, True)
+
+    def _step(self, node, postfix: bool, statement: bool = False):
+        """++ or -- on a variable or member. As a statement the closure
+        returns None; otherwise the value before (postfix) or after."""
+        delta = 1 if node.operator == "++" else -1
+        target = node.operand
+        if isinstance(target, Identifier):
+            slot = self._slots[target.symbol_id]
+            if statement:
+
+                def step_statement(frame):
+                    frame[slot] += delta
+
+                return step_statement
+            if postfix:
+
+                def step_after(frame):
+                    value = frame[slot]
+                    frame[slot] = value + delta
+                    return value
+
+                return step_after
+
+            def step_before(frame):
+                value = frame[slot] = frame[slot] + delta
+                return value
+
+            return step_before
+        obj = self.visit(target.obj)
+        member = target.slot
+
+        def step_member(frame):
+            struct = obj(frame)
+            value = struct[member]
+            struct[member] = value + delta
+            if statement:
+                return None
+            return value if postfix else value + delta
+
+        return step_member
+
+    def visit_assign_expr(self, node, o: Any = None):
+        # o is True when the assignment is a statement of its own
+        value = self._value(node.rhs)
+        lhs = node.lhs
+        if isinstance(lhs, Identifier):
+            slot = self._slots[lhs.symbol_id]
+            if o is True:
+
+                def assign_statement(frame):
+                    frame[slot] = value(frame)
+
+                return assign_statement
+
+            def assign(frame):
+                result = frame[slot] = value(frame)
+                return result
+
+            return assign
+        obj = self.visit(lhs.obj)
+        member = lhs.slot
+
+        def assign_member(frame):
+            struct = obj(frame)
+            result = struct[member] = value(frame)
+            if o is not True:
+                return result
+
+        return assign_member
+
+    def visit_member_access(self, node, o: Any = None):
+        member = node.slot
+        obj = node.obj
+        if isinstance(obj, Identifier):
+            slot = self._slots[obj.symbol_id]
+            return lambda frame: frame[slot][member]
+        code = self.visit(obj)
+        return lambda frame: code(frame)[member]
+
+    def visit_func_call(self, node, o: Any = None):
+        args = [self._value(arg) for arg in node.args]
+        function = self._functions.get(node.symbol_id)
+        if function is None:
+            return self._builtins[node.name](args)
+        pad = [None] * (function.size - 1 - function.params)
+        if not args:
+            size = function.size
+
+            def call0(frame):
+                callee = [None] * size
+                function.run(callee)
+                return callee[0]
+
+            return call0
+        if len(args) == 1:
+            (first,) = args
+
+            def call1(frame):
+                callee = [None, first(frame), *pad]
+                function.run(callee)
+                return callee[0]
+
+            return call1
+        if len(args) == 2:
+            first, second = args
+
+            def call2(frame):
+                callee = [None, first(frame), second(frame), *pad]
+                function.run(callee)
+                return callee[0]
+
+            return call2
+
+        def call(frame):
+            callee = [None]
+            for arg in args:
+                callee.append(arg(frame))
+            callee += pad
+            function.run(callee)
+            return callee[0]
+
+        return call
+
+    def visit_identifier(self, node, o: Any = None):
+        return itemgetter(self._slots[node.symbol_id])
+
+    def visit_struct_literal(self, node, o: Any = None):
+        values = [self._value(value) for value in node.values]
+        return lambda frame: [value(frame) for value in values]
+
+    # ========== Literals ==========
+
+    def visit_int_literal(self, node, o: Any = None):
+        value = node.value
+        return lambda frame: value
+
+    def visit_float_literal(self, node, o: Any = None):
+        value = node.value
+        return lambda frame: value
+
+    def visit_string_literal(self, node, o: Any = None):
+        value = _ESCAPE.sub(lambda match: _ESCAPES[match.group(1)], node.value)
+        return lambda frame: value
+
+
+def interpret(program: Program, stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None) -> None:
+    """Type-check program and run its main function.
+
+    stdin and stdout default to the process's; static errors are raised
+    before anything runs.
+    """
+    infer_types(program)
+    console = Console(stdin or sys.stdin, stdout or sys.stdout)
+    run = Interpreter(console).visit(program)
+    # TyC calls nest a few Python frames deep each, so the program runs on a
+    # deep stack with a raised recursion limit; hitting even that limit is
+    # a runaway recursion in the program
+    try:
+        run_deep(run)
+    except RecursionError:
+        raise StackOverflow() from None
@@ -0,0 +1,27 @@
+"""
+Errors raised while a TyC program runs.
+"""
+
+
+class TyCRuntimeError(Exception):
+    def __str__(self):
+        return self.message
+
+
+class DivisionByZero(TyCRuntimeError):
+    def __init__(self, expr):
+        self.expr = expr
+        self.message = f"Division By Zero: {expr}"
+
+
+class InvalidInput(TyCRuntimeError):
+    def __init__(self, function, text):
+        # text is the line read, "" at end of input
+        self.function = function
+        self.text = text
+        self.message = f"Invalid Input For {function}: {text!r}"
+
+
+class StackOverflow(TyCRuntimeError):
+    def __init__(self):
+        self.message = "Stack Overflow"
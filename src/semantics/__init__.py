@@ -0,0 +1,3 @@
+"""
+Semantic analysis for TyC language
+"""
@@ -0,0 +1,99 @@
+"""
+Call graph of a TyC program and its strongly connected components.
+Vertices are the program's FuncDecls, in source order; there is an edge
+from a function to every user function it calls. Builtins are not part
+of the graph, and neither are calls to undeclared names.
+
+inference_order() groups the functions into strongly connected
+components, callees before callers (reverse topological order), so each
+group can be typed once all the return types it depends on are known.
+Mutually recursive functions share a group. Both the graph walk and
+Tarjan's algorithm use explicit stacks, so call chains of any depth work.
+"""
+
+from typing import Dict, List
+
+from src.utils.nodes import FuncCall, FuncDecl, Program, walk
+
+
+def call_graph(functions: List[FuncDecl]) -> List[List[int]]:
+    """callees[i] lists the indices of the functions functions[i] calls,
+    in order of first call.
+
+    A name declared twice resolves to its last declaration.
+    """
+    index: Dict[str, int] = {decl.name: i for i, decl in enumerate(functions)}
+    graph = []
+    for decl in functions:
+        callees = {}
+        for node in walk(decl.body):
+            if type(node) is FuncCall:
+                callee = index.get(node.name)
+                if callee is not None:
+                    callees[callee] = None
+        graph.append(list(callees))
+    return graph
+
+
+def strongly_connected_components(graph: List[List[int]]) -> List[List[int]]:
+    """Tarjan's algorithm over vertices 0..len(graph)-1.
+
+    Components come out in reverse topological order: every edge leaving a
+    component points into one listed earlier. Vertices within a component
+    are sorted.
+    """
+    count = len(graph)
+    order = [-1] * count  # discovery order, -1 until visited
+    low = [0] * count
+    on_stack = [False] * count
+    stack = []
+    components = []
+    counter = 0
+    for root in range(count):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Frames of (vertex, position of the next edge to follow)
+        frames = [(root, 0)]
+        while frames:
+            vertex, position = frames[-1]
+            edges = graph[vertex]
+            if position < len(edges):
+                frames[-1] = (vertex, position + 1)
+                target = edges[position]
+                if order[target] < 0:
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    frames.append((target, 0))
+                elif on_stack[target] and order[target] < low[vertex]:
+                    low[vertex] = order[target]
+                continue
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                if low[vertex] < low[parent]:
+                    low[parent] = low[vertex]
+            if low[vertex] == order[vertex]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == vertex:
+                        break
+                component.sort()
+                components.append(component)
+    return components
+
+
+def inference_order(program: Program) -> List[List[FuncDecl]]:
+    """The program's functions grouped into strongly connected components
+    of the call graph, callees first."""
+    functions = [decl for decl in program.decls if isinstance(decl, FuncDecl)]
+    components = strongly_connected_components(call_graph(functions))
+    return [[functions[i] for i in component] for component in components]
@@ -0,0 +1,44 @@
+"""
+Static errors reported by TyC semantic analysis.
+Messages quote the offending statement or expression in its AST string
+form, e.g. "Type Cannot Be Inferred: VarDecl(auto, y = Identifier(x))".
+"""
+
+
+class StaticError(Exception):
+    def __str__(self):
+        return self.message
+
+
+class Undeclared(StaticError):
+    def __init__(self, kind, name):
+        # kind is "Variable", "Function" or "Struct"
+        self.kind = kind
+        self.name = name
+        self.message = f"Undeclared {kind}: {name}"
+
+
+class Redeclared(StaticError):
+    def __init__(self, kind, name):
+        # kind is "Variable", "Parameter", "Member", "Function" or "Struct"
+        self.kind = kind
+        self.name = name
+        self.message = f"Redeclared {kind}: {name}"
+
+
+class TypeMismatchInExpression(StaticError):
+    def __init__(self, expr):
+        self.expr = expr
+        self.message = f"Type Mismatch In Expression: {expr}"
+
+
+class TypeMismatchInStatement(StaticError):
+    def __init__(self, stmt):
+        self.stmt = stmt
+        self.message = f"Type Mismatch In Statement: {stmt}"
+
+
+class TypeCannotBeInferred(StaticError):
+    def __init__(self, stmt):
+        self.stmt = stmt
+        self.message = f"Type Cannot Be Inferred: {stmt}"
@@ -0,0 +1,95 @@
+"""
+Struct layouts for TyC (see "Struct Declaration" in the specification).
+A StructLayout fixes the slot order of a struct's members, which is their
+declaration order, and maps each member name to its (slot index, type) in
+one dict. Struct literals list their values in that order and a struct
+value can be stored as a flat list of slots, so once a member access knows
+its slot, reading or writing the member is a single index.
+
+build_layouts() lays out every StructDecl of a program once, in source
+order, and stores the layout in the decl's layout slot. Member types must
+name a struct declared earlier; that rule also rules out recursive structs
+(a struct containing itself directly or through other structs), since one
+of the structs on the cycle would have to name a later one. Both undefined
+and recursive member types therefore raise Undeclared Struct when the
+layout is built, not at each use.
+
+Type inference (see type_inference.py) fills in the rest: each
+MemberAccess gets the slot of its member and each StructLiteral the layout
+of the struct it builds, as soon as the struct type is known.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from src.astgen.interning import PRIMITIVE_TYPES
+from src.semantics.static_error import Redeclared, Undeclared
+from src.semantics.symbol_table import MEMBER, STRUCT
+from src.utils.nodes import Program, StructDecl, StructType, Type
+
+# Member types are the shared instances, as in type inference
+_PRIMITIVES = {type(type_): type_ for type_ in PRIMITIVE_TYPES.values()}
+
+
+class StructLayout:
+    """The members of a struct in slot order. type is the struct's
+    canonical StructType, which member types of other structs share."""
+
+    __slots__ = ("name", "type", "names", "types", "index")
+
+    def __init__(self, name: str, symbol_id: Optional[int] = None):
+        self.name = name
+        self.type = StructType(name)
+        self.type.symbol_id = symbol_id
+        self.names: List[str] = []
+        self.types: List[Type] = []
+        # member name -> (slot index, member type)
+        self.index: Dict[str, Tuple[int, Type]] = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"StructLayout({self.name}, {self.names})"
+
+    def add(self, name: str, type_: Type) -> int:
+        """Append a member in the next slot and return its index."""
+        if name in self.index:
+            raise Redeclared(MEMBER, name)
+        slot = len(self.names)
+        self.names.append(name)
+        self.types.append(type_)
+        self.index[name] = (slot, type_)
+        return slot
+
+    def slot(self, name: str) -> Optional[int]:
+        """The slot index of member name, or None if there is no such member."""
+        entry = self.index.get(name)
+        return None if entry is None else entry[0]
+
+
+def build_layouts(program: Program) -> Dict[str, StructLayout]:
+    """Lay out the structs of program in source order; return them by name.
+
+    Raises Redeclared for a duplicate struct or member and Undeclared for a
+    member type that names no earlier struct.
+    """
+    layouts: Dict[str, StructLayout] = {}
+    for decl in program.decls:
+        if not isinstance(decl, StructDecl):
+            continue
+        if decl.name in layouts:
+            raise Redeclared(STRUCT, decl.name)
+        layout = StructLayout(decl.name, decl.symbol_id)
+        for member in decl.members:
+            type_ = member.member_type
+            if isinstance(type_, StructType):
+                # Not yet in layouts: undefined, this struct or a later one
+                inner = layouts.get(type_.struct_name)
+                if inner is None:
+                    raise Undeclared(STRUCT, type_.struct_name)
+                type_ = inner.type
+            else:
+                type_ = _PRIMITIVES[type(type_)]
+            layout.add(member.name, type_)
+        decl.layout = layouts[decl.name] = layout
+    return layouts
@@ -0,0 +1,237 @@
+"""
+Symbol table and name resolution for TyC (see "Scope Rules" in the
+specification).
+Struct and function names are global. Variables and parameters are local
+and visible from their declaration to the end of the enclosing block,
+for statement or switch statement. A function's parameters share a scope
+with the outermost block of its body, and inner scopes may shadow outer
+names.
+
+SymbolTable keeps one flat dict from each name to the symbol currently
+visible under it, plus an undo log of the bindings each declaration
+shadowed. Lookup is a single dict access whatever the nesting depth.
+push() records a mark, and pop() restores the shadowed bindings back to
+that mark, so both cost O(1) plus the names the scope declared.
+
+NameResolver gives every declaration a Symbol and stores the symbol's ID
+in the symbol_id slot of the declaring node and of every Identifier,
+FuncCall and StructType that names it. Later passes index per-symbol
+tables by ID instead of looking names up. IDs are dense and follow a
+fixed order: builtins, then structs, functions and local variables in
+source order. The same program therefore always gets the same IDs.
+"""
+
+from typing import Dict, List, Optional
+
+from src.astgen.interning import FLOAT_TYPE, INT_TYPE, STRING_TYPE, VOID_TYPE
+from src.semantics.static_error import Redeclared, Undeclared
+from src.utils.nodes import FuncDecl, Program, StructDecl
+from src.utils.visitor import BaseVisitor
+
+# name -> (parameter types, return type) of the I/O functions
+BUILTINS = {
+    "readInt": ((), INT_TYPE),
+    "readFloat": ((), FLOAT_TYPE),
+    "readString": ((), STRING_TYPE),
+    "printInt": ((INT_TYPE,), VOID_TYPE),
+    "printFloat": ((FLOAT_TYPE,), VOID_TYPE),
+    "printString": ((STRING_TYPE,), VOID_TYPE),
+}
+
+VARIABLE = "Variable"
+PARAMETER = "Parameter"
+MEMBER = "Member"
+FUNCTION = "Function"
+STRUCT = "Struct"
+
+
+class Symbol:
+    """A declared name. decl is the declaring node, None for builtins;
+    depth is the scope depth it was declared at (0 for globals)."""
+
+    __slots__ = ("id", "name", "kind", "decl", "depth")
+
+    def __init__(self, id: int, name: str, kind: str, decl, depth: int = 0):
+        self.id = id
+        self.name = name
+        self.kind = kind
+        self.decl = decl
+        self.depth = depth
+
+    def __repr__(self):
+        return f"Symbol({self.id}, {self.name!r}, {self.kind})"
+
+
+class SymbolTable:
+    """Nested scopes of local symbols: a flat name -> innermost symbol map
+    with an undo log."""
+
+    __slots__ = ("_visible", "_undo", "_marks")
+
+    def __init__(self):
+        self._visible: Dict[str, Symbol] = {}
+        # (name, symbol it shadowed or None) per declaration, innermost last
+        self._undo: List[tuple] = []
+        self._marks: List[int] = []
+
+    @property
+    def depth(self) -> int:
+        """Number of open scopes."""
+        return len(self._marks)
+
+    def push(self) -> None:
+        """Open a scope."""
+        self._marks.append(len(self._undo))
+
+    def pop(self) -> None:
+        """Close the innermost scope, making what it shadowed visible again."""
+        mark = self._marks.pop()
+        visible = self._visible
+        undo = self._undo
+        while len(undo) > mark:
+            name, shadowed = undo.pop()
+            if shadowed is None:
+                del visible[name]
+            else:
+                visible[name] = shadowed
+
+    def declare(self, symbol: Symbol) -> None:
+        """Make symbol visible in the innermost scope."""
+        symbol.depth = len(self._marks)
+        self._undo.append((symbol.name, self._visible.get(symbol.name)))
+        self._visible[symbol.name] = symbol
+
+    def lookup(self, name: str) -> Optional[Symbol]:
+        """The innermost visible symbol called name, or None."""
+        return self._visible.get(name)
+
+    def declared_here(self, name: str) -> bool:
+        """Whether name is declared in the innermost scope itself."""
+        symbol = self._visible.get(name)
+        return symbol is not None and symbol.depth == len(self._marks)
+
+
+class NameResolver(BaseVisitor):
+    """Resolves every name in a Program to a Symbol; see the module
+    docstring.
+
+    visit(program) annotates the tree in place and raises Undeclared or
+    Redeclared for the first problem found. symbols[i] is the symbol with
+    ID i.
+    """
+
+    def __init__(self):
+        self.symbols: List[Symbol] = []
+        self.structs: Dict[str, Symbol] = {}
+        self.functions: Dict[str, Symbol] = {}
+        self.locals = SymbolTable()
+        for name in BUILTINS:
+            self.functions[name] = self._new_symbol(name, FUNCTION, None)
+
+    def _new_symbol(self, name: str, kind: str, decl) -> Symbol:
+        symbol = Symbol(len(self.symbols), name, kind, decl)
+        self.symbols.append(symbol)
+        return symbol
+
+    def _declare_local(self, node, kind: str) -> None:
+        if self.locals.declared_here(node.name):
+            raise Redeclared(kind, node.name)
+        symbol = self._new_symbol(node.name, kind, node)
+        self.locals.declare(symbol)
+        node.symbol_id = symbol.id
+
+    def visit_program(self, node: Program, o=None):
+        for decl in node.decls:
+            if isinstance(decl, StructDecl):
+                self.visit(decl)
+        for decl in node.decls:
+            if isinstance(decl, FuncDecl):
+                if decl.name in self.functions:
+                    raise Redeclared(FUNCTION, decl.name)
+                symbol = self.functions[decl.name] = self._new_symbol(decl.name, FUNCTION, decl)
+                decl.symbol_id = symbol.id
+        for decl in node.decls:
+            if isinstance(decl, FuncDecl):
+                self.visit(decl)
+        return node
+
+    def visit_struct_decl(self, node, o=None):
+        # Members may only use structs declared earlier, not this one
+        if node.name in self.structs:
+            raise Redeclared(STRUCT, node.name)
+        names = set()
+        for member in node.members:
+            if member.name in names:
+                raise Redeclared(MEMBER, member.name)
+            names.add(member.name)
+            self.visit(member)
+        symbol = self.structs[node.name] = self._new_symbol(node.name, STRUCT, node)
+        node.symbol_id = symbol.id
+
+    def visit_func_decl(self, node, o=None):
+        if node.return_type is not None:
+            self.visit(node.return_type)
+        self.locals.push()
+        for param in node.params:
+            self.visit(param)
+        # The body's outermost block shares the parameters' scope
+        for stmt in node.body.statements:
+            self.visit(stmt)
+        self.locals.pop()
+
+    def visit_param(self, node, o=None):
+        self.visit(node.param_type)
+        self._declare_local(node, PARAMETER)
+
+    def visit_struct_type(self, node, o=None):
+        symbol = self.structs.get(node.struct_name)
+        if symbol is None:
+            raise Undeclared(STRUCT, node.struct_name)
+        node.symbol_id = symbol.id
+
+    def visit_block_stmt(self, node, o=None):
+        self.locals.push()
+        for stmt in node.statements:
+            self.visit(stmt)
+        self.locals.pop()
+
+    def visit_var_decl(self, node, o=None):
+        if node.var_type is not None:
+            self.visit(node.var_type)
+        # The initializer cannot see the variable it initializes
+        if node.init_value is not None:
+            self.visit(node.init_value)
+        self._declare_local(node, VARIABLE)
+
+    def visit_for_stmt(self, node, o=None):
+        self.locals.push()
+        super().visit_for_stmt(node, o)
+        self.locals.pop()
+
+    def visit_switch_stmt(self, node, o=None):
+        self.visit(node.expr)
+        self.locals.push()
+        for clause in node.clauses():
+            self.visit(clause)
+        self.locals.pop()
+
+    def visit_func_call(self, node, o=None):
+        symbol = self.functions.get(node.name)
+        if symbol is None:
+            raise Undeclared(FUNCTION, node.name)
+        node.symbol_id = symbol.id
+        for arg in node.args:
+            self.visit(arg)
+
+    def visit_identifier(self, node, o=None):
+        symbol = self.locals.lookup(node.name)
+        if symbol is None:
+            raise Undeclared(VARIABLE, node.name)
+        node.symbol_id = symbol.id
+
+
+def resolve_names(program: Program) -> List[Symbol]:
+    """Resolve the names of program in place; return its symbols by ID."""
+    resolver = NameResolver()
+    resolver.visit(program)
+    return resolver.symbols
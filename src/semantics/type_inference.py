@@ -0,0 +1,522 @@
+"""
+Type inference for TyC (see "Type Inference" in the specification).
+TypeInference is an ASTVisitor that gives every expression, auto variable
+and omitted return type a type variable, and turns each typing rule into
+constraints between type variables. A union-find unifier solves the
+constraints as they are collected: type variables are grouped into
+classes, each class is bound to at most one concrete type, and merging or
+binding classes takes near-constant amortized time. A program is typed in
+a single pass in near-linear time, with no re-scanning until nothing
+changes. Constraints are applied in source order, so the first usage that
+determines an auto variable's type fixes it and later conflicting uses are
+mismatches.
+
+Names are resolved first (see symbol_table.py), and whatever the pass
+knows about a variable, function or struct lives in a list indexed by its
+symbol ID.
+
+Functions are visited once each, in the order of call_graph.py: strongly
+connected components of the call graph, callees first. An omitted return
+type is therefore fixed by the function's own return statements before
+any caller uses it, and mutually recursive functions are solved together.
+
+Rules that are not plain equalities wait on the classes they depend on
+and run once those are bound: operand checks, the int or float result of
+arithmetic, member access and struct literals. After each component, an
+arithmetic or relational operand that is still open takes the type the
+operator's result already has, or else the other operand's type. An
+expression whose type is still unknown after that raises
+TypeCannotBeInferred for its statement.
+
+Results go in the inferred_type slot of every Expr, VarDecl and FuncDecl
+(its return type). They are the shared primitive types of interning.py,
+or one StructType instance per struct. Unused auto variables keep None.
+Each MemberAccess also gets the slot index of its member and each
+StructLiteral the layout of its struct (see struct_layout.py).
+"""
+
+from collections import deque
+from functools import partial
+from typing import Any, List, Optional
+
+from src.astgen.interning import FLOAT_TYPE, INT_TYPE, STRING_TYPE, VOID_TYPE
+from src.semantics.call_graph import inference_order
+from src.semantics.static_error import TypeCannotBeInferred, TypeMismatchInExpression, TypeMismatchInStatement
+from src.semantics.struct_layout import StructLayout, build_layouts
+from src.semantics.symbol_table import BUILTINS, NameResolver
+from src.utils.nodes import AssignExpr, FuncDecl, Program, Stmt, StructDecl, StructType, Type
+from src.utils.visitor import ASTVisitor
+
+_INT_OPERATORS = ("%", "&&", "||")
+_ARITHMETIC_OPERATORS = ("+", "-", "*", "/")
+
+
+def _mismatch(node):
+    if isinstance(node, Stmt):
+        return TypeMismatchInStatement(node)
+    return TypeMismatchInExpression(node)
+
+
+class _Operands:
+    """Pending check of the operands of a binary +, -, *, / or relational
+    operator; result is None for relational operators (always int)."""
+
+    __slots__ = ("node", "left", "right", "result", "done")
+
+    def __init__(self, node, left: int, right: int, result: Optional[int]):
+        self.node = node
+        self.left = left
+        self.right = right
+        self.result = result
+        self.done = False
+
+
+class TypeInference(ASTVisitor):
+    """Infers and checks the types of a Program; see the module docstring.
+
+    visit(program) annotates the tree in place and raises a StaticError for
+    the first problem found.
+    """
+
+    def __init__(self):
+        # Union-find forest over type variables 0..n-1
+        self._parent: List[int] = []
+        self._rank: List[int] = []
+        self._bound: List[Optional[Type]] = []  # concrete type of each root
+        self._waiting: List[Optional[list]] = []  # callbacks of unbound roots
+        self._ready = deque()
+        self._running = False
+        self._defaulting = False
+        # By symbol ID (see symbol_table.py): the type variable of a local,
+        # (parameter types, return type variable) of a function or the
+        # StructLayout of a struct
+        self._symbols: List[Any] = []
+        self._typed: List[tuple] = []  # (expression, variable, statement)
+        self._decls: List[tuple] = []  # (VarDecl or FuncDecl, variable)
+        self._operands: List[_Operands] = []
+        self._stmt = None
+        self._function = None
+        self._returns = None
+        self._returns_value = False
+        self._bare_return = None
+
+    # ========== Union-find ==========
+
+    def new_var(self, bound: Optional[Type] = None) -> int:
+        """A fresh type variable, optionally bound to a concrete type."""
+        var = len(self._parent)
+        self._parent.append(var)
+        self._rank.append(0)
+        self._bound.append(bound)
+        self._waiting.append(None)
+        return var
+
+    def find(self, var: int) -> int:
+        parent = self._parent
+        while parent[var] != var:
+            parent[var] = parent[parent[var]]
+            var = parent[var]
+        return var
+
+    def type_of(self, var: int) -> Optional[Type]:
+        """The concrete type of var's class, or None while it is open."""
+        return self._bound[self.find(var)]
+
+    def bind(self, var: int, type_: Type, node) -> None:
+        """Bind var's class to type_; node is blamed for a conflict."""
+        root = self.find(var)
+        bound = self._bound[root]
+        if bound is None:
+            self._bound[root] = type_
+            self._wake(root)
+        elif bound is not type_:
+            raise _mismatch(node)
+
+    def unify(self, a: int, b: int, node) -> None:
+        """Merge the classes of a and b; node is blamed for a conflict."""
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return
+        rank = self._rank
+        if rank[a] < rank[b]:
+            a, b = b, a
+        bound_a, bound_b = self._bound[a], self._bound[b]
+        if bound_a is not None and bound_b is not None and bound_a is not bound_b:
+            raise _mismatch(node)
+        self._parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        waiting_a, waiting_b = self._waiting[a], self._waiting[b]
+        self._waiting[b] = None
+        if bound_a is None and bound_b is None:
+            if waiting_b:
+                if waiting_a is None:
+                    self._waiting[a] = waiting_b
+                else:
+                    # Nest rather than copy, so merging stays O(1)
+                    waiting_a.append(waiting_b)
+        elif bound_a is None:
+            self._bound[a] = bound_b
+            self._wake(a)
+        elif waiting_b:
+            self._ready.append(waiting_b)
+            self._run()
+
+    def when_bound(self, var: int, callback) -> None:
+        """Call callback() once var's class is bound (now, if it is)."""
+        root = self.find(var)
+        if self._bound[root] is not None:
+            callback()
+        elif self._waiting[root] is None:
+            self._waiting[root] = [callback]
+        else:
+            self._waiting[root].append(callback)
+
+    def _wake(self, root: int) -> None:
+        waiting = self._waiting[root]
+        if waiting:
+            self._waiting[root] = None
+            self._ready.append(waiting)
+            self._run()
+
+    def _run(self) -> None:
+        # Callbacks may bind further classes; they queue up here instead of
+        # recursing
+        if self._running:
+            return
+        self._running = True
+        ready = self._ready
+        try:
+            while ready:
+                item = ready.popleft()
+                if type(item) is list:
+                    ready.extend(item)
+                else:
+                    item()
+        finally:
+            ready.clear()
+            self._running = False
+
+    # ========== Rules ==========
+
+    def _typed_expr(self, node, var: int) -> int:
+        self._typed.append((node, var, self._stmt))
+        return var
+
+    def _struct_of(self, type_: Optional[Type]) -> Optional[StructLayout]:
+        if isinstance(type_, StructType):
+            return self._symbols[type_.symbol_id]
+        return None
+
+    def _check_numeric(self, node, var: int) -> None:
+        if self.type_of(var) not in (INT_TYPE, FLOAT_TYPE):
+            raise TypeMismatchInExpression(node)
+
+    def _not_void(self, var: int, stmt) -> None:
+        def check():
+            if self.type_of(var) is VOID_TYPE:
+                raise TypeMismatchInStatement(stmt)
+
+        self.when_bound(var, check)
+
+    def _check_operands(self, constraint: _Operands) -> None:
+        if constraint.done:
+            return
+        left = self.type_of(constraint.left)
+        right = self.type_of(constraint.right)
+        for type_ in (left, right):
+            if type_ is not None and type_ is not INT_TYPE and type_ is not FLOAT_TYPE:
+                raise TypeMismatchInExpression(constraint.node)
+        if left is None or right is None:
+            if not self._defaulting:
+                return
+            target = None if constraint.result is None else self.type_of(constraint.result)
+            if target is None:
+                target = left if right is None else right
+            if target is None:
+                return
+            # Binding wakes this constraint again to finish it
+            for var in (constraint.left, constraint.right):
+                if self.type_of(var) is None:
+                    self.bind(var, target, constraint.node)
+            return
+        constraint.done = True
+        if constraint.result is not None:
+            result = INT_TYPE if left is INT_TYPE and right is INT_TYPE else FLOAT_TYPE
+            self.bind(constraint.result, result, constraint.node)
+
+    def _solve(self) -> None:
+        """Default the open operands collected since the last call, then
+        check and record the types of the expressions collected since."""
+        self._defaulting = True
+        for constraint in self._operands:
+            self._check_operands(constraint)
+        self._defaulting = False
+        for node, var, stmt in self._typed:
+            type_ = self.type_of(var)
+            if type_ is None:
+                raise TypeCannotBeInferred(stmt)
+            node.inferred_type = type_
+        self._operands.clear()
+        self._typed.clear()
+
+    # ========== Program and declarations ==========
+
+    def visit_program(self, node: Program, o: Any = None):
+        resolver = NameResolver()
+        resolver.visit(node)
+        self._symbols = [None] * len(resolver.symbols)
+        for name, (params, returns) in BUILTINS.items():
+            self._symbols[resolver.functions[name].id] = (params, self.new_var(returns))
+        # Struct and function names are global, so collect them all first
+        build_layouts(node)
+        for decl in node.decls:
+            if isinstance(decl, StructDecl):
+                self._symbols[decl.symbol_id] = decl.layout
+        for decl in node.decls:
+            if isinstance(decl, FuncDecl):
+                params = tuple(self.visit(param) for param in decl.params)
+                returns = self.new_var(None if decl.return_type is None else self.visit(decl.return_type))
+                self._symbols[decl.symbol_id] = (params, returns)
+                self._decls.append((decl, returns))
+        # Callees before callers: each group of mutually recursive
+        # functions is typed, and its open types resolved, once the return
+        # types it calls are known
+        for component in inference_order(node):
+            for decl in component:
+                self.visit(decl)
+            self._solve()
+        for decl, var in self._decls:
+            decl.inferred_type = self.type_of(var)
+        return node
+
+    def visit_struct_decl(self, node: StructDecl, o: Any = None):
+        # Laid out by build_layouts() in visit_program
+        return node.layout
+
+    def visit_member_decl(self, node, o: Any = None):
+        return self.visit(node.member_type)
+
+    def visit_func_decl(self, node: FuncDecl, o: Any = None):
+        params, returns = self._symbols[node.symbol_id]
+        self._function = node
+        self._returns = returns
+        self._returns_value = False
+        self._bare_return = None
+        for param, type_ in zip(node.params, params):
+            self._symbols[param.symbol_id] = self.new_var(type_)
+        self.visit(node.body)
+        if node.return_type is None:
+            # Rule 5: without a return with a value the function is void
+            if not self._returns_value:
+                self.bind(returns, VOID_TYPE, self._bare_return or node.body)
+
+    def visit_param(self, node, o: Any = None):
+        return self.visit(node.param_type)
+
+    # ========== Types ==========
+
+    def visit_int_type(self, node, o: Any = None):
+        return INT_TYPE
+
+    def visit_float_type(self, node, o: Any = None):
+        return FLOAT_TYPE
+
+    def visit_string_type(self, node, o: Any = None):
+        return STRING_TYPE
+
+    def visit_void_type(self, node, o: Any = None):
+        return VOID_TYPE
+
+    def visit_struct_type(self, node, o: Any = None):
+        return self._symbols[node.symbol_id].type
+
+    # ========== Statements ==========
+
+    def visit_block_stmt(self, node, o: Any = None):
+        for stmt in node.statements:
+            self.visit(stmt)
+
+    def visit_var_decl(self, node, o: Any = None):
+        self._stmt = node
+        var = self.new_var(None if node.var_type is None else self.visit(node.var_type))
+        if node.init_value is not None:
+            init = self.visit(node.init_value)
+            self._not_void(init, node)
+            self.unify(var, init, node)
+        self._symbols[node.symbol_id] = var
+        self._decls.append((node, var))
+
+    def visit_assign_stmt(self, node, o: Any = None):
+        pass
+
+    def visit_if_stmt(self, node, o: Any = None):
+        self._stmt = node
+        self.bind(self.visit(node.condition), INT_TYPE, node)
+        self.visit(node.then_stmt)
+        if node.else_stmt is not None:
+            self.visit(node.else_stmt)
+
+    def visit_while_stmt(self, node, o: Any = None):
+        self._stmt = node
+        self.bind(self.visit(node.condition), INT_TYPE, node)
+        self.visit(node.body)
+
+    def visit_for_stmt(self, node, o: Any = None):
+        if node.init is not None:
+            self.visit(node.init)
+        self._stmt = node
+        if node.condition is not None:
+            self.bind(self.visit(node.condition), INT_TYPE, node)
+        if node.update is not None:
+            self.visit(node.update)
+        self.visit(node.body)
+
+    def visit_switch_stmt(self, node, o: Any = None):
+        self._stmt = node
+        self.bind(self.visit(node.expr), INT_TYPE, node)
+        for clause in node.clauses():
+            self.visit(clause, node)
+
+    def visit_case_stmt(self, node, o: Any = None):
+        self._stmt = o
+        self.bind(self.visit(node.expr), INT_TYPE, o)
+        for stmt in node.statements:
+            self.visit(stmt)
+
+    def visit_default_stmt(self, node, o: Any = None):
+        for stmt in node.statements:
+            self.visit(stmt)
+
+    def visit_break_stmt(self, node, o: Any = None):
+        pass
+
+    def visit_continue_stmt(self, node, o: Any = None):
+        pass
+
+    def visit_return_stmt(self, node, o: Any = None):
+        self._stmt = node
+        inferred = self._function.return_type is None
+        if node.expr is None:
+            if not inferred or self._returns_value:
+                self.bind(self._returns, VOID_TYPE, node)
+            elif self._bare_return is None:
+                self._bare_return = node
+            return
+        value = self.visit(node.expr)
+        if inferred and self._bare_return is not None:
+            # The first return with a value sets a non-void type
+            raise TypeMismatchInStatement(self._bare_return)
+        self._returns_value = True
+        self.unify(self._returns, value, node)
+
+    def visit_expr_stmt(self, node, o: Any = None):
+        self._stmt = node
+        # An assignment statement reports mismatches as the statement's
+        self.visit(node.expr, node if isinstance(node.expr, AssignExpr) else None)
+
+    # ========== Expressions ==========
+
+    def visit_binary_op(self, node, o: Any = None):
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if node.operator in _INT_OPERATORS:
+            self.bind(left, INT_TYPE, node)
+            self.bind(right, INT_TYPE, node)
+            return self._typed_expr(node, self.new_var(INT_TYPE))
+        if node.operator in _ARITHMETIC_OPERATORS:
+            result = self.new_var()
+            constraint = _Operands(node, left, right, result)
+        else:
+            result = self.new_var(INT_TYPE)
+            constraint = _Operands(node, left, right, None)
+        self._operands.append(constraint)
+        check = partial(self._check_operands, constraint)
+        self.when_bound(left, check)
+        self.when_bound(right, check)
+        return self._typed_expr(node, result)
+
+    def visit_prefix_op(self, node, o: Any = None):
+        operand = self.visit(node.operand)
+        if node.operator in ("+", "-"):
+            self.when_bound(operand, partial(self._check_numeric, node, operand))
+            return self._typed_expr(node, operand)
+        self.bind(operand, INT_TYPE, node)
+        return self._typed_expr(node, self.new_var(INT_TYPE))
+
+    def visit_postfix_op(self, node, o: Any = None):
+        self.bind(self.visit(node.operand), INT_TYPE, node)
+        return self._typed_expr(node, self.new_var(INT_TYPE))
+
+    def visit_assign_expr(self, node, o: Any = None):
+        lhs = self.visit(node.lhs)
+        rhs = self.visit(node.rhs)
+        blame = o or node
+        if isinstance(blame, Stmt):
+            self._not_void(rhs, blame)
+        self.unify(lhs, rhs, blame)
+        return self._typed_expr(node, lhs)
+
+    def visit_member_access(self, node, o: Any = None):
+        obj = self.visit(node.obj)
+        result = self.new_var()
+
+        def resolve():
+            layout = self._struct_of(self.type_of(obj))
+            member = None if layout is None else layout.index.get(node.member)
+            if member is None:
+                raise TypeMismatchInExpression(node)
+            node.slot, member_type = member
+            self.bind(result, member_type, node)
+
+        self.when_bound(obj, resolve)
+        return self._typed_expr(node, result)
+
+    def visit_func_call(self, node, o: Any = None):
+        params, returns = self._symbols[node.symbol_id]
+        args = [self.visit(arg) for arg in node.args]
+        if len(args) != len(params):
+            raise TypeMismatchInExpression(node)
+        for arg, param in zip(args, params):
+            self.bind(arg, param, node)
+        return self._typed_expr(node, returns)
+
+    def visit_identifier(self, node, o: Any = None):
+        return self._typed_expr(node, self._symbols[node.symbol_id])
+
+    def visit_struct_literal(self, node, o: Any = None):
+        # The type comes from context: a declaration, assignment, argument,
+        # member or return type
+        values = [self.visit(value) for value in node.values]
+        var = self.new_var()
+
+        def resolve():
+            layout = self._struct_of(self.type_of(var))
+            if layout is None or len(layout) != len(values):
+                raise TypeMismatchInExpression(node)
+            node.layout = layout
+            for value, member_type in zip(values, layout.types):
+                self.bind(value, member_type, node)
+
+        self.when_bound(var, resolve)
+        return self._typed_expr(node, var)
+
+    # ========== Literals ==========
+
+    def visit_int_literal(self, node, o: Any = None):
+        return self._typed_expr(node, self.new_var(INT_TYPE))
+
+    def visit_float_literal(self, node, o: Any = None):
+        return self._typed_expr(node, self.new_var(FLOAT_TYPE))
+
+    def visit_string_literal(self, node, o: Any = None):
+        return self._typed_expr(node, self.new_var(STRING_TYPE))
+
+
+def infer_types(program: Program) -> Program:
+    """Infer and check the types of program in place and return it.
+
+    Raises a StaticError (see static_error.py) for the first problem.
+    """
+    return TypeInference().visit(program)
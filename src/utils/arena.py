@@ -0,0 +1,338 @@
+"""
+Array-backed AST arena for TyC programs.
+An Arena stores a whole tree in parallel typed arrays instead of one Python
+object per node: each node is an index with a kind, a source position, its
+first child, its next sibling and a payload. Names, operators and string
+values live once in a shared string table, numeric literal values in a
+constant table.
+
+Nodes are laid out in pre-order, so a node's first child (if any) is the
+next index and every descendant comes after it. Field values are encoded as
+children in _fields order: a node field becomes that node, a list field a
+LIST node whose children are the items, and an unset optional field a NONE
+node. The one scalar field a node class may have is the payload.
+
+ArenaCursor gives read-only access to one node and exposes the same field
+names as the node classes, so visitors that only read fields can walk an
+arena through cursor.accept(). Arena.from_node() and Arena.to_node()
+convert from and to the object AST in nodes.py; to_node() gives primitive
+types without a position the shared instances from interning.PRIMITIVE_TYPES,
+as ASTGeneration does.
+"""
+
+import inspect
+import sys
+import typing
+from array import array
+from typing import Any
+
+from src.astgen.interning import PRIMITIVE_TYPES
+
+from . import nodes
+from .nodes import ASTNode
+
+# Concrete node classes in declaration order; kind codes index this tuple
+NODE_CLASSES = tuple(
+    cls
+    for cls in vars(nodes).values()
+    if inspect.isclass(cls) and issubclass(cls, ASTNode) and not inspect.isabstract(cls)
+)
+LIST = len(NODE_CLASSES)
+NONE = LIST + 1
+
+_KIND_OF = {cls: kind for kind, cls in enumerate(NODE_CLASSES)}
+_HANDLER_NAMES = tuple(cls._visit_name for cls in NODE_CLASSES)
+_SHARED = {_KIND_OF[type(type_)]: type_ for type_ in PRIMITIVE_TYPES.values()}
+
+
+def _scalar_field(cls):
+    """(name, position in _fields, uses the string table) for cls's scalar
+    field, or None."""
+    hints = typing.get_type_hints(cls.__init__, vars(nodes))
+    for position, name in enumerate(cls._fields):
+        if hints.get(name) in (str, int, float):
+            return name, position, hints[name] is str
+    return None
+
+
+_SCALARS = tuple(_scalar_field(cls) for cls in NODE_CLASSES)
+# Fields stored as children, per kind
+_CHILD_FIELDS = tuple(
+    tuple(name for name in cls._fields if scalar is None or name != scalar[0])
+    for cls, scalar in zip(NODE_CLASSES, _SCALARS)
+)
+
+
+class Arena:
+    """A TyC AST stored in parallel arrays; build one with from_node().
+
+    Index 0 is the root. 0 in first_child or next_sibling means "none",
+    since the root is nobody's child or sibling. Lines are stored as-is and
+    columns plus one, with 0 meaning the node has no position.
+    """
+
+    __slots__ = ("kind", "line", "column", "first_child", "next_sibling", "payload",
+                 "strings", "constants")
+
+    def __init__(self):
+        self.kind = array("B")
+        self.line = array("I")
+        self.column = array("I")
+        self.first_child = array("I")
+        self.next_sibling = array("I")
+        self.payload = array("I")
+        self.strings = []
+        self.constants = []
+
+    @classmethod
+    def from_node(cls, root: ASTNode) -> "Arena":
+        """Encode the tree under root. Shared nodes are stored per occurrence."""
+        arena = cls()
+        kind, line, column = arena.kind, arena.line, arena.column
+        first_child, next_sibling, payload = arena.first_child, arena.next_sibling, arena.payload
+        strings, constants = arena.strings, arena.constants
+        string_index, constant_index = {}, {}
+        last_child = []
+
+        # (value, parent index); children are pushed in reverse field order
+        stack = [(root, -1)]
+        while stack:
+            value, parent = stack.pop()
+            index = len(kind)
+            if parent >= 0:
+                if first_child[parent]:
+                    next_sibling[last_child[parent]] = index
+                else:
+                    first_child[parent] = index
+                last_child[parent] = index
+            first_child.append(0)
+            next_sibling.append(0)
+            last_child.append(0)
+
+            if value is None:
+                kind.append(NONE)
+                line.append(0)
+                column.append(0)
+                payload.append(0)
+                continue
+            if isinstance(value, list):
+                kind.append(LIST)
+                line.append(0)
+                column.append(0)
+                payload.append(0)
+                stack.extend((item, index) for item in reversed(value))
+                continue
+
+            code = _KIND_OF.get(type(value))
+            if code is None:
+                raise TypeError(f"cannot store {type(value).__name__} in an Arena")
+            kind.append(code)
+            if value.line is None:
+                line.append(0)
+                column.append(0)
+            else:
+                line.append(value.line)
+                column.append(value.column + 1)
+
+            scalar = _SCALARS[code]
+            if scalar is None:
+                payload.append(0)
+            else:
+                name, _, is_string = scalar
+                data = getattr(value, name)
+                if is_string:
+                    slot = string_index.get(data)
+                    if slot is None:
+                        slot = string_index[data] = len(strings)
+                        strings.append(data)
+                else:
+                    # Keeps 0 / 0.0 and 0.0 / -0.0 apart
+                    key = data.hex() if isinstance(data, float) else data
+                    slot = constant_index.get(key)
+                    if slot is None:
+                        slot = constant_index[key] = len(constants)
+                        constants.append(data)
+                payload.append(slot)
+            stack.extend((getattr(value, name), index) for name in reversed(_CHILD_FIELDS[code]))
+        return arena
+
+    def to_node(self, index: int = 0) -> ASTNode:
+        """Decode the subtree at index into fresh node objects, except for
+        the shared primitive types."""
+        kind, first_child, next_sibling = self.kind, self.first_child, self.next_sibling
+        line, column, payload = self.line, self.column, self.payload
+        strings, constants = self.strings, self.constants
+        end = self._subtree_end(index)
+        built = [None] * (end - index)
+        # Descendants follow their ancestors, so building back to front
+        # always finds a node's children already built.
+        for i in range(end - 1, index - 1, -1):
+            code = kind[i]
+            if code == NONE:
+                continue
+            args = []
+            child = first_child[i]
+            while child:
+                args.append(built[child - index])
+                child = next_sibling[child]
+            if code == LIST:
+                built[i - index] = args
+                continue
+            if code in _SHARED and not line[i]:
+                built[i - index] = _SHARED[code]
+                continue
+            scalar = _SCALARS[code]
+            if scalar is not None:
+                _, position, is_string = scalar
+                args.insert(position, (strings if is_string else constants)[payload[i]])
+            node = built[i - index] = NODE_CLASSES[code](*args)
+            if line[i]:
+                node.line = line[i]
+                node.column = column[i] - 1
+        return built[0]
+
+    def _subtree_end(self, index: int) -> int:
+        """One past the last index of the subtree at index."""
+        end = index + 1
+        while True:
+            node = end - 1
+            child = self.first_child[node]
+            if not child:
+                return end
+            # The last child's subtree ends the parent's
+            while self.next_sibling[child]:
+                child = self.next_sibling[child]
+            end = child + 1
+
+    @property
+    def root(self) -> "ArenaCursor":
+        return ArenaCursor(self, 0)
+
+    def cursor(self, index: int) -> "ArenaCursor":
+        return ArenaCursor(self, index)
+
+    def walk(self):
+        """Yield a cursor for every node in pre-order, by a linear scan."""
+        for index, code in enumerate(self.kind):
+            if code < LIST:
+                yield ArenaCursor(self, index)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the arena, tables included."""
+        size = sys.getsizeof(self)
+        for name in ("kind", "line", "column", "first_child", "next_sibling", "payload"):
+            size += sys.getsizeof(getattr(self, name))
+        for table in (self.strings, self.constants):
+            size += sys.getsizeof(table) + sum(map(sys.getsizeof, table))
+        return size
+
+    def __len__(self) -> int:
+        """Number of stored nodes, LIST and NONE entries included."""
+        return len(self.kind)
+
+
+class ArenaCursor:
+    """Read-only view of one node in an Arena.
+
+    Fields read like node attributes: a node field gives a cursor, a list
+    field a tuple of cursors, an unset optional field None and a scalar
+    field its value. kind is the node class the cursor stands for; use it
+    instead of isinstance() checks against node classes.
+    """
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: Arena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def kind(self) -> type:
+        return NODE_CLASSES[self.arena.kind[self.index]]
+
+    @property
+    def line(self):
+        line = self.arena.line[self.index]
+        return line if line else None
+
+    @property
+    def column(self):
+        column = self.arena.column[self.index]
+        return column - 1 if column else None
+
+    def field(self, name: str):
+        """Value of the field called name, decoded as described above."""
+        arena, index = self.arena, self.index
+        code = arena.kind[index]
+        scalar = _SCALARS[code]
+        if scalar is not None and scalar[0] == name:
+            table = arena.strings if scalar[2] else arena.constants
+            return table[arena.payload[index]]
+        child = arena.first_child[index]
+        for field in _CHILD_FIELDS[code]:
+            if field == name:
+                return self._decode(child)
+            child = arena.next_sibling[child]
+        raise AttributeError(f"{NODE_CLASSES[code].__name__} has no field {name!r}")
+
+    def _decode(self, index: int):
+        arena = self.arena
+        code = arena.kind[index]
+        if code == NONE:
+            return None
+        if code == LIST:
+            items = []
+            child = arena.first_child[index]
+            while child:
+                items.append(ArenaCursor(arena, child))
+                child = arena.next_sibling[child]
+            return tuple(items)
+        return ArenaCursor(arena, index)
+
+    def __getattr__(self, name: str):
+        # Unset slots (e.g. while unpickling) must not recurse through field()
+        if name.startswith("_") or name in ("arena", "index"):
+            raise AttributeError(name)
+        return self.field(name)
+
+    def children(self):
+        """Yield cursors for the direct child nodes, like iter_children()."""
+        arena = self.arena
+        child = arena.first_child[self.index]
+        while child:
+            code = arena.kind[child]
+            if code == LIST:
+                item = arena.first_child[child]
+                while item:
+                    yield ArenaCursor(arena, item)
+                    item = arena.next_sibling[item]
+            elif code != NONE:
+                yield ArenaCursor(arena, child)
+            child = arena.next_sibling[child]
+
+    def walk(self):
+        """Yield this node and its descendants in pre-order."""
+        arena = self.arena
+        for index in range(self.index, arena._subtree_end(self.index)):
+            if arena.kind[index] < LIST:
+                yield ArenaCursor(arena, index)
+
+    def accept(self, visitor, o: Any = None):
+        """Call the visit_xxx method of visitor for this node's kind."""
+        return getattr(visitor, _HANDLER_NAMES[self.arena.kind[self.index]])(self, o)
+
+    def to_node(self) -> ASTNode:
+        return self.arena.to_node(self.index)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ArenaCursor)
+            and other.arena is self.arena
+            and other.index == self.index
+        )
+
+    def __hash__(self):
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self):
+        return f"<{self.kind.__name__} cursor at {self.index}>"
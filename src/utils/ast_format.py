@@ -0,0 +1,203 @@
+"""
+Binary on-disk format for TyC ASTs.
+A file holds one Arena (see arena.py): a fixed header, the arena's columns
+as raw little-endian arrays, then the string and constant tables as offset
+arrays over byte blobs.
+
+The header records FORMAT_VERSION and a digest of TyC.g4 together with the
+node classes' kinds and fields, so a file written by a different grammar or
+node schema is rejected instead of being misread. load() maps the file and
+wraps the columns in memoryviews without copying them; nodes are decoded
+only when a cursor or to_node() reaches them, and table entries on first
+access.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache
+
+from .arena import NODE_CLASSES, Arena
+
+MAGIC = b"TYCAST\r\n"
+FORMAT_VERSION = 1
+GRAMMAR_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "grammar", "TyC.g4")
+
+# magic, version, reserved, digest, nodes, strings, string bytes,
+# constants, constant bytes
+_HEADER = struct.Struct("<8sHH32sIIIII")
+_COLUMNS = ("line", "column", "first_child", "next_sibling", "payload")
+_NATIVE = sys.byteorder == "little"
+
+
+class ASTFormatError(ValueError):
+    """The data is not a TyC AST file this build can read."""
+
+
+@lru_cache(maxsize=None)
+def schema_digest() -> bytes:
+    """SHA-256 over TyC.g4 and the arena's node kinds and fields."""
+    digest = hashlib.sha256()
+    with open(GRAMMAR_PATH, "rb") as f:
+        digest.update(f.read())
+    for cls in NODE_CLASSES:
+        digest.update(f"\0{cls.__name__}:{','.join(cls._fields)}".encode())
+    return digest.digest()
+
+
+def _pad(size: int) -> int:
+    return -size % 4
+
+
+def _encode_constant(value) -> bytes:
+    if isinstance(value, float):
+        return b"f" + struct.pack("<d", value)
+    return b"i" + value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+
+
+def _decode_constant(data) -> object:
+    if data[:1] == b"f":
+        return struct.unpack("<d", data[1:])[0]
+    return int.from_bytes(data[1:], "little", signed=True)
+
+
+def _decode_string(data) -> str:
+    return str(data, "utf-8")
+
+
+def _table(items, encode):
+    """(offsets, blob) for a list of table entries."""
+    offsets = array("I", [0])
+    blob = bytearray()
+    for item in items:
+        blob += encode(item)
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def _little_endian(column: array) -> bytes:
+    if not _NATIVE:
+        column = array("I", column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def dumps(tree) -> bytes:
+    """Encode an Arena, or a node tree via Arena.from_node(), as bytes."""
+    arena = tree if isinstance(tree, Arena) else Arena.from_node(tree)
+    strings = _table(arena.strings, lambda s: s.encode("utf-8"))
+    constants = _table(arena.constants, _encode_constant)
+    count = len(arena)
+    parts = [
+        _HEADER.pack(
+            MAGIC, FORMAT_VERSION, 0, schema_digest(), count,
+            len(arena.strings), len(strings[1]), len(arena.constants), len(constants[1]),
+        ),
+        bytes(arena.kind),
+        bytes(_pad(count)),
+    ]
+    parts.extend(_little_endian(getattr(arena, name)) for name in _COLUMNS)
+    parts += [_little_endian(strings[0]), _little_endian(constants[0]), strings[1], constants[1]]
+    return b"".join(parts)
+
+
+def dump(tree, path) -> None:
+    """Write tree (an Arena or a node tree) to path."""
+    data = dumps(tree)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class _LazyTable:
+    """Read-only sequence decoding entries of an offset-indexed blob on demand."""
+
+    __slots__ = ("_offsets", "_blob", "_decode", "_cache")
+
+    def __init__(self, offsets, blob, decode):
+        self._offsets = offsets
+        self._blob = blob
+        self._decode = decode
+        self._cache = [None] * (len(offsets) - 1)
+
+    def __getitem__(self, index: int):
+        value = self._cache[index]
+        if value is None:
+            value = self._cache[index] = self._decode(
+                self._blob[self._offsets[index] : self._offsets[index + 1]]
+            )
+        return value
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def loads(data) -> Arena:
+    """Decode a buffer written by dumps() into an Arena over that buffer.
+
+    On little-endian machines the arena's columns are memoryviews into data,
+    so data must stay unchanged while the arena is in use.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < _HEADER.size:
+        raise ASTFormatError("truncated AST file header")
+    magic, version, _, digest, count, n_strings, string_bytes, n_constants, constant_bytes = (
+        _HEADER.unpack_from(view)
+    )
+    if magic != MAGIC:
+        raise ASTFormatError("not a TyC AST file")
+    if version != FORMAT_VERSION:
+        raise ASTFormatError(f"AST format version {version}, expected {FORMAT_VERSION}")
+    if digest != schema_digest():
+        raise ASTFormatError("AST file was written for a different grammar or node schema")
+    expected = (
+        _HEADER.size + count + _pad(count) + 4 * len(_COLUMNS) * count
+        + 4 * (n_strings + 1) + 4 * (n_constants + 1) + string_bytes + constant_bytes
+    )
+    if len(view) != expected:
+        raise ASTFormatError(f"AST file is {len(view)} bytes, header implies {expected}")
+
+    def take(size, fmt="B"):
+        nonlocal offset
+        part = view[offset : offset + size]
+        offset += size
+        if fmt == "B":
+            return part
+        if _NATIVE:
+            return part.cast(fmt)
+        column = array(fmt)
+        column.frombytes(part)
+        column.byteswap()
+        return column
+
+    offset = _HEADER.size
+    arena = Arena.__new__(Arena)
+    arena.kind = take(count)
+    offset += _pad(count)
+    for name in _COLUMNS:
+        setattr(arena, name, take(4 * count, "I"))
+    string_offsets = take(4 * (n_strings + 1), "I")
+    constant_offsets = take(4 * (n_constants + 1), "I")
+    arena.strings = _LazyTable(string_offsets, take(string_bytes), _decode_string)
+    arena.constants = _LazyTable(constant_offsets, take(constant_bytes), _decode_constant)
+    return arena
+
+
+def load(path) -> Arena:
+    """Map the AST file at path and return an Arena over the mapping.
+
+    The file is mapped read-only and released once the arena and every
+    cursor into it are gone. Raises ASTFormatError for files from another
+    format version, grammar or node schema.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            data = b""  # empty files cannot be mapped
+    return loads(data)
@@ -0,0 +1,293 @@
+"""
+Regex-driven lexer for TyC.
+FastLexer produces the same token stream as the generated TyCLexer, including
+STRINGLIT quote stripping and the ErrorToken/UncloseString/IllegalEscape
+exceptions raised by the emit() override in TyC.g4, but scans with a single
+compiled master regex instead of the ANTLR ATN simulator. It is a TokenSource
+and plugs straight into CommonTokenStream.
+
+iter_tokens() is the streaming entry point: it reads a string, file object or
+mmap chunk by chunk and lazily yields (type, text, line, column) tuples
+without building a token list.
+"""
+
+import codecs
+import mmap
+import re
+
+from antlr4 import InputStream
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Lexer import TokenSource
+from antlr4.Token import CommonToken, Token
+from build.TyCLexer import TyCLexer, ErrorToken, IllegalEscape, UncloseString
+
+# Fixed-text tokens are taken from the generated lexer so that token types
+# always follow TyC.g4: alphabetic literals are keywords, the rest are
+# operators and separators.
+KEYWORDS = {}
+PUNCTUATION = {}
+for _type, _literal in enumerate(TyCLexer.literalNames):
+    if _literal.startswith("'"):
+        _text = _literal[1:-1]
+        (KEYWORDS if _text.isalpha() else PUNCTUATION)[_text] = _type
+
+_ESCAPE = r'\\[btnfr"\\]'
+_STRING_CHAR = rf'(?:[^"\\\r\n]|{_ESCAPE})'
+_SNOTATION = r"[eE][+-]?[0-9]+"
+_INTPART = r"(?:0|[1-9][0-9]*)"
+
+# Alternatives are ordered so that Python's first-match alternation picks the
+# same token as ANTLR's longest-match, first-rule-wins policy. Whitespace (the
+# WS rule) is consumed as a prefix of every match rather than as a token of
+# its own, and the final empty alternative matches at end of input.
+_RULES = [
+    ("BLOCK_COMMENT", r"/\*.*?\*/"),
+    ("LINE_COMMENT", r"//[^\r\n]*"),
+    ("FLOATLIT", rf"{_INTPART}(?:\.[0-9]*(?:{_SNOTATION})?|{_SNOTATION})|\.[0-9]+(?:{_SNOTATION})?"),
+    ("INTLIT", _INTPART),
+    ("ID", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+    ("STRINGLIT", rf'"{_STRING_CHAR}*"'),
+    ("ILLEGAL_ESCAPE", rf'"{_STRING_CHAR}*\\[^btnfr"\\\r\n]'),
+    ("UNCLOSE_STRING", rf'"{_STRING_CHAR}*\\?(?:\r?\n|\Z)'),
+    (
+        "PUNCTUATION",
+        "|".join(re.escape(p) for p in sorted(PUNCTUATION, key=len, reverse=True)),
+    ),
+    ("ERROR_CHAR", r"."),
+    ("EOF", r"\Z"),
+]
+
+MASTER_PATTERN = re.compile(
+    r"[ \t\r\n\f]*(?:" + "|".join(f"({pattern})" for _, pattern in _RULES) + ")",
+    re.DOTALL,
+)
+
+# Group number (match.lastindex) -> token type, or one of the markers below
+_SKIP = -2
+_KEYWORD_OR_ID = -3
+_PUNCTUATION = -4
+_GROUP_TYPES = {
+    i: {
+        "BLOCK_COMMENT": _SKIP,
+        "LINE_COMMENT": _SKIP,
+        "ID": _KEYWORD_OR_ID,
+        "PUNCTUATION": _PUNCTUATION,
+        "EOF": Token.EOF,
+    }.get(name) or getattr(TyCLexer, name)
+    for i, (name, _) in enumerate(_RULES, start=1)
+}
+_ERROR_TYPES = {TyCLexer.ERROR_CHAR, TyCLexer.UNCLOSE_STRING, TyCLexer.ILLEGAL_ESCAPE}
+
+
+_EOF_GROUP = len(_RULES)
+_PUNCTUATION_GROUP = [name for name, _ in _RULES].index("PUNCTUATION") + 1
+
+
+def scan(text: str):
+    """Yield (type, text, line, column, start, stop) for every token in text.
+
+    Token text is exactly what TyCLexer emits and the stream ends with an EOF
+    tuple. Error tokens (ERROR_CHAR, ILLEGAL_ESCAPE, UNCLOSE_STRING) are
+    yielded with their raw text rather than raised, so that scanning can
+    continue past them; lexer_error() builds the matching exception.
+    """
+    return scan_chunks((text,))
+
+
+def scan_chunks(chunks):
+    """Like scan(), over source text supplied as an iterable of str pieces.
+
+    Only whole lines are scanned at a time, so memory use is bounded by the
+    chunk size and the longest line (or block comment), not by the input.
+    Tokens other than block comments never span a newline, which makes a
+    line boundary a safe place to pause and wait for more text.
+    """
+    chunks = iter(chunks)
+    match = MASTER_PATTERN.match
+    group_types = _GROUP_TYPES
+    keywords = KEYWORDS
+    punctuation = PUNCTUATION
+    ident = TyCLexer.ID
+    stringlit = TyCLexer.STRINGLIT
+    text = ""
+    # Pieces of the unfinished last line, joined once the line ends
+    pending = []
+    exhausted = False
+    base = 0
+    pos = 0
+    line = 1
+    column = 0
+    while True:
+        m = match(text, pos)
+        group = m.lastindex
+        start = m.start(group)
+        end = m.end()
+
+        # Reaching the end of the buffer, or a "/*" whose closing "*/" is not
+        # buffered yet, only means more text is needed unless input is over.
+        if not exhausted and (
+            group == _EOF_GROUP
+            or group == _PUNCTUATION_GROUP
+            and text.startswith("/*", start)
+        ):
+            more = []
+            while not exhausted:
+                piece = next(chunks, None)
+                if piece is None:
+                    exhausted = True
+                    more.extend(pending)
+                    pending = []
+                    break
+                cut = piece.rfind("\n") + 1
+                if cut:
+                    pending.append(piece[:cut])
+                    lines = "".join(pending)
+                    more.append(lines)
+                    pending = [piece[cut:]]
+                    if group == _EOF_GROUP or "*/" in lines:
+                        break
+                else:
+                    pending.append(piece)
+            base += pos
+            text = text[pos:] + "".join(more)
+            pos = 0
+            continue
+
+        if start != pos:
+            newlines = text.count("\n", pos, start)
+            if newlines:
+                line += newlines
+                column = start - text.rfind("\n", pos, start) - 1
+            else:
+                column += start - pos
+
+        ttype = group_types[group]
+        if ttype == Token.EOF:
+            yield Token.EOF, "<EOF>", line, column, base + start, base + start - 1
+            return
+        if ttype != _SKIP:
+            lexeme = m.group(group)
+            if ttype == _KEYWORD_OR_ID:
+                ttype = keywords.get(lexeme, ident)
+            elif ttype == _PUNCTUATION:
+                ttype = punctuation[lexeme]
+            elif ttype == stringlit:
+                lexeme = lexeme[1:-1]
+            yield ttype, lexeme, line, column, base + start, base + end - 1
+
+        newlines = text.count("\n", start, end)
+        if newlines:
+            line += newlines
+            column = end - text.rfind("\n", start, end) - 1
+        else:
+            column += end - start
+        pos = end
+
+
+def lexer_error(ttype: int, text: str):
+    """Return the exception TyCLexer raises for an error token, else None."""
+    if ttype == TyCLexer.ERROR_CHAR:
+        return ErrorToken(text)
+    if ttype == TyCLexer.UNCLOSE_STRING:
+        return UncloseString(text[1:])
+    if ttype == TyCLexer.ILLEGAL_ESCAPE:
+        return IllegalEscape(text[1:])
+    return None
+
+
+CHUNK_SIZE = 1 << 16
+
+
+def iter_chunks(source, chunk_size: int = CHUNK_SIZE, encoding: str = "utf-8"):
+    """Yield source as str pieces of about chunk_size characters.
+
+    source may be a str, a bytes-like object such as bytes or an mmap.mmap,
+    or a file object opened in text or binary mode. Binary input is decoded
+    incrementally, so a multi-byte character split across two reads is
+    handled correctly.
+    """
+    if isinstance(source, str):
+        for i in range(0, len(source), chunk_size):
+            yield source[i : i + chunk_size]
+        return
+    decoder = codecs.getincrementaldecoder(encoding)()
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        with memoryview(source) as view:
+            for i in range(0, len(view), chunk_size):
+                yield decoder.decode(view[i : i + chunk_size])
+    else:
+        read = source.read
+        while True:
+            piece = read(chunk_size)
+            if not piece:
+                break
+            yield piece if isinstance(piece, str) else decoder.decode(piece)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_tokens(source, chunk_size: int = CHUNK_SIZE):
+    """Lazily yield (type, text, line, column) for every token in source.
+
+    source is anything iter_chunks() accepts; a file object or mmap is read
+    chunk by chunk, so tokenizing a large file runs in bounded memory. The
+    last tuple is the EOF token. Lexical errors are raised at the point where
+    TyCLexer would raise them, after every token before them was yielded.
+    """
+    for ttype, text, line, column, _, _ in scan_chunks(iter_chunks(source, chunk_size)):
+        if ttype in _ERROR_TYPES:
+            raise lexer_error(ttype, text)
+        yield ttype, text, line, column
+
+
+_new_token = CommonToken.__new__
+
+
+class FastLexer(TokenSource):
+    """TokenSource over a TyC source string, token-for-token equal to TyCLexer."""
+
+    def __init__(self, source, source_name: str = "<string>"):
+        if isinstance(source, InputStream):
+            self._input = source
+            source = source.strdata
+        else:
+            self._input = None
+        self.source_name = source_name
+        self.line = 1
+        self.column = 0
+        self._factory = CommonTokenFactory.DEFAULT
+        self._tokenFactorySourcePair = (self, self._input)
+        self._tokens = scan(source)
+        self._eof = None
+
+    def nextToken(self) -> Token:
+        if self._eof is not None:
+            return self._eof
+        ttype, text, line, column, start, stop = next(self._tokens)
+        # Filling the slots directly skips CommonToken.__init__, which would
+        # set every field twice and read the position back from this source.
+        token = _new_token(CommonToken)
+        token.source = self._tokenFactorySourcePair
+        token.type = ttype
+        token.channel = Token.DEFAULT_CHANNEL
+        token.start = start
+        token.stop = stop
+        token.tokenIndex = -1
+        token.line = self.line = line
+        token.column = self.column = column
+        token._text = text
+        if ttype == Token.EOF:
+            self._eof = token
+        elif ttype in _ERROR_TYPES:
+            raise lexer_error(ttype, text)
+        return token
+
+    def getSourceName(self) -> str:
+        return self.source_name
+
+    def getInputStream(self):
+        return self._input
+
+    def getTokenFactory(self):
+        return self._factory
@@ -2,8 +2,26 @@
 AST Node classes for TyC programming language.
 This module defines all the AST node types used to represent
 the abstract syntax tree for TyC programs.
+
+Every class lists its constructor fields in _fields; iter_children() and
+walk() use that schema to traverse any tree generically. Some nodes also
+carry slots that are not fields; they start as None and are filled in by
+semantic analysis. Expressions, VarDecl and FuncDecl have inferred_type.
+Declarations and the nodes that name them (Identifier, FuncCall and
+StructType) have symbol_id. StructDecl and StructLiteral have the struct's
+layout, and MemberAccess has the slot index of its member.
+
+Each class's accept() calls visit_<class name in snake_case>, and
+_visit_name records that method name so visitors can dispatch without
+calling accept() (see visitor.py). A subclass defined elsewhere that
+overrides accept() gets _visit_name None unless it sets one itself.
+
+Each node describes its string form as a flat tuple of parts from _parts();
+serialize() walks those parts with an explicit stack, so str() of an
+arbitrarily deep tree neither recurses nor copies intermediate strings.
 """
 
+import io
 from abc import ABC, abstractmethod
 from typing import Any, List, Optional, Union, TYPE_CHECKING
 
@@ -11,9 +29,27 @@ if TYPE_CHECKING:
     from .visitor import ASTVisitor
 
 
+def _snake_case(name: str) -> str:
+    return "".join("_" + c.lower() if c.isupper() and i else c.lower() for i, c in enumerate(name))
+
+
 class ASTNode(ABC):
     """Base class for all AST nodes."""
 
+    # Names of the constructor fields, in order; child nodes live in them
+    _fields = ()
+    __slots__ = ("line", "column")
+    # The visit_xxx method accept() calls, or None if accept() does more
+    _visit_name = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "accept" in vars(cls) and "_visit_name" not in vars(cls):
+            if cls.__module__ == __name__:
+                cls._visit_name = "visit_" + _snake_case(cls.__name__)
+            else:
+                cls._visit_name = None
+
     def __init__(self):
         self.line = None
         self.column = None
@@ -23,9 +59,16 @@ class ASTNode(ABC):
         """Accept a visitor for the Visitor pattern."""
         pass
 
+    def _parts(self):
+        """String form as a tuple of text, child nodes and node lists.
+
+        Text parts are written as-is, other scalars through str(), nodes are
+        serialized in place and lists/tuples become ", "-joined items.
+        """
+        return (f"{self.__class__.__name__}()",)
+
     def __str__(self):
-        """Default string representation."""
-        return f"{self.__class__.__name__}()"
+        return serialize(self)
 
 
 # ============================================================================
@@ -36,6 +79,9 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire TyC program."""
 
+    _fields = ("decls",)
+    __slots__ = _fields
+
     def __init__(self, decls: List["Decl"]):
         super().__init__()
         self.decls = decls
@@ -43,35 +89,41 @@ class Program(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_program(self, o)
 
-    def __str__(self):
-        decls_str = ", ".join(str(d) for d in self.decls) if self.decls else ""
-        return f"Program([{decls_str}])"
+    def _parts(self):
+        return ("Program([", self.decls or (), "])")
 
 
 class Decl(ASTNode):
     """Base class for declarations (struct or function)."""
-    pass
+    __slots__ = ()
 
 
 class StructDecl(Decl):
     """Struct declaration node."""
 
+    _fields = ("name", "members")
+    __slots__ = _fields + ("symbol_id", "layout")
+
     def __init__(self, name: str, members: List["MemberDecl"]):
         super().__init__()
         self.name = name
         self.members = members
+        self.symbol_id = None
+        self.layout = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_decl(self, o)
 
-    def __str__(self):
-        members_str = ", ".join(str(m) for m in self.members) if self.members else ""
-        return f"StructDecl({self.name}, [{members_str}])"
+    def _parts(self):
+        return (f"StructDecl({self.name}, [", self.members or (), "])")
 
 
 class MemberDecl(ASTNode):
     """Struct member declaration node."""
 
+    _fields = ("member_type", "name")
+    __slots__ = _fields
+
     def __init__(self, member_type: "Type", name: str):
         super().__init__()
         self.member_type = member_type
@@ -80,13 +132,16 @@ class MemberDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_member_decl(self, o)
 
-    def __str__(self):
-        return f"MemberDecl({self.member_type}, {self.name})"
+    def _parts(self):
+        return ("MemberDecl(", self.member_type, f", {self.name})")
 
 
 class FuncDecl(Decl):
     """Function declaration node."""
 
+    _fields = ("return_type", "name", "params", "body")
+    __slots__ = _fields + ("inferred_type", "symbol_id")
+
     def __init__(
         self,
         return_type: Optional["Type"],
@@ -99,29 +154,34 @@ class FuncDecl(Decl):
         self.name = name
         self.params = params
         self.body = body
+        self.inferred_type = None
+        self.symbol_id = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_func_decl(self, o)
 
-    def __str__(self):
-        return_type_str = str(self.return_type) if self.return_type else "auto"
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        return f"FuncDecl({return_type_str}, {self.name}, [{params_str}], {self.body})"
+    def _parts(self):
+        return_type = self.return_type if self.return_type else "auto"
+        return ("FuncDecl(", return_type, f", {self.name}, [", self.params or (), "], ", self.body, ")")
 
 
 class Param(ASTNode):
     """Function parameter node."""
 
+    _fields = ("param_type", "name")
+    __slots__ = _fields + ("symbol_id",)
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
         self.name = name
+        self.symbol_id = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_param(self, o)
 
-    def __str__(self):
-        return f"Param({self.param_type}, {self.name})"
+    def _parts(self):
+        return ("Param(", self.param_type, f", {self.name})")
 
 
 # ============================================================================
@@ -131,73 +191,85 @@ class Param(ASTNode):
 
 class Type(ASTNode):
     """Base class for type annotations."""
-    pass
+    __slots__ = ()
 
 
 class IntType(Type):
     """Integer type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_type(self, o)
 
-    def __str__(self):
-        return "IntType()"
+    def _parts(self):
+        return ("IntType()",)
 
 
 class FloatType(Type):
     """Float type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_type(self, o)
 
-    def __str__(self):
-        return "FloatType()"
+    def _parts(self):
+        return ("FloatType()",)
 
 
 class StringType(Type):
     """String type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_type(self, o)
 
-    def __str__(self):
-        return "StringType()"
+    def _parts(self):
+        return ("StringType()",)
 
 
 class VoidType(Type):
     """Void type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_void_type(self, o)
 
-    def __str__(self):
-        return "VoidType()"
+    def _parts(self):
+        return ("VoidType()",)
 
 
 class StructType(Type):
     """Struct type node."""
 
+    _fields = ("struct_name",)
+    __slots__ = _fields + ("symbol_id",)
+
     def __init__(self, struct_name: str):
         super().__init__()
         self.struct_name = struct_name
+        self.symbol_id = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_type(self, o)
 
-    def __str__(self):
-        return f"StructType({self.struct_name})"
+    def _parts(self):
+        return (f"StructType({self.struct_name})",)
 
 
 # ============================================================================
@@ -207,12 +279,15 @@ class StructType(Type):
 
 class Stmt(ASTNode):
     """Base class for all statement nodes."""
-    pass
+    __slots__ = ()
 
 
 class BlockStmt(Stmt):
     """Block statement containing statements."""
 
+    _fields = ("statements",)
+    __slots__ = _fields
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -220,9 +295,8 @@ class BlockStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_block_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"BlockStmt([{stmts_str}])"
+    def _parts(self):
+        return ("BlockStmt([", self.statements or (), "])")
 
 
 class VarDecl(Stmt):
@@ -230,6 +304,9 @@ class VarDecl(Stmt):
     If var_type is None, it means 'auto' (type inference).
     """
 
+    _fields = ("var_type", "name", "init_value")
+    __slots__ = _fields + ("inferred_type", "symbol_id")
+
     def __init__(
         self,
         var_type: Optional["Type"],
@@ -240,19 +317,25 @@ class VarDecl(Stmt):
         self.var_type = var_type  # None means 'auto'
         self.name = name
         self.init_value = init_value
+        self.inferred_type = None
+        self.symbol_id = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_var_decl(self, o)
 
-    def __str__(self):
-        type_str = "auto" if self.var_type is None else str(self.var_type)
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"VarDecl({type_str}, {self.name}{init_str})"
+    def _parts(self):
+        var_type = "auto" if self.var_type is None else self.var_type
+        if self.init_value:
+            return ("VarDecl(", var_type, f", {self.name} = ", self.init_value, ")")
+        return ("VarDecl(", var_type, f", {self.name})")
 
 
 class IfStmt(Stmt):
     """If statement."""
 
+    _fields = ("condition", "then_stmt", "else_stmt")
+    __slots__ = _fields
+
     def __init__(
         self, condition: "Expr", then_stmt: Stmt, else_stmt: Optional[Stmt] = None
     ):
@@ -264,14 +347,18 @@ class IfStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_if_stmt(self, o)
 
-    def __str__(self):
-        else_str = f", else {self.else_stmt}" if self.else_stmt else ""
-        return f"IfStmt(if {self.condition} then {self.then_stmt}{else_str})"
+    def _parts(self):
+        if self.else_stmt:
+            return ("IfStmt(if ", self.condition, " then ", self.then_stmt, ", else ", self.else_stmt, ")")
+        return ("IfStmt(if ", self.condition, " then ", self.then_stmt, ")")
 
 
 class WhileStmt(Stmt):
     """While statement."""
 
+    _fields = ("condition", "body")
+    __slots__ = _fields
+
     def __init__(self, condition: "Expr", body: Stmt):
         super().__init__()
         self.condition = condition
@@ -280,13 +367,16 @@ class WhileStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_while_stmt(self, o)
 
-    def __str__(self):
-        return f"WhileStmt(while {self.condition} do {self.body})"
+    def _parts(self):
+        return ("WhileStmt(while ", self.condition, " do ", self.body, ")")
 
 
 class ForStmt(Stmt):
     """For statement."""
 
+    _fields = ("init", "condition", "update", "body")
+    __slots__ = _fields
+
     def __init__(
         self,
         init: Optional[Union["VarDecl", "ExprStmt"]],
@@ -303,39 +393,61 @@ class ForStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_for_stmt(self, o)
 
-    def __str__(self):
-        init_str = str(self.init) if self.init else "None"
-        cond_str = str(self.condition) if self.condition else "None"
-        update_str = str(self.update) if self.update else "None"
-        return f"ForStmt(for {init_str}; {cond_str}; {update_str} do {self.body})"
+    def _parts(self):
+        return (
+            "ForStmt(for ",
+            self.init if self.init else "None",
+            "; ",
+            self.condition if self.condition else "None",
+            "; ",
+            self.update if self.update else "None",
+            " do ",
+            self.body,
+            ")",
+        )
 
 
 class SwitchStmt(Stmt):
-    """Switch statement."""
+    """Switch statement.
+    default_index is the number of cases written before the default clause
+    (all of them when it comes last or is absent).
+    """
+
+    _fields = ("expr", "cases", "default_case", "default_index")
+    __slots__ = _fields
 
     def __init__(
         self,
         expr: "Expr",
         cases: List["CaseStmt"],
         default_case: Optional["DefaultStmt"] = None,
+        default_index: int = None,
     ):
         super().__init__()
         self.expr = expr
         self.cases = cases
         self.default_case = default_case
+        self.default_index = len(cases) if default_index is None else default_index
 
     def accept(self, visitor, o=None):
         return visitor.visit_switch_stmt(self, o)
 
-    def __str__(self):
-        cases_str = ", ".join(str(c) for c in self.cases) if self.cases else ""
-        default_str = f", default {self.default_case}" if self.default_case else ""
-        return f"SwitchStmt(switch {self.expr} cases [{cases_str}]{default_str})"
+    def clauses(self) -> List[Union["CaseStmt", "DefaultStmt"]]:
+        """The cases and the default clause in source order."""
+        return switch_clauses(self)
+
+    def _parts(self):
+        # The string form lists the default after the cases wherever it is
+        default = (", default ", self.default_case) if self.default_case else ()
+        return ("SwitchStmt(switch ", self.expr, " cases [", self.cases or (), "]", *default, ")")
 
 
 class CaseStmt(ASTNode):
     """Case statement in switch."""
 
+    _fields = ("expr", "statements")
+    __slots__ = _fields
+
     def __init__(self, expr: "Expr", statements: List[Stmt]):
         super().__init__()
         self.expr = expr
@@ -344,14 +456,16 @@ class CaseStmt(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_case_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"CaseStmt(case {self.expr}: [{stmts_str}])"
+    def _parts(self):
+        return ("CaseStmt(case ", self.expr, ": [", self.statements or (), "])")
 
 
 class DefaultStmt(ASTNode):
     """Default statement in switch."""
 
+    _fields = ("statements",)
+    __slots__ = _fields
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -359,40 +473,46 @@ class DefaultStmt(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_default_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"DefaultStmt(default: [{stmts_str}])"
+    def _parts(self):
+        return ("DefaultStmt(default: [", self.statements or (), "])")
 
 
 class BreakStmt(Stmt):
     """Break statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_break_stmt(self, o)
 
-    def __str__(self):
-        return "BreakStmt()"
+    def _parts(self):
+        return ("BreakStmt()",)
 
 
 class ContinueStmt(Stmt):
     """Continue statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_continue_stmt(self, o)
 
-    def __str__(self):
-        return "ContinueStmt()"
+    def _parts(self):
+        return ("ContinueStmt()",)
 
 
 class ReturnStmt(Stmt):
     """Return statement."""
 
+    _fields = ("expr",)
+    __slots__ = _fields
+
     def __init__(self, expr: Optional["Expr"] = None):
         super().__init__()
         self.expr = expr
@@ -400,14 +520,18 @@ class ReturnStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_return_stmt(self, o)
 
-    def __str__(self):
-        expr_str = f" {self.expr}" if self.expr else ""
-        return f"ReturnStmt(return{expr_str})"
+    def _parts(self):
+        if self.expr:
+            return ("ReturnStmt(return ", self.expr, ")")
+        return ("ReturnStmt(return)",)
 
 
 class ExprStmt(Stmt):
     """Expression statement."""
 
+    _fields = ("expr",)
+    __slots__ = _fields
+
     def __init__(self, expr: "Expr"):
         super().__init__()
         self.expr = expr
@@ -415,8 +539,8 @@ class ExprStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_expr_stmt(self, o)
 
-    def __str__(self):
-        return f"ExprStmt({self.expr})"
+    def _parts(self):
+        return ("ExprStmt(", self.expr, ")")
 
 
 # ============================================================================
@@ -426,12 +550,20 @@ class ExprStmt(Stmt):
 
 class Expr(ASTNode):
     """Base class for all expression nodes."""
-    pass
+
+    __slots__ = ("inferred_type",)
+
+    def __init__(self):
+        super().__init__()
+        self.inferred_type = None
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    _fields = ("left", "operator", "right")
+    __slots__ = _fields
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -441,13 +573,16 @@ class BinaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_binary_op(self, o)
 
-    def __str__(self):
-        return f"BinaryOp({self.left}, {self.operator}, {self.right})"
+    def _parts(self):
+        return ("BinaryOp(", self.left, f", {self.operator}, ", self.right, ")")
 
 
 class PrefixOp(Expr):
     """Prefix unary operation expression (++x, --x, +x, -x, !x)."""
 
+    _fields = ("operator", "operand")
+    __slots__ = _fields
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--', '+', '-', '!'
@@ -456,13 +591,16 @@ class PrefixOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_prefix_op(self, o)
 
-    def __str__(self):
-        return f"PrefixOp({self.operator}{self.operand})"
+    def _parts(self):
+        return (f"PrefixOp({self.operator}", self.operand, ")")
 
 
 class PostfixOp(Expr):
     """Postfix unary operation expression (x++, x--)."""
 
+    _fields = ("operator", "operand")
+    __slots__ = _fields
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--'
@@ -471,8 +609,8 @@ class PostfixOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_op(self, o)
 
-    def __str__(self):
-        return f"PostfixOp({self.operand}{self.operator})"
+    def _parts(self):
+        return ("PostfixOp(", self.operand, f"{self.operator})")
 
 
 class AssignExpr(Expr):
@@ -480,6 +618,9 @@ class AssignExpr(Expr):
     lhs can be Identifier or MemberAccess.
     """
 
+    _fields = ("lhs", "rhs")
+    __slots__ = _fields
+
     def __init__(self, lhs: "Expr", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs  # Identifier or MemberAccess
@@ -488,8 +629,8 @@ class AssignExpr(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_assign_expr(self, o)
 
-    def __str__(self):
-        return f"AssignExpr({self.lhs} = {self.rhs})"
+    def _parts(self):
+        return ("AssignExpr(", self.lhs, " = ", self.rhs, ")")
 
 
 class MemberAccess(Expr):
@@ -498,61 +639,75 @@ class MemberAccess(Expr):
     Can be nested: MemberAccess(MemberAccess(obj, "member1"), "member2")
     """
 
+    _fields = ("obj", "member")
+    __slots__ = _fields + ("slot",)
+
     def __init__(self, obj: Expr, member: str):
         super().__init__()
         self.obj = obj
         self.member = member
+        self.slot = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_member_access(self, o)
 
-    def __str__(self):
-        return f"MemberAccess({self.obj}.{self.member})"
+    def _parts(self):
+        return ("MemberAccess(", self.obj, f".{self.member})")
 
 
 class FuncCall(Expr):
     """Function call expression."""
 
+    _fields = ("name", "args")
+    __slots__ = _fields + ("symbol_id",)
+
     def __init__(self, name: str, args: List[Expr]):
         super().__init__()
         self.name = name
         self.args = args
+        self.symbol_id = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_func_call(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f"FuncCall({self.name}, [{args_str}])"
+    def _parts(self):
+        return (f"FuncCall({self.name}, [", self.args or (), "])")
 
 
 class Identifier(Expr):
     """Identifier expression."""
 
+    _fields = ("name",)
+    __slots__ = _fields + ("symbol_id",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
+        self.symbol_id = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_identifier(self, o)
 
-    def __str__(self):
-        return f"Identifier({self.name})"
+    def _parts(self):
+        return (f"Identifier({self.name})",)
 
 
 class StructLiteral(Expr):
     """Struct literal expression (initialization with {})."""
 
+    _fields = ("values",)
+    __slots__ = _fields + ("layout",)
+
     def __init__(self, values: List[Expr]):
         super().__init__()
         self.values = values
+        self.layout = None
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_literal(self, o)
 
-    def __str__(self):
-        values_str = ", ".join(str(v) for v in self.values) if self.values else ""
-        return f"StructLiteral({{{values_str}}})"
+    def _parts(self):
+        return ("StructLiteral({", self.values or (), "})")
 
 
 # ============================================================================
@@ -563,6 +718,9 @@ class StructLiteral(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    _fields = ("value",)
+    __slots__ = _fields
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -571,37 +729,162 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_literal(self, o)
 
-    def __str__(self):
-        return f"IntLiteral({self.value})"
+    def _parts(self):
+        return (f"IntLiteral({self.value})",)
 
 
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_literal(self, o)
 
-    def __str__(self):
-        return f"FloatLiteral({self.value})"
+    def _parts(self):
+        return (f"FloatLiteral({self.value})",)
 
 
 class StringLiteral(Literal):
     """String literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_literal(self, o)
 
-    def __str__(self):
-        return f"StringLiteral({self.value!r})"
+    def _parts(self):
+        return (f"StringLiteral({self.value!r})",)
+
+
+# ============================================================================
+# Traversal
+# ============================================================================
+
+
+def iter_fields(node: ASTNode):
+    """Yield (name, value) for every field declared in node._fields."""
+    for name in node._fields:
+        yield name, getattr(node, name)
+
+
+def iter_children(node: ASTNode):
+    """Yield the direct child nodes of node in field order.
+
+    Fields holding a node yield it; fields holding a list yield the nodes
+    in it. Scalars (names, operators, literal values) and None are skipped.
+    """
+    for name in node._fields:
+        value = getattr(node, name)
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+def switch_clauses(node) -> list:
+    """The cases and the default clause of a switch in source order.
+
+    Reads only fields, so it also works on arena cursors.
+    """
+    cases, default = list(node.cases), node.default_case
+    if default is not None:
+        cases.insert(node.default_index, default)
+    return cases
+
+
+def walk(node: ASTNode):
+    """Yield node and all of its descendants in pre-order (source order).
+
+    Uses an explicit stack, so arbitrarily deep trees are fine. Shared
+    nodes, such as the interned primitive types, are yielded once per
+    occurrence.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = list(iter_children(node))
+        children.reverse()
+        stack.extend(children)
+
+
+# ============================================================================
+# Serialization
+# ============================================================================
+
+
+_NODE, _CUSTOM, _SEQUENCE, _SCALAR = range(4)
+_KINDS = {list: _SEQUENCE, tuple: _SEQUENCE}
+
+
+def _kind(cls) -> int:
+    """Classify cls for serialize(), caching the answer per class."""
+    if issubclass(cls, ASTNode):
+        kind = _NODE if cls.__str__ is ASTNode.__str__ else _CUSTOM
+    elif issubclass(cls, (list, tuple)):
+        kind = _SEQUENCE
+    else:
+        kind = _SCALAR
+    _KINDS[cls] = kind
+    return kind
+
+
+def serialize(node: ASTNode, out: Optional[io.StringIO] = None) -> str:
+    """Write the string form of node into out (a new StringIO by default)
+    and return the buffer's contents.
+
+    The tree is walked with an explicit stack of part iterators, so nesting
+    depth is limited only by memory. Output is identical to the historical
+    recursive __str__ methods. Nodes of classes that override __str__
+    themselves are written with str().
+    """
+    buffer = io.StringIO() if out is None else out
+    write = buffer.write
+    kinds = _KINDS
+    stack = [iter((node,))]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        for item in stack[-1]:
+            cls = type(item)
+            if cls is str:
+                write(item)
+                continue
+            kind = kinds.get(cls)
+            if kind is None:
+                kind = _kind(cls)
+            if kind == _NODE:
+                parts = item._parts()
+                if len(parts) == 1 and type(parts[0]) is str:
+                    write(parts[0])  # leaf node
+                else:
+                    push(iter(parts))
+                    break
+            elif kind == _SEQUENCE:
+                if item:
+                    items = [", "] * (2 * len(item) - 1)
+                    items[::2] = item
+                    push(iter(items))
+                    break
+            else:
+                write(str(item))
+        else:
+            pop()
+    return buffer.getvalue()
@@ -0,0 +1,195 @@
+"""
+Parser front door for the TyC compiler.
+This module builds TyCLexer/TyCParser instances over the process-wide
+prediction caches and runs TyCParser in two stages: a fast SLL pass that
+bails out on the first error, followed by a full LL pass only when the SLL
+pass fails.
+
+run_deep() runs a callable on a thread with a large stack and a raised
+recursion limit, for machine-generated input that nests deeper than the
+recursive-descent parser can otherwise handle.
+"""
+
+import sys
+import threading
+
+from antlr4.PredictionContext import PredictionContextCache
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.dfa.DFA import DFA
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.utils.error_listener import NewErrorListener
+from src.utils.streams import COPY_TEXT_FACTORY, ChunkedInputStream
+
+SLL = "SLL"
+LL = "LL"
+
+
+class ParseStats:
+    """Counts which prediction mode finished each parse."""
+
+    def __init__(self):
+        self.sll = 0
+        self.ll = 0
+
+    def record(self, mode: str):
+        if mode == SLL:
+            self.sll += 1
+        else:
+            self.ll += 1
+
+    @property
+    def total(self) -> int:
+        return self.sll + self.ll
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of parses that finished on the SLL fast path."""
+        return self.sll / self.total if self.total else 0.0
+
+    def reset(self):
+        self.sll = 0
+        self.ll = 0
+
+    def __str__(self):
+        return f"ParseStats(sll={self.sll}, ll={self.ll}, hit_rate={self.hit_rate:.2%})"
+
+
+PARSE_STATS = ParseStats()
+
+# TyCParser keeps its DFA and context cache as class attributes, so every
+# parser in the process already shares them. TyCLexer shares its DFA but
+# creates a fresh context cache per instance; this one is shared instead.
+LEXER_CONTEXT_CACHE = PredictionContextCache()
+
+
+def _fresh_dfa(atn):
+    return [DFA(state, i) for i, state in enumerate(atn.decisionToState)]
+
+
+def make_lexer(input_stream, shared: bool = True) -> TyCLexer:
+    """Create a TyCLexer over input_stream.
+
+    With shared=True the lexer uses the process-wide DFA and context cache,
+    so it benefits from every earlier lexer and from warm_up(). With
+    shared=False it gets private, empty caches.
+
+    input_stream may be an antlr4 InputStream or a ChunkedInputStream; for
+    the latter, tokens copy their text since the stream forgets it.
+    """
+    lexer = TyCLexer(input_stream)
+    if isinstance(input_stream, ChunkedInputStream):
+        lexer._factory = COPY_TEXT_FACTORY
+    if shared:
+        lexer._interp.sharedContextCache = LEXER_CONTEXT_CACHE
+    else:
+        lexer._interp = LexerATNSimulator(
+            lexer, lexer.atn, _fresh_dfa(lexer.atn), PredictionContextCache()
+        )
+    return lexer
+
+
+def make_parser(token_stream, shared: bool = True) -> TyCParser:
+    """Create a TyCParser over token_stream reporting through NewErrorListener.
+
+    With shared=True the parser uses the process-wide DFA and prediction
+    context cache; with shared=False it gets private, empty caches.
+    """
+    parser = TyCParser(token_stream)
+    if not shared:
+        parser._interp = ParserATNSimulator(
+            parser, parser.atn, _fresh_dfa(parser.atn), PredictionContextCache()
+        )
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def dfa_state_count() -> int:
+    """Number of cached DFA states in the shared lexer and parser DFAs."""
+    return sum(
+        len(dfa.states) for dfa in TyCLexer.decisionsToDFA + TyCParser.decisionsToDFA
+    )
+
+
+def parse_program(parser, stats: ParseStats = PARSE_STATS):
+    """Parse a whole program with SLL prediction, falling back to full LL.
+
+    The SLL pass runs with no error listeners and a bail-out error strategy,
+    so any syntax error simply cancels it. The token stream is then rewound
+    and the program is parsed again in LL mode with the parser's original
+    listeners and error strategy, which report errors exactly as before.
+    Lexer errors are raised from either pass unchanged.
+
+    Returns a tuple ``(tree, mode)`` where mode is ``SLL`` or ``LL``.
+    """
+    listeners = list(parser._listeners)
+    error_handler = parser._errHandler
+
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        tree = parser.program()
+        mode = SLL
+    except ParseCancellationException:
+        parser._errHandler = error_handler
+        for listener in listeners:
+            parser.addErrorListener(listener)
+        parser.reset()
+        parser._interp.predictionMode = PredictionMode.LL
+        tree = parser.program()
+        mode = LL
+    finally:
+        parser.removeErrorListeners()
+        for listener in listeners:
+            parser.addErrorListener(listener)
+        parser._errHandler = error_handler
+
+    stats.record(mode)
+    return tree, mode
+
+
+# ANTLR's generated parser recurses once or more per nesting level, and its
+# prediction closure recurses with the rule context depth. These limits
+# comfortably cover nesting depths in the hundreds of thousands.
+DEEP_RECURSION_LIMIT = 1_000_000
+DEEP_STACK_SIZE = 1 << 29
+_DEEP_LOCK = threading.Lock()
+
+
+def run_deep(fn, *args, recursion_limit: int = DEEP_RECURSION_LIMIT, stack_size: int = DEEP_STACK_SIZE):
+    """Call fn(*args) on a thread with a deep stack and return its result.
+
+    The recursion limit is interpreter-wide, so it is raised only while the
+    lock is held for the call, restored afterwards, and deep calls are
+    serialized. The large stack is what makes the raised limit safe for fn.
+    Exceptions raised by fn propagate to the caller.
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["value"] = fn(*args)
+        except BaseException as e:
+            outcome["error"] = e
+
+    with _DEEP_LOCK:
+        old_limit = sys.getrecursionlimit()
+        old_size = threading.stack_size(stack_size)
+        try:
+            sys.setrecursionlimit(max(old_limit, recursion_limit))
+            thread = threading.Thread(target=target, name="tyc-deep-parse")
+            thread.start()
+            thread.join()
+        finally:
+            threading.stack_size(old_size)
+            sys.setrecursionlimit(old_limit)
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
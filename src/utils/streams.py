@@ -0,0 +1,167 @@
+"""
+File-backed character streams for TyCLexer.
+antlr4.InputStream decodes the whole source into a str and then into a list
+of code points, so a file costs several times its size in memory before
+lexing starts. ChunkedInputStream instead decodes the source a chunk at a
+time and keeps only the characters the lexer can still look at: the token
+being matched plus the unread lookahead.
+
+Because text before the current token is discarded, tokens must copy their
+text when they are created. make_lexer() does this automatically for
+ChunkedInputStream; a lexer built by hand needs
+``lexer._factory = COPY_TEXT_FACTORY``.
+"""
+
+import mmap
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import Token
+from antlr4.error.Errors import UnsupportedOperationException
+from src.utils.fast_lexer import CHUNK_SIZE, iter_chunks
+
+
+class CopyTextTokenFactory(CommonTokenFactory):
+    """Token factory that stores each token's text when it is created."""
+
+    def __init__(self):
+        super().__init__(copyText=True)
+
+    def create(self, source, type, text, channel, start, stop, line, column):
+        if type == Token.EOF and text is None:
+            # An InputStream token reports "<EOF>" once past the end of input
+            text = "<EOF>"
+        return super().create(source, type, text, channel, start, stop, line, column)
+
+
+COPY_TEXT_FACTORY = CopyTextTokenFactory()
+
+
+class ChunkedInputStream:
+    """ANTLR character stream over a file object, mmap or bytes-like source.
+
+    The source is read lazily through iter_chunks(). Characters before the
+    start of the token being lexed are dropped once the lexer releases its
+    mark, so memory use is bounded by the chunk size and the longest token.
+    """
+
+    def __init__(
+        self,
+        source,
+        chunk_size: int = CHUNK_SIZE,
+        name: str = "<stream>",
+        encoding: str = "utf-8",
+    ):
+        self.name = name
+        self._chunks = iter_chunks(source, chunk_size, encoding)
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._offset = 0  # absolute index of self._buffer[0]
+        self._index = 0
+        self._markers = 0
+        self._exhausted = False
+        self._closers = []
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def size(self):
+        raise UnsupportedOperationException("ChunkedInputStream has no known size")
+
+    def _fill(self, pos: int) -> bool:
+        """Read until absolute index pos is buffered; False if input ends first."""
+        while pos - self._offset >= len(self._buffer):
+            if self._exhausted:
+                return False
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                return False
+            self._buffer += chunk
+        return True
+
+    def reset(self):
+        self.seek(0)
+
+    def consume(self):
+        if self.LA(1) == Token.EOF:
+            raise Exception("cannot consume EOF")
+        self._index += 1
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # e.g., translate LA(-1) to use offset=0
+        pos = self._index + offset - 1
+        if pos < self._offset or not self._fill(pos):
+            return Token.EOF
+        return ord(self._buffer[pos - self._offset])
+
+    def LT(self, offset: int):
+        return self.LA(offset)
+
+    def mark(self):
+        self._markers += 1
+        return -self._markers
+
+    def release(self, marker: int):
+        self._markers -= 1
+        if self._markers == 0:
+            # Keep one character behind the cursor for LA(-1). Trimming only
+            # once a full chunk is dead keeps the copying amortized linear.
+            dead = self._index - 1 - self._offset
+            if dead >= self._chunk_size:
+                self._buffer = self._buffer[dead:]
+                self._offset += dead
+
+    def seek(self, index: int):
+        if index < self._offset:
+            raise UnsupportedOperationException(
+                f"cannot seek to {index}: input before {self._offset} was released"
+            )
+        if index > self._index and not self._fill(index - 1):
+            index = self._offset + len(self._buffer)
+        self._index = index
+
+    def getText(self, start: int, stop: int):
+        if start < self._offset:
+            raise UnsupportedOperationException(
+                f"text at {start} was released; tokens must copy their text"
+            )
+        self._fill(stop)
+        return self._buffer[start - self._offset : stop - self._offset + 1]
+
+    def close(self):
+        """Close the file and mmap opened by open_source(), if any."""
+        self._chunks.close()
+        while self._closers:
+            self._closers.pop().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+def open_source(path, chunk_size: int = CHUNK_SIZE, encoding: str = "utf-8") -> ChunkedInputStream:
+    """Open a TyC source file as a memory-mapped ChunkedInputStream.
+
+    The file is mapped read-only, so the OS pages it in on demand and the
+    process never holds a decoded copy of the whole file. Empty files, which
+    cannot be mapped, are streamed from the file object instead. Close the
+    stream (or use it as a context manager) to unmap the file.
+    """
+    f = open(path, "rb")
+    try:
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        source = f
+    stream = ChunkedInputStream(source, chunk_size, str(path), encoding)
+    stream._closers = [f] if source is f else [f, source]
+    return stream
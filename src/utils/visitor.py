@@ -2,21 +2,98 @@
 Visitor interface for AST traversal in TyC programming language.
 This module defines the abstract visitor pattern interface for traversing
 and processing AST nodes.
+
+Dispatch is table-driven: the visit_xxx method for a node class is the
+class's _visit_name (see nodes.py), looked up once per (visitor class,
+node class) pair and then cached. dispatch() offers the same lookup to
+visitors that do not subclass ASTVisitor.
 """
 
+import weakref
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from .nodes import ASTNode, switch_clauses
+
 if TYPE_CHECKING:
     from .nodes import *
 
 
-class ASTVisitor(ABC):
-    """Abstract base class for AST visitors."""
+# visitor class -> {node class -> plain function taking (visitor, node, o)};
+# weak so that visitor classes can be collected
+_HANDLERS = weakref.WeakKeyDictionary()
+
+
+def _double_dispatch(visitor, node, o=None):
+    return node.accept(visitor, o)
+
+
+def _resolve_handler(visitor_cls, node_cls):
+    """Find and cache the handler for node_cls on visitor_cls.
+
+    The method name is node_cls._visit_name. Visitor classes without that
+    method fall back to their generic_visit, if they have one. Nodes with no
+    _visit_name (not ASTNodes, or an accept() that does more than call one
+    method) are dispatched through accept() every time.
+    """
+    name = getattr(node_cls, "_visit_name", None) if issubclass(node_cls, ASTNode) else None
+    handler = None
+    if name is not None:
+        handler = getattr(visitor_cls, name, None) or getattr(visitor_cls, "generic_visit", None)
+    if handler is None:
+        handler = _double_dispatch
+    handlers_for(visitor_cls)[node_cls] = handler
+    return handler
+
+
+def handlers_for(visitor_cls) -> dict:
+    """The node class -> handler table of visitor_cls."""
+    handlers = _HANDLERS.get(visitor_cls)
+    if handlers is None:
+        handlers = _HANDLERS[visitor_cls] = {}
+    return handlers
+
+
+def dispatch(visitor, node: "ASTNode", o: Any = None):
+    """Call the visit_xxx method of visitor that node.accept() would call.
+
+    The handler is resolved once per (visitor class, node class) pair and
+    then looked up in a dict, so visitors need not subclass ASTVisitor.
+    Methods assigned to visitor instances (rather than classes) and
+    classes modified after their first dispatch are not picked up.
+    """
+    handler = handlers_for(type(visitor)).get(type(node))
+    if handler is None:
+        handler = _resolve_handler(type(visitor), type(node))
+    return handler(visitor, node, o)
+
+
+class CachedDispatch:
+    """Mixin providing visit() through the cached handler tables.
+
+    Each subclass holds its own table (see handlers_for()) as the class
+    attribute _handlers, so visit() reaches it with one attribute lookup.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = handlers_for(cls)
 
     def visit(self, node: "ASTNode", o: Any = None):
-        """Visit a node using the visitor pattern."""
-        return node.accept(self, o)
+        """Visit a node using the visitor pattern.
+
+        Equivalent to node.accept(self, o), but calls the handler straight
+        from the per-class handler cache (see dispatch()).
+        """
+        try:
+            handler = self._handlers[type(node)]
+        except KeyError:
+            handler = _resolve_handler(type(self), type(node))
+        return handler(self, node, o)
+
+
+class ASTVisitor(CachedDispatch, ABC):
+    """Abstract base class for AST visitors."""
 
     # Program and declarations
     @abstractmethod
@@ -234,10 +311,8 @@ class BaseVisitor(ASTVisitor):
 
     def visit_switch_stmt(self, node: "SwitchStmt", o: Any = None):
         self.visit(node.expr, o)
-        for case in node.cases:
-            self.visit(case, o)
-        if node.default_case:
-            self.visit(node.default_case, o)
+        for clause in switch_clauses(node):
+            self.visit(clause, o)
 
     def visit_case_stmt(self, node: "CaseStmt", o: Any = None):
         self.visit(node.expr, o)
@@ -297,3 +372,78 @@ class BaseVisitor(ASTVisitor):
 
     def visit_string_literal(self, node: "StringLiteral", o: Any = None):
         pass
+
+
+class NodeTransformer(CachedDispatch):
+    """Visitor that rewrites an AST in place.
+
+    visit() calls the visit_xxx method the transformer defines for a node's
+    class, or generic_visit() when it defines none. A visit_xxx method
+    returns the node to put in place of the one visited: the same node to
+    keep it, a new node to replace it, None to delete it, or (inside node
+    lists) a list of nodes to splice in. Methods that want the children
+    transformed as well call self.generic_visit(node, o) themselves.
+
+    Nodes and lists that nothing changed are left untouched, so a pass
+    that rewrites a handful of subtrees allocates only what it rewrites.
+
+    generic_visit() walks the nodes that only it handles with an explicit
+    stack, so deep trees need no recursion. A visit_xxx method that calls
+    generic_visit() recurses once per level of its own nodes, which bounds
+    the depth of, say, a chain of BinaryOps a visit_binary_op rewrites.
+    """
+
+    def generic_visit(self, node: "ASTNode", o: Any = None):
+        """Transform the descendants of node in place and return node."""
+        # Children that would only come back here are descended into
+        # directly, unless a subclass changed how nodes are visited
+        inline = type(self).visit is CachedDispatch.visit
+        stack = [self._transform_children(node, o, inline)]
+        while stack:
+            for child in stack[-1]:
+                stack.append(self._transform_children(child, o, inline))
+                break
+            else:
+                stack.pop()
+        return node
+
+    def _is_generic(self, node_cls) -> bool:
+        try:
+            handler = self._handlers[node_cls]
+        except KeyError:
+            handler = _resolve_handler(type(self), node_cls)
+        return handler is NodeTransformer.generic_visit
+
+    def _transform_children(self, node, o, inline):
+        """Transform the children of node, yielding those left to the caller
+        to descend into; they stay in place."""
+        for name in node._fields:
+            old = getattr(node, name)
+            if isinstance(old, ASTNode):
+                if inline and self._is_generic(type(old)):
+                    yield old
+                    continue
+                new = self.visit(old, o)
+                if new is not old:
+                    setattr(node, name, new)
+            elif isinstance(old, list):
+                items = []
+                changed = False
+                for item in old:
+                    if not isinstance(item, ASTNode):
+                        new = item
+                    elif inline and self._is_generic(type(item)):
+                        yield item
+                        new = item
+                    else:
+                        new = self.visit(item, o)
+                    if new is item:
+                        items.append(item)
+                        continue
+                    changed = True
+                    if isinstance(new, list):
+                        items.extend(new)
+                    elif new is not None:
+                        items.append(new)
+                if changed:
+                    old[:] = items
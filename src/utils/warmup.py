@@ -0,0 +1,92 @@
+"""
+DFA warm-up for short-lived TyC compile workers.
+The ANTLR runtime builds its prediction DFA lazily, so the first files a new
+process parses run several times slower than steady state. warm_up() parses
+a bundled corpus covering every TyC construct through the shared caches so
+that later parses start from a populated DFA.
+
+Setting the TYC_WARMUP environment variable to a non-empty value warms the
+caches as soon as this module is imported.
+"""
+
+import os
+
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCLexer import LexerError
+from src.utils.error_listener import SyntaxException
+from src.utils.parsing import dfa_state_count, make_lexer, make_parser, parse_program, ParseStats
+
+WARMUP_CORPUS = (
+    # Declarations and types
+    """
+    struct Empty {};
+    struct Point { int x; int y; };
+    struct Person { string name; int age; float height; Point home; };
+    int add(int x, int y) { return x + y; }
+    float scale(float f, Point p) { return f * p.x; }
+    greet(string name) { printString("Hello, "); printString(name); }
+    Point origin() { Point p = {0, 0}; return p; }
+    void main() {}
+    """,
+    # Variable declarations and assignments
+    """
+    void main() {
+        auto a; auto b = 10; int c; float d = 3.14; string e = "s\\t\\"q\\"";
+        Point p; Point q = {1, 2}; Person who = {"Ann", 30, 1.75, {3, 4}};
+        a = 1; p.x = 5; who.home.y = p.x; a = b = c = 7;
+        auto f = 1.; auto g = .5e-3; auto h = 12E4;
+    }
+    """,
+    # Control flow
+    """
+    void main() {
+        auto n = readInt();
+        if (n > 0) printInt(n); else if (n < 0) { printInt(-n); } else printInt(0);
+        if (n) if (n - 1) n = 1; else n = 2;
+        while (n != 0) { --n; if (n == 5) continue; if (n == 2) break; }
+        for (auto i = 0; i < n; ++i) { printInt(i); }
+        for (i = 0; i <= n; i++) {}
+        for (; ; n = n + 1) { break; }
+        for (;;) break;
+        switch (n) {
+            case 1: case +2: printInt(1); break;
+            case (3 + 4): { printInt(7); }
+            default: printInt(0);
+            case -5:
+        }
+        switch (n) {}
+        return;
+    }
+    """,
+    # Expressions
+    """
+    int main2(int a, int b) {
+        auto x = (a + 1) * b - a / (b + 1) % 7 + -a && a < b || a >= 2 && !(b == a);
+        auto y = a++ + --b - +a * ++a.b.c;
+        auto z = (x = 5) + 7;
+        printFloat(add(add(1, 2), f({1, {2, 3}}, "s", 2.5e1)));
+        x; y--; -x; readString();
+        return x <= y != z > a;
+    }
+    """,
+)
+
+
+def warm_up(corpus=WARMUP_CORPUS) -> int:
+    """Parse every snippet in corpus through the shared caches.
+
+    Returns the number of cached DFA states afterwards. Snippets that fail
+    to lex or parse still contribute the states reached before the error;
+    any other exception propagates.
+    """
+    for source in corpus:
+        parser = make_parser(CommonTokenStream(make_lexer(InputStream(source))))
+        try:
+            parse_program(parser, ParseStats())
+        except (LexerError, SyntaxException):
+            pass
+    return dfa_state_count()
+
+
+if os.environ.get("TYC_WARMUP"):
+    warm_up()
@@ -0,0 +1,104 @@
+"""
+Tests for the asyncio API.
+Each test drives its own event loop with asyncio.run().
+"""
+
+import asyncio
+
+from tests.utils import ASTGenerator, SOURCE, positions
+from src.astgen.aio import AsyncCompiler
+from src.utils.nodes import Program
+
+BAD_SOURCE = "void main() { int }"
+
+
+def run(test, **options):
+    async def main():
+        async with AsyncCompiler(workers=1, warm=False, **options) as compiler:
+            return await test(compiler)
+
+    return asyncio.run(main())
+
+
+# ========== Results ==========
+def test_generate_matches_generator():
+    """1. generate() returns the same Program or error string as ASTGenerator"""
+
+    async def test(compiler):
+        return await asyncio.gather(compiler.generate(SOURCE), compiler.generate(BAD_SOURCE))
+
+    program, error = run(test)
+    expected = ASTGenerator(SOURCE).generate()
+    assert isinstance(program, Program)
+    assert str(program) == str(expected) and positions(program) == positions(expected)
+    assert error == ASTGenerator(BAD_SOURCE).generate()
+
+
+def test_tokenize_and_check_syntax():
+    """2. tokenize() and check_syntax() report errors as strings"""
+
+    async def test(compiler):
+        return await asyncio.gather(
+            compiler.tokenize("int x;"),
+            compiler.tokenize('"bad \\q"'),
+            compiler.check_syntax(SOURCE),
+            compiler.check_syntax(BAD_SOURCE),
+        )
+
+    tokens, lexer_error, ok, syntax_error = run(test)
+    assert tokens == [["INT", "int", 1, 0], ["ID", "x", 1, 4], ["SEMI", ";", 1, 5]]
+    assert lexer_error.startswith("Illegal Escape")
+    assert ok is None and syntax_error.startswith("Error on line")
+
+
+def test_generate_files(tmp_path):
+    """3. generate_files() yields every path once, with read errors as strings"""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"f{i}.tyc"
+        path.write_text(SOURCE if i % 2 else BAD_SOURCE)
+        paths.append(path)
+    paths.append(tmp_path / "missing.tyc")
+
+    async def test(compiler):
+        return {path: result async for path, result in compiler.generate_files(paths)}
+
+    results = run(test, max_concurrency=2)
+    assert set(results) == set(paths)
+    assert all(isinstance(results[p], Program) for p in paths[1:5:2])
+    assert all(results[p] == ASTGenerator(BAD_SOURCE).generate() for p in paths[0:5:2])
+    assert results[paths[-1]].startswith("FileNotFoundError")
+
+
+# ========== Scheduling ==========
+def test_bounded_concurrency_keeps_loop_responsive():
+    """4. No more than max_concurrency requests reach the pool; the loop keeps running"""
+
+    async def test(compiler):
+        peak = ticks = 0
+        requests = asyncio.gather(*(compiler.generate(SOURCE) for _ in range(6)))
+        while not requests.done():
+            peak = max(peak, compiler.in_flight)
+            ticks += 1
+            await asyncio.sleep(0.001)
+        return peak, ticks, await requests
+
+    peak, ticks, programs = run(test, max_concurrency=2)
+    assert peak == 2 and ticks > 6
+    assert len({str(p) for p in programs}) == 1
+
+
+def test_cancellation():
+    """5. Cancelled requests release their slot and later requests still run"""
+
+    async def test(compiler):
+        tasks = [asyncio.ensure_future(compiler.generate(SOURCE)) for _ in range(4)]
+        await asyncio.sleep(0)
+        for task in tasks[1:]:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(task.cancelled() for task in tasks[1:])
+        assert compiler.in_flight == 0
+        return await compiler.generate(BAD_SOURCE)
+
+    assert run(test, max_concurrency=1) == ASTGenerator(BAD_SOURCE).generate()
@@ -0,0 +1,124 @@
+"""
+Tests for the array-backed AST arena.
+"""
+
+import pytest
+from tests.utils import ASTGenerator, SOURCE, positions
+from src.astgen.interning import FLOAT_TYPE, INT_TYPE, STRING_TYPE, VOID_TYPE
+from src.utils.arena import LIST, NONE, Arena, ArenaCursor
+from src.utils.nodes import *
+from src.utils.visitor import BaseVisitor
+
+
+class KindCounter(BaseVisitor):
+    """Counts visited node kinds; works on nodes and cursors alike"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def visit(self, node, o=None):
+        kind = node.kind if isinstance(node, ArenaCursor) else type(node)
+        self.counts[kind.__name__] = self.counts.get(kind.__name__, 0) + 1
+        return super().visit(node, o)
+
+
+# ========== Conversion ==========
+def test_round_trip_parsed_program():
+    """1. to_node() gives back the same tree, positions included"""
+    program = ASTGenerator(SOURCE).generate()
+    arena = Arena.from_node(program)
+    restored = arena.to_node()
+    assert restored is not program
+    assert str(restored) == str(program)
+    assert positions(restored) == positions(program)
+
+
+def test_round_trip_optional_fields_and_literals():
+    """2. None fields, empty lists and every literal kind survive encoding"""
+    program = Program([
+        FuncDecl(None, "f", [], BlockStmt([
+            ForStmt(None, None, None, BlockStmt([])),
+            VarDecl(None, "s", StringLiteral("hi")),
+            IfStmt(IntLiteral(2 ** 70), ReturnStmt(FloatLiteral(-0.0)), None),
+            ReturnStmt(FloatLiteral(0.0)),
+        ])),
+    ])
+    arena = Arena.from_node(program)
+    assert str(arena.to_node()) == str(program)
+    assert arena.constants == [2 ** 70, -0.0, 0.0]
+    assert sum(1 for code in arena.kind if code == NONE) == 6
+    assert sum(1 for code in arena.kind if code == LIST) == 4
+
+
+def test_subtree_to_node_and_deep_trees():
+    """3. Any cursor converts on its own; deep trees need no recursion"""
+    expr = IntLiteral(0)
+    for i in range(50_000):
+        expr = BinaryOp(expr, "+", Identifier(f"v{i % 7}"))
+    program = Program([FuncDecl(None, "f", [], BlockStmt([ExprStmt(expr)]))])
+    arena = Arena.from_node(program)
+    assert len(arena.strings) == 9
+    body = arena.root.decls[0].body
+    assert str(body.to_node()) == str(program.decls[0].body)
+    assert sum(1 for _ in body.walk()) == 100_003
+
+
+def test_unknown_node_class():
+    """4. Node classes the arena does not know are rejected"""
+
+    class Custom(Identifier):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Arena.from_node(Program([Custom("x")]))
+
+
+# ========== Cursor ==========
+def test_cursor_fields():
+    """5. Cursors read like the nodes they stand for"""
+    arena = Arena.from_node(ASTGenerator(SOURCE).generate())
+    add = arena.root.decls[1]
+    assert add.kind is FuncDecl
+    assert add.name == "add"
+    assert [p.name for p in add.params] == ["a", "b"]
+    assert add.return_type.kind is IntType
+    ret = add.body.statements[0]
+    assert ret.expr.operator == "+"
+    assert (ret.line, ret.column) == (3, 24)
+    loop = arena.root.decls[2].body.statements[1]
+    assert loop.init.init_value.value == 0
+    assert arena.root.decls[0].members[0].member_type.kind is IntType
+    assert [c.kind for c in ret.expr.children()] == [Identifier, Identifier]
+    with pytest.raises(AttributeError):
+        ret.else_stmt
+    blank = object.__new__(ArenaCursor)
+    with pytest.raises(AttributeError):
+        blank.arena
+    with pytest.raises(AttributeError):
+        blank.operator
+
+
+def test_walk_and_visitor_over_cursors():
+    """6. walk() and BaseVisitor traversal see the same nodes as on objects"""
+    program = ASTGenerator(SOURCE).generate()
+    arena = Arena.from_node(program)
+    assert [c.kind for c in arena.walk()] == [type(n) for n in walk(program)]
+    assert list(arena.root.walk()) == list(arena.walk())
+    on_nodes, on_cursors = KindCounter(), KindCounter()
+    on_nodes.visit(program)
+    on_cursors.visit(arena.root)
+    assert on_cursors.counts == on_nodes.counts
+
+
+def test_round_trip_keeps_shared_primitive_types():
+    """7. Primitive types come back as the interned instances"""
+    program = ASTGenerator("int f(float x, string s) { return 1; } void main() {}").generate()
+    restored = Arena.from_node(program).to_node()
+    decls = restored.decls
+    assert decls[0].return_type is INT_TYPE and decls[1].return_type is VOID_TYPE
+    assert decls[0].params[0].param_type is FLOAT_TYPE
+    assert decls[0].params[1].param_type is STRING_TYPE
+    positioned = IntType()
+    positioned.line, positioned.column = 3, 4
+    assert Arena.from_node(positioned).to_node() is not positioned
+    assert Arena.from_node(positioned).to_node().line == 3
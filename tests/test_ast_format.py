@@ -0,0 +1,78 @@
+"""
+Tests for the binary AST file format.
+"""
+
+import struct
+
+import pytest
+from tests.utils import ASTGenerator, SOURCE, positions
+from src.utils import ast_format
+from src.utils.ast_format import ASTFormatError, dump, dumps, load, loads
+from src.utils.nodes import *
+
+
+# ========== Round trip ==========
+def test_dump_and_load_file(tmp_path):
+    """1. A loaded file gives back the same tree, positions included"""
+    program = ASTGenerator(SOURCE).generate()
+    path = tmp_path / "program.tycast"
+    dump(program, path)
+    arena = load(path)
+    restored = arena.to_node()
+    assert str(restored) == str(program)
+    assert positions(restored) == positions(program)
+    assert dumps(arena) == path.read_bytes()
+
+
+def test_literals_and_unicode_names():
+    """2. Big ints, floats and non-ASCII strings survive encoding"""
+    program = Program([
+        FuncDecl(VoidType(), "main", [], BlockStmt([
+            VarDecl(None, "big", IntLiteral(10 ** 200)),
+            VarDecl(FloatType(), "f", FloatLiteral(-0.0)),
+            VarDecl(StringType(), "s", StringLiteral("héllo ✓")),
+            ReturnStmt(None),
+        ])),
+    ])
+    arena = loads(dumps(program))
+    statements = arena.root.decls[0].body.statements
+    assert statements[0].init_value.value == 10 ** 200
+    assert str(statements[1].init_value.value) == "-0.0"
+    assert statements[2].init_value.value == "héllo ✓"
+    assert statements[3].expr is None
+    assert str(arena.to_node()) == str(program)
+
+
+def test_load_is_lazy(tmp_path):
+    """3. Loading maps the columns and decodes table entries on first use"""
+    path = tmp_path / "program.tycast"
+    dump(ASTGenerator(SOURCE).generate(), path)
+    arena = load(path)
+    assert isinstance(arena.kind, memoryview) and arena.kind.readonly
+    assert all(value is None for value in arena.strings._cache)
+    assert arena.root.decls[1].name == "add"
+    assert sum(value is not None for value in arena.strings._cache) == 1
+
+
+# ========== Header checks ==========
+def test_rejects_other_versions_and_schemas():
+    """4. Version, grammar digest and length are checked before decoding"""
+    data = dumps(ASTGenerator("void main() {}").generate())
+    with pytest.raises(ASTFormatError, match="not a TyC AST file"):
+        loads(b"x" * len(data))
+    with pytest.raises(ASTFormatError, match="version"):
+        loads(data[:8] + struct.pack("<H", ast_format.FORMAT_VERSION + 1) + data[10:])
+    with pytest.raises(ASTFormatError, match="grammar"):
+        loads(data[:12] + bytes(32) + data[44:])
+    with pytest.raises(ASTFormatError, match="header implies"):
+        loads(data[:-1])
+    with pytest.raises(ASTFormatError, match="truncated"):
+        loads(b"")
+
+
+def test_empty_file(tmp_path):
+    """5. An empty file is reported as a format error"""
+    path = tmp_path / "empty.tycast"
+    path.write_bytes(b"")
+    with pytest.raises(ASTFormatError):
+        load(path)
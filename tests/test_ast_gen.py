@@ -8,11 +8,363 @@ from tests.utils import ASTGenerator
 
 
 def test_ast_gen_placeholder():
-    """Placeholder test - replace with actual test cases"""
+    """1. Empty main function"""
     source = """void main() {
 }"""
-    # TODO: Add actual test assertions
-    # Example:
-    # expected = "Program([FuncDecl(VoidType(), main, [], BlockStmt([]))])"
-    # assert str(ASTGenerator(source).generate()) == expected
-    assert True
+    expected = "Program([FuncDecl(VoidType(), main, [], BlockStmt([]))])"
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+# ========== Declarations ==========
+def test_empty_program():
+    """2. Empty program"""
+    assert str(ASTGenerator("").generate()) == "Program([])"
+
+
+def test_struct_decl():
+    """3. Struct declaration with primitive and struct members"""
+    source = "struct Line { Point a; float len; string tag; };"
+    expected = (
+        "Program([StructDecl(Line, [MemberDecl(StructType(Point), a), "
+        "MemberDecl(FloatType(), len), MemberDecl(StringType(), tag)])])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_empty_struct():
+    """4. Empty struct declaration"""
+    assert str(ASTGenerator("struct E {};").generate()) == "Program([StructDecl(E, [])])"
+
+
+def test_func_params():
+    """5. Function with parameters"""
+    source = "int add(int x, Point p) { return x; }"
+    expected = (
+        "Program([FuncDecl(IntType(), add, [Param(IntType(), x), Param(StructType(Point), p)], "
+        "BlockStmt([ReturnStmt(return Identifier(x))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_func_inferred_return():
+    """6. Function with omitted return type"""
+    source = "greet() { return; }"
+    expected = "Program([FuncDecl(auto, greet, [], BlockStmt([ReturnStmt(return)]))])"
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_func_struct_return():
+    """7. Function returning a struct type"""
+    source = "Point origin() { Point p = {0, 0}; return p; }"
+    expected = (
+        "Program([FuncDecl(StructType(Point), origin, [], BlockStmt(["
+        "VarDecl(StructType(Point), p = StructLiteral({IntLiteral(0), IntLiteral(0)})), "
+        "ReturnStmt(return Identifier(p))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+# ========== Statements ==========
+def test_var_decls():
+    """8. Variable declarations with and without initialization"""
+    source = 'void main() { auto a; auto b = 1; float c; string d = "hi"; }'
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([VarDecl(auto, a), "
+        "VarDecl(auto, b = IntLiteral(1)), VarDecl(FloatType(), c), "
+        "VarDecl(StringType(), d = StringLiteral('hi'))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_assign_stmt():
+    """9. Assignment statement becomes an expression statement"""
+    source = "void main() { p.x = 3; }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt(["
+        "ExprStmt(AssignExpr(MemberAccess(Identifier(p).x) = IntLiteral(3)))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_if_else():
+    """10. If-else statement"""
+    source = "void main() { if (x) y; else { z; } }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([IfStmt(if Identifier(x) "
+        "then ExprStmt(Identifier(y)), else BlockStmt([ExprStmt(Identifier(z))]))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_dangling_else():
+    """11. Else binds to the innermost if"""
+    source = "void main() { if (a) if (b) x; else y; }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([IfStmt(if Identifier(a) "
+        "then IfStmt(if Identifier(b) then ExprStmt(Identifier(x)), "
+        "else ExprStmt(Identifier(y))))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_while():
+    """12. While statement with break and continue"""
+    source = "void main() { while (1) { break; continue; } }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([WhileStmt(while IntLiteral(1) "
+        "do BlockStmt([BreakStmt(), ContinueStmt()]))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_for_full():
+    """13. For statement with all parts"""
+    source = "void main() { for (auto i = 0; i < 3; i++) printInt(i); }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([ForStmt(for "
+        "VarDecl(auto, i = IntLiteral(0)); BinaryOp(Identifier(i), <, IntLiteral(3)); "
+        "PostfixOp(Identifier(i)++) do ExprStmt(FuncCall(printInt, [Identifier(i)])))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_for_assign_parts():
+    """14. For statement with assignment init and update"""
+    source = "void main() { for (i = 0; ; i = i + 1) {} }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([ForStmt(for "
+        "ExprStmt(AssignExpr(Identifier(i) = IntLiteral(0))); None; "
+        "AssignExpr(Identifier(i) = BinaryOp(Identifier(i), +, IntLiteral(1))) "
+        "do BlockStmt([]))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_for_empty():
+    """15. For statement with all parts empty"""
+    source = "void main() { for (;;) --n; }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([ForStmt(for None; None; None "
+        "do ExprStmt(PrefixOp(--Identifier(n))))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_switch():
+    """16. Switch with cases around default"""
+    source = "void main() { switch (x) { case 1: case 2: a; break; default: b; case -3: } }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt([SwitchStmt(switch Identifier(x) "
+        "cases [CaseStmt(case IntLiteral(1): []), CaseStmt(case IntLiteral(2): "
+        "[ExprStmt(Identifier(a)), BreakStmt()]), CaseStmt(case PrefixOp(-IntLiteral(3)): [])], "
+        "default DefaultStmt(default: [ExprStmt(Identifier(b))]))]))])"
+    )
+    program = ASTGenerator(source).generate()
+    assert str(program) == expected
+    switch = program.decls[0].body.statements[0]
+    assert switch.default_index == 2
+    assert [type(clause).__name__ for clause in switch.clauses()] == ["CaseStmt", "CaseStmt", "DefaultStmt", "CaseStmt"]
+
+
+def test_switch_empty():
+    """17. Empty switch"""
+    source = "void main() { switch (x) {} }"
+    expected = (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt(["
+        "SwitchStmt(switch Identifier(x) cases [])]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+
+# ========== Expressions ==========
+def expr_of(expression: str) -> str:
+    """AST string of the initializer in `auto v = <expression>;`."""
+    program = ASTGenerator(f"void main() {{ auto v = {expression}; }}").generate()
+    return str(program.decls[0].body.statements[0].init_value)
+
+
+def test_precedence_mul_over_add():
+    """18. Multiplicative binds tighter than additive"""
+    assert expr_of("1 + 2 * 3") == (
+        "BinaryOp(IntLiteral(1), +, BinaryOp(IntLiteral(2), *, IntLiteral(3)))"
+    )
+
+
+def test_left_associative():
+    """19. Binary operators are left associative"""
+    assert expr_of("a - b - c") == (
+        "BinaryOp(BinaryOp(Identifier(a), -, Identifier(b)), -, Identifier(c))"
+    )
+
+
+def test_logical_precedence():
+    """20. && binds tighter than ||, comparisons tighter than both"""
+    assert expr_of("a || b && c == d < e") == (
+        "BinaryOp(Identifier(a), ||, BinaryOp(Identifier(b), &&, BinaryOp(Identifier(c), ==, "
+        "BinaryOp(Identifier(d), <, Identifier(e)))))"
+    )
+
+
+def test_unary_over_mul():
+    """21. Unary operators bind tighter than multiplicative"""
+    assert expr_of("-a * !b") == (
+        "BinaryOp(PrefixOp(-Identifier(a)), *, PrefixOp(!Identifier(b)))"
+    )
+
+
+def test_postfix_over_prefix():
+    """22. Postfix binds tighter than prefix"""
+    assert expr_of("-x++") == "PrefixOp(-PostfixOp(Identifier(x)++))"
+
+
+def test_member_access_chain():
+    """23. Member access is left associative and binds tightest"""
+    assert expr_of("-a.b.c") == (
+        "PrefixOp(-MemberAccess(MemberAccess(Identifier(a).b).c))"
+    )
+
+
+def test_assignment_right_associative():
+    """24. Assignment is right associative"""
+    assert expr_of("a = b = 1") == (
+        "AssignExpr(Identifier(a) = AssignExpr(Identifier(b) = IntLiteral(1)))"
+    )
+
+
+def test_assignment_in_parens():
+    """25. Parenthesized assignment used as an operand"""
+    assert expr_of("(a = 5) + 7") == (
+        "BinaryOp(AssignExpr(Identifier(a) = IntLiteral(5)), +, IntLiteral(7))"
+    )
+
+
+def test_parens_override_precedence():
+    """26. Parentheses override precedence and leave no node"""
+    assert expr_of("(1 + 2) * 3") == (
+        "BinaryOp(BinaryOp(IntLiteral(1), +, IntLiteral(2)), *, IntLiteral(3))"
+    )
+
+
+def test_func_call_args():
+    """27. Function call with nested call and struct literal argument"""
+    assert expr_of('f(g(), {1, "s"}, 2.5)') == (
+        "FuncCall(f, [FuncCall(g, []), StructLiteral({IntLiteral(1), StringLiteral('s')}), "
+        "FloatLiteral(2.5)])"
+    )
+
+
+def test_literals():
+    """28. Literal values are converted"""
+    assert expr_of("1.") == "FloatLiteral(1.0)"
+    assert expr_of("1e3") == "FloatLiteral(1000.0)"
+    assert expr_of('"a\\tb"') == "StringLiteral('a\\\\tb')"
+
+
+# ========== Positions and errors ==========
+def test_node_positions():
+    """29. Nodes carry the line and column where they start"""
+    source = "void main() {\n    int x = 1 + y;\n}"
+    program = ASTGenerator(source).generate()
+    decl = program.decls[0].body.statements[0]
+    assert (decl.line, decl.column) == (2, 4)
+    assert (decl.init_value.line, decl.init_value.column) == (2, 12)
+    assert (decl.init_value.right.line, decl.init_value.right.column) == (2, 16)
+
+
+def test_syntax_error_message():
+    """30. Syntax errors are reported through generate()"""
+    result = ASTGenerator("void main() { int x }").generate()
+    assert result == "AST Generation Error: Error on line 1 col 20: }"
+
+
+# ========== Node layout ==========
+def test_nodes_have_no_instance_dict():
+    """31. Every node class stores its fields in __slots__"""
+    import inspect
+    from src.utils import nodes
+
+    program = ASTGenerator("struct P { int x; }; void main() { P p = {1}; p.x++; }").generate()
+    assert not hasattr(program, "__dict__")
+    for name, cls in inspect.getmembers(nodes, inspect.isclass):
+        if issubclass(cls, nodes.ASTNode):
+            assert "__slots__" in vars(cls), name
+    with pytest.raises(AttributeError):
+        program.typo = 1
+
+
+def test_primitive_types_are_shared():
+    """32. Primitive type nodes are one shared instance per type"""
+    from src.astgen.interning import INT_TYPE, VOID_TYPE
+
+    source = "struct S { int a; }; void f(int x, float y) { int z; float w; } int g() { return 1; }"
+    program = ASTGenerator(source).generate()
+    struct, f, g = program.decls
+    assert struct.members[0].member_type is INT_TYPE
+    assert f.return_type is VOID_TYPE
+    assert f.params[0].param_type is INT_TYPE is g.return_type
+    assert f.params[1].param_type is f.body.statements[1].var_type
+    assert str(f.params[1].param_type) == "FloatType()"
+
+
+def test_names_are_interned():
+    """33. Every occurrence of a name is the same string object"""
+    source = "struct Point { int x; }; void main() { Point p; p.x = p.x + 1; main(); }"
+    generator = ASTGenerator(source)
+    program = generator.generate()
+    struct, main = program.decls
+    decl, assign, call = main.body.statements
+    lhs, rhs = assign.expr.lhs, assign.expr.rhs
+    assert decl.var_type.struct_name is struct.name
+    assert decl.name is lhs.obj.name is rhs.left.obj.name
+    assert lhs.member is rhs.left.member is struct.members[0].name
+    assert call.expr.name is main.name
+    assert "Point" in generator.ast_generator.names
+
+
+# ========== Serialization ==========
+def test_str_of_deep_expression():
+    """34. str() of a very deep expression does not recurse"""
+    from src.utils.nodes import BinaryOp, Identifier, IntLiteral
+
+    depth = 100_000
+    expr = IntLiteral(1)
+    for _ in range(depth):
+        expr = BinaryOp(expr, "+", Identifier("a"))
+    text = str(expr)
+    assert text.startswith("BinaryOp(" * depth + "IntLiteral(1), +, Identifier(a))")
+    assert text.endswith(", +, Identifier(a))")
+
+
+def test_str_of_deep_blocks():
+    """35. str() of deeply nested statements does not recurse"""
+    from src.utils.nodes import BlockStmt, IfStmt, Identifier, BreakStmt
+
+    depth = 50_000
+    stmt = BreakStmt()
+    for _ in range(depth):
+        stmt = IfStmt(Identifier("c"), BlockStmt([stmt]), BreakStmt())
+    text = str(stmt)
+    assert text.count("IfStmt(if Identifier(c) then BlockStmt([") == depth
+    assert text.endswith("]), else BreakStmt())")
+
+
+def test_serialize_into_buffer():
+    """36. serialize() appends to a caller-supplied StringIO"""
+    import io
+    from src.utils.nodes import serialize
+
+    program = ASTGenerator("void main() { return; }").generate()
+    out = io.StringIO()
+    out.write("> ")
+    assert serialize(program, out) == "> " + str(program)
+    assert str(program) == "Program([FuncDecl(VoidType(), main, [], BlockStmt([ReturnStmt(return)]))])"
+
+
+# ========== Operand forms ==========
+def test_calls_need_a_function_name():
+    """37. Calls are on function names only and are syntax errors otherwise"""
+    assert expr_of("-++(f()).x") == "PrefixOp(-PrefixOp(++MemberAccess(FuncCall(f, []).x)))"
+    assert expr_of("f(1)--") == "PostfixOp(FuncCall(f, [IntLiteral(1)])--)"
+    for expression in ("a.b()", "f()(1)", "x++()", "(f)()"):
+        result = ASTGenerator(f"void main() {{ {expression}; }}").generate()
+        assert result == "AST Generation Error: Error on line 1 col 17: ("
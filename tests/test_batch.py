@@ -0,0 +1,74 @@
+"""
+Tests for batch compilation and the run.py compile command.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from tests.utils import ASTGenerator, project_root, SOURCE
+from src.astgen.batch import compile_file, compile_files, expand_paths
+
+BAD_SOURCE = "void main() { int x = ; }"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for i in range(6):
+        (tmp_path / f"f{i}.tyc").write_text(f"int f{i}() {{ return {i}; }}\n")
+    (tmp_path / "sub" / "main.tyc").write_text(SOURCE)
+    (tmp_path / "sub" / "bad.tyc").write_text(BAD_SOURCE)
+    (tmp_path / "notes.txt").write_text("not TyC")
+    return tmp_path
+
+
+def by_file(results):
+    return {os.path.basename(r["file"]): r for r in results}
+
+
+# ========== Paths ==========
+def test_expand_paths(corpus):
+    """1. Files, directories and globs expand in order without duplicates"""
+    assert len(expand_paths([str(corpus)])) == 8
+    paths = expand_paths([str(corpus / "f1.tyc"), str(corpus / "*.tyc"), str(corpus / "**" / "ba*.tyc")])
+    assert [os.path.basename(p) for p in paths] == [f"f{i}.tyc" for i in (1, 0, 2, 3, 4, 5)] + ["bad.tyc"]
+
+
+# ========== Compiling ==========
+def test_compile_file_results(corpus):
+    """2. Results carry the AST or the error string ASTGenerator reports"""
+    good = compile_file(str(corpus / "sub" / "main.tyc"))
+    assert good["ok"] and good["ast"] == str(ASTGenerator(SOURCE).generate())
+    bad = compile_file(str(corpus / "sub" / "bad.tyc"))
+    assert not bad["ok"] and bad["error"] == ASTGenerator(BAD_SOURCE).generate()
+    missing = compile_file(str(corpus / "missing.tyc"), include_ast=False)
+    assert not missing["ok"] and missing["error"].startswith("FileNotFoundError")
+    assert "ast" not in compile_file(str(corpus / "f0.tyc"), include_ast=False)
+
+
+def test_compile_files_on_workers(corpus, tmp_path_factory):
+    """3. Every file comes back once; a cache turns the second run into hits"""
+    paths = expand_paths([str(corpus)])
+    cache_dir = tmp_path_factory.mktemp("cache")
+    first = by_file(compile_files(paths, workers=2, cache_dir=cache_dir, warm=False))
+    assert sorted(first) == sorted(os.path.basename(p) for p in paths)
+    assert [name for name, r in first.items() if not r["ok"]] == ["bad.tyc"]
+    assert not any(r["cached"] for r in first.values())
+    second = by_file(compile_files(paths, workers=2, cache_dir=cache_dir, warm=False))
+    assert all(r["cached"] for r in second.values())
+    assert second["main.tyc"]["ast"] == first["main.tyc"]["ast"]
+
+
+def test_run_py_compile(corpus):
+    """4. run.py compile prints one JSON line per file and fails on errors"""
+    command = [sys.executable, "run.py", "compile", str(corpus / "*.tyc"), "--workers", "2", "--no-ast"]
+    done = subprocess.run(command, cwd=project_root, capture_output=True, text=True)
+    assert done.returncode == 0, done.stderr
+    lines = [json.loads(line) for line in done.stdout.splitlines()]
+    assert len(lines) == 6 and all(r["ok"] and "ast" not in r for r in lines)
+    done = subprocess.run(command[:3] + [str(corpus / "sub")], cwd=project_root, capture_output=True, text=True)
+    assert done.returncode == 1
+    assert "1 failed" in done.stderr
@@ -0,0 +1,68 @@
+"""
+Tests for the call graph and call-graph-ordered return type inference.
+"""
+
+import pytest
+from tests.utils import ASTGenerator
+from src.astgen.interning import FLOAT_TYPE, INT_TYPE, VOID_TYPE
+from src.semantics.call_graph import call_graph, inference_order, strongly_connected_components
+from src.semantics.static_error import TypeCannotBeInferred, TypeMismatchInStatement
+from src.semantics.type_inference import infer_types
+
+SOURCE = """
+void main() { auto x = even(4); printInt(x); helper(); }
+even(int n) { if (n == 0) return 1; return odd(n - 1); }
+odd(int n) { if (n == 0) return 0; return even(n - 1); }
+helper() { printFloat(scale(2.0)); }
+float scale(float f) { return f * 2; }
+"""
+
+
+def names(components):
+    return [[decl.name for decl in component] for component in components]
+
+
+# ========== Graph ==========
+def test_call_graph_edges():
+    """1. Edges go to called user functions once each, skipping builtins"""
+    program = ASTGenerator(SOURCE).generate()
+    assert call_graph(program.decls) == [[1, 3], [2], [1], [4], []]
+
+
+def test_components_callees_first():
+    """2. Mutually recursive functions share a component listed after its callees"""
+    program = ASTGenerator(SOURCE).generate()
+    assert names(inference_order(program)) == [["even", "odd"], ["scale"], ["helper"], ["main"]]
+    assert strongly_connected_components([[0], [0, 2], [1]]) == [[0], [1, 2]]
+
+
+def test_deep_chain_is_iterative():
+    """3. Very long call chains need no recursion"""
+    n = 20000
+    graph = [[i + 1] for i in range(n - 1)] + [[0]]
+    assert strongly_connected_components(graph) == [list(range(n))]
+    graph[-1] = []
+    assert strongly_connected_components(graph) == [[i] for i in reversed(range(n))]
+
+
+# ========== Inference ==========
+def test_mutual_recursion_and_forward_calls():
+    """4. Return types of recursive and later-declared functions are inferred"""
+    program = infer_types(ASTGenerator(SOURCE).generate())
+    types = {decl.name: decl.inferred_type for decl in program.decls}
+    assert types == {"main": VOID_TYPE, "even": INT_TYPE, "odd": INT_TYPE, "helper": VOID_TYPE, "scale": FLOAT_TYPE}
+
+
+def test_return_statements_decide_before_callers():
+    """5. A caller declared first cannot change an inferred return type"""
+    with pytest.raises(TypeMismatchInStatement) as error:
+        infer_types(ASTGenerator("void main() { float y = f(); } f() { return 1; }").generate())
+    assert str(error.value) == "Type Mismatch In Statement: VarDecl(FloatType(), y = FuncCall(f, []))"
+
+
+def test_unresolvable_cycle():
+    """6. A cycle with no base case cannot be inferred"""
+    source = "f(int n) { return g(n); } g(int n) { return f(n); } void main() {}"
+    with pytest.raises(TypeCannotBeInferred) as error:
+        infer_types(ASTGenerator(source).generate())
+    assert str(error.value) == "Type Cannot Be Inferred: ReturnStmt(return FuncCall(g, [Identifier(n)]))"
@@ -0,0 +1,178 @@
+"""
+Stress tests for deeply nested TyC input.
+Machine-generated programs nest far beyond Python's default recursion limit;
+ASTGenerator(..., deep=True) must parse them and build the AST anyway, and
+str() of the result must not recurse either.
+"""
+
+import sys
+
+import pytest
+from tests.utils import ASTGenerator
+from antlr4 import CommonTokenStream, InputStream
+from src.astgen.ast_generation import IterativeASTGeneration, generate_ast
+from src.astgen.parse_cache import generate_result
+from src.utils.nodes import BinaryOp, BlockStmt, ExprStmt, FuncCall, IfStmt, IntLiteral, PrefixOp, StructLiteral
+from src.utils.parsing import make_lexer, make_parser, parse_program
+
+DEPTH = 10_000
+
+
+def deep_ast(source):
+    program = ASTGenerator(source, deep=True).generate()
+    assert not isinstance(program, str), program
+    return program
+
+
+def first_stmt(program):
+    return program.decls[0].body.statements[0]
+
+
+def chain_length(node, cls, attr):
+    """Follow attr links through nodes of type cls, counting them"""
+    count = 0
+    while isinstance(node, cls):
+        node = getattr(node, attr)
+        count += 1
+    return count, node
+
+
+# ========== Expressions ==========
+def test_left_deep_addition_chain():
+    """1. x = 1 + 1 + ... with 20k operands"""
+    operands = 2 * DEPTH
+    program = deep_ast("void main() { int x = " + " + ".join(["1"] * operands) + "; }")
+    count, leaf = chain_length(first_stmt(program).init_value, BinaryOp, "left")
+    assert count == operands - 1
+    assert str(leaf) == "IntLiteral(1)"
+    assert str(program).count("IntLiteral(1)") == operands
+
+
+def test_nested_parentheses():
+    """2. Parenthesised expression nested 10k deep"""
+    program = deep_ast("void main() { int x = " + "(" * DEPTH + "a + 1" + ")" * DEPTH + "; }")
+    assert str(first_stmt(program)) == "VarDecl(IntType(), x = BinaryOp(Identifier(a), +, IntLiteral(1)))"
+
+
+def test_right_deep_assignment_chain():
+    """3. a = a = ... = 1 with 10k assignments"""
+    program = deep_ast("void main() { " + "a = " * DEPTH + "1; }")
+    node = first_stmt(program).expr
+    count = 0
+    while hasattr(node, "rhs"):
+        node = node.rhs
+        count += 1
+    assert count == DEPTH
+    assert str(node) == "IntLiteral(1)"
+
+
+def test_unary_chain():
+    """4. 10k prefix minus operators"""
+    program = deep_ast("void main() { x = " + "- " * DEPTH + "1; }")
+    count, leaf = chain_length(first_stmt(program).expr.rhs, PrefixOp, "operand")
+    assert count == DEPTH
+    assert str(leaf) == "IntLiteral(1)"
+
+
+def test_nested_calls_and_struct_literals():
+    """5. f(f(...)) and {{...}} nested 10k deep"""
+    program = deep_ast(
+        "void main() { " + "f(" * DEPTH + "0" + ")" * DEPTH + "; "
+        "P p = " + "{" * DEPTH + "1" + "}" * DEPTH + "; }"
+    )
+    call, decl = program.decls[0].body.statements
+    node, calls = call.expr, 0
+    while isinstance(node, FuncCall):
+        node = node.args[0]
+        calls += 1
+    assert calls == DEPTH and str(node) == "IntLiteral(0)"
+    node, literals = decl.init_value, 0
+    while isinstance(node, StructLiteral):
+        node = node.values[0]
+        literals += 1
+    assert literals == DEPTH and str(node) == "IntLiteral(1)"
+
+
+# ========== Statements ==========
+def test_nested_blocks():
+    """6. Blocks nested 10k deep"""
+    program = deep_ast("void main() " + "{ x++; " * DEPTH + "}" * DEPTH)
+    node, blocks = program.decls[0].body, 0
+    while isinstance(node, BlockStmt):
+        blocks += 1
+        node = node.statements[-1]
+    assert blocks == DEPTH
+    assert str(node) == "ExprStmt(PostfixOp(Identifier(x)++))"
+
+
+def test_else_if_ladder():
+    """7. if / else if ladder 10k long"""
+    program = deep_ast("void main() { " + "if (x) y = 1; else " * DEPTH + "y = 2; }")
+    count, last = chain_length(first_stmt(program), IfStmt, "else_stmt")
+    assert count == DEPTH
+    assert str(last) == "ExprStmt(AssignExpr(Identifier(y) = IntLiteral(2)))"
+
+
+def test_nested_if_then():
+    """8. if (c) if (c) ... nested 10k deep in the then branch"""
+    program = deep_ast("void main() { " + "if (c) " * DEPTH + "return; }")
+    count, last = chain_length(first_stmt(program), IfStmt, "then_stmt")
+    assert count == DEPTH
+    assert str(last) == "ReturnStmt(return)"
+
+
+# ========== Modes agree ==========
+@pytest.mark.parametrize(
+    "source",
+    [
+        "void main() { int x = " + " * ".join(["(a + 2)"] * 200) + "; }",
+        "void main() " + "{ if (a) b = c = 1; else while (d) { e--; } " * 100 + "}" * 100,
+        "struct P { int x; }; int f(P p) { return p.x; } void main() { P q = {1}; f(q); }",
+    ],
+    ids=["product", "statements", "declarations"],
+)
+def test_deep_mode_matches_default_mode(source):
+    """9. deep=True builds the same AST as the recursive path"""
+    assert str(deep_ast(source)) == str(ASTGenerator(source).generate())
+
+
+def test_generate_ast_reports_errors():
+    """10. Syntax errors propagate out of the deep-stack thread"""
+    with pytest.raises(Exception) as info:
+        generate_ast("void main() { " + "(" * DEPTH + "1; }", deep=True)
+    assert str(info.value).startswith("Error on line 1 col ")
+
+
+def test_child_results_are_released():
+    """11. Results of children are dropped once their parent is built"""
+
+    class PeakDict(dict):
+        peak = 0
+
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            PeakDict.peak = max(PeakDict.peak, len(self))
+
+    class SkipExpressions(IterativeASTGeneration):
+        def visitExprStmt(self, ctx):
+            return ExprStmt(IntLiteral(0))
+
+    generator = SkipExpressions()
+    generator._results = PeakDict()
+    source = "void main() { " + "x = x + 1; " * DEPTH + "}"
+    tree, _ = parse_program(make_parser(CommonTokenStream(make_lexer(InputStream(source)))))
+    program = generator.visit(tree)
+    assert len(program.decls[0].body.statements) == DEPTH
+    # The statements wait for their block; the unused expressions do not
+    assert PeakDict.peak <= DEPTH + 10
+    assert not generator._results
+
+
+def test_cached_deep_generation():
+    """12. generate_result(deep=True) runs the deep path and restores the recursion limit"""
+    limit = sys.getrecursionlimit()
+    source = "int main() " + "{ if (a) " * DEPTH + "return 1;" + " }" * DEPTH
+    program = generate_result(source, deep=True)
+    assert not isinstance(program, str), program
+    assert isinstance(first_stmt(program), IfStmt)
+    assert sys.getrecursionlimit() == limit
@@ -0,0 +1,169 @@
+"""
+Differential tests: FastLexer against the generated TyCLexer.
+Every source string used in tests/test_lexer.py (plus a few extra edge cases)
+is tokenized by both lexers, and the full token streams must be identical,
+including positions and the lexical errors raised along the way.
+"""
+
+import ast
+import io
+import mmap
+import os
+
+import pytest
+from tests.utils import TyCLexer, InputStream, CommonTokenStream
+from src.utils.fast_lexer import FastLexer, iter_tokens
+
+
+def lexer_corpus():
+    """Collect the literal arguments of every Tokenizer(...) in test_lexer.py."""
+    path = os.path.join(os.path.dirname(__file__), "test_lexer.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [
+        node.args[0].value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and getattr(node.func, "id", None) == "Tokenizer"
+        and node.args
+        and isinstance(node.args[0], ast.Constant)
+    ]
+
+
+EXTRA_CASES = [
+    "/* unterminated comment",
+    "a /* x */ b // tail",
+    "1.e5 1e 1e+ .5e-2 0123 1..2 a.5",
+    '"ok" "bad\\q" "tail',
+    '"cr\r\nnext"',
+    '"lone\rcr"',
+    '"esc at end\\',
+    '"esc newline\\\nnext',
+    "x\r\ny\n\n  z\f\tw",
+    "intx int_ _int auto1 whilex",
+    "a+++b---c<=>=!===&&||",
+    "@ # $ x",
+    "",
+]
+
+
+def token_stream(lexer, limit=10000):
+    """Drain a token source, recording lexer errors and continuing past them."""
+    result = []
+    for _ in range(limit):
+        try:
+            token = lexer.nextToken()
+        except Exception as e:
+            result.append(("error", type(e).__name__, str(e)))
+            continue
+        result.append(
+            (token.type, token.text, token.line, token.column, token.start, token.stop)
+        )
+        if token.type == -1:
+            break
+    return result
+
+
+@pytest.mark.parametrize("source", lexer_corpus() + EXTRA_CASES)
+def test_fast_lexer_matches_tyc_lexer(source):
+    expected = token_stream(TyCLexer(InputStream(source)))
+    assert token_stream(FastLexer(source)) == expected
+
+
+def test_fast_lexer_corpus_is_not_empty():
+    """The corpus extraction found the lexer test inputs"""
+    assert len(lexer_corpus()) >= 100
+
+
+def test_fast_lexer_in_token_stream():
+    """FastLexer plugs into CommonTokenStream and drives TyCParser"""
+    from src.utils.parsing import make_parser, parse_program
+
+    source = "struct P { int x; }; void main() { P p = {1}; printInt(p.x + 2); }"
+    parser = make_parser(CommonTokenStream(FastLexer(source)))
+    tree, mode = parse_program(parser)
+    assert mode == "SLL"
+    assert tree.getText() == source.replace(" ", "") + "<EOF>"
+
+
+def test_fast_lexer_syntax_error_message():
+    """Syntax errors read token text and positions from FastLexer tokens"""
+    from src.utils.parsing import make_parser, parse_program
+
+    parser = make_parser(CommonTokenStream(FastLexer("void main() {\n  int x\n}")))
+    with pytest.raises(Exception) as info:
+        parse_program(parser)
+    assert str(info.value) == "Error on line 3 col 0: }"
+
+
+# ========== Streaming iter_tokens ==========
+
+
+def expected_tuples(source):
+    """(type, text, line, column) from TyCLexer, ending at EOF or an error"""
+    result = []
+    for entry in token_stream(TyCLexer(InputStream(source))):
+        if entry[0] == "error":
+            result.append(entry)
+            break
+        result.append(entry[:4])
+    return result
+
+
+def streamed_tuples(source, chunk_size):
+    result = []
+    try:
+        for entry in iter_tokens(source, chunk_size):
+            result.append(entry)
+    except Exception as e:
+        result.append(("error", type(e).__name__, str(e)))
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64])
+def test_iter_tokens_chunk_boundaries(chunk_size):
+    """Every chunk size yields TyCLexer's tokens, errors included"""
+    for source in lexer_corpus() + EXTRA_CASES:
+        assert streamed_tuples(source, chunk_size) == expected_tuples(source), source
+
+
+def test_iter_tokens_multiline_block_comment_across_chunks():
+    source = "a /* one\ntwo\nthree */ b\n/* open\n\nc"
+    assert streamed_tuples(source, 4) == expected_tuples(source)
+
+
+def test_iter_tokens_long_line_in_small_chunks():
+    """A line far longer than the chunk size is buffered and scanned once"""
+    source = "x = a + 1; " * 20000
+    tokens = streamed_tuples(source, 3)
+    assert len(tokens) == 6 * 20000 + 1
+    assert tokens[-2][1:] == (";", 1, len(source) - 2)
+
+
+def test_iter_tokens_file_objects(tmp_path):
+    """Text files, binary files and mmaps all stream the same tokens"""
+    source = 'string s = "héllo ✓";\n/* ü */ int x = 1e+5;\n' * 50
+    path = tmp_path / "big.tyc"
+    path.write_text(source, encoding="utf-8")
+    expected = expected_tuples(source)
+
+    assert streamed_tuples(io.StringIO(source), 7) == expected
+    assert streamed_tuples(io.BytesIO(source.encode("utf-8")), 7) == expected
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert streamed_tuples(m, 5) == expected
+    with open(path, encoding="utf-8") as f:
+        assert streamed_tuples(f, 11) == expected
+
+
+def test_iter_tokens_is_lazy():
+    """Tokens come out before the rest of the input is read"""
+    consumed = []
+
+    class Source:
+        def read(self, size):
+            consumed.append(size)
+            return "int x;\n" if len(consumed) < 1000 else ""
+
+    tokens = iter_tokens(Source(), 16)
+    assert next(tokens)[1] == "int"
+    assert len(consumed) < 5
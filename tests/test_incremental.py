@@ -0,0 +1,122 @@
+"""
+Tests for incremental re-parsing of edited sources.
+Every edit is checked against a full parse of the edited text: same AST,
+same positions.
+"""
+
+import pytest
+from tests.utils import SOURCE, positions
+from antlr4 import CommonTokenStream, InputStream
+from src.astgen.ast_generation import generate_ast
+from src.astgen.incremental import IncrementalParser
+from src.utils.nodes import FuncDecl, StructDecl
+from src.utils.parsing import make_lexer, make_parser, parse_program
+
+
+def edit_matches_full_parse(parser, start, end, new_text):
+    expected = generate_ast(parser.text[:start] + new_text + parser.text[end:])
+    program = parser.edit(start, end, new_text)
+    assert str(program) == str(expected)
+    assert positions(program) == positions(expected)
+    return program
+
+
+# ========== Edits ==========
+def test_edit_inside_function_reparses_only_it():
+    """1. A body edit rebuilds one declaration and keeps the others"""
+    parser = IncrementalParser(SOURCE)
+    struct, add, main = parser.program.decls
+    at = SOURCE.index("a + b;")
+    program = edit_matches_full_parse(parser, at, at + len("a + b"), "a * b")
+    assert parser.last_reparsed == range(1, 2)
+    assert program.decls[0] is struct and program.decls[2] is main
+    assert program.decls[1] is not add
+    assert parser.full_parses == 1
+
+
+def test_line_and_column_shifts():
+    """2. Later declarations move down and, on the edited line, sideways"""
+    source = "int a() { return 1; } int b() { return 2; }\nvoid c() {}\n"
+    parser = IncrementalParser(source)
+    edit_matches_full_parse(parser, source.index("1;"), source.index("1;") + 1, "1 +\n  10")
+    edit_matches_full_parse(parser, 0, 0, "\n\n")
+    edit_matches_full_parse(parser, parser.text.index("\nvoid"), parser.text.index("\nvoid") + 1, " ")
+    assert parser.full_parses == 1
+
+
+def test_insert_and_delete_declarations():
+    """3. Edits between declarations add and remove whole declarations"""
+    parser = IncrementalParser(SOURCE)
+    at = SOURCE.index("void main")
+    program = edit_matches_full_parse(parser, at, at, "struct Q { float f; };\nint g() { return 0; }\n")
+    assert [type(d) for d in program.decls] == [StructDecl, FuncDecl, StructDecl, FuncDecl, FuncDecl]
+    start = parser.text.index("int add")
+    end = parser.text.index("void main")
+    program = edit_matches_full_parse(parser, start, end, "")
+    assert [d.name for d in program.decls] == ["Point", "main"]
+    assert parser.full_parses == 1
+
+
+def test_edit_touching_declaration_boundary():
+    """4. Text glued onto a declaration's first token re-lexes it"""
+    source = "int a() {}\nint b() {}\n"
+    parser = IncrementalParser(source)
+    program = edit_matches_full_parse(parser, source.index("b"), source.index("b"), "x")
+    assert program.decls[1].name == "xb"
+    program = edit_matches_full_parse(parser, 0, 3, "float")
+    assert str(program.decls[0].return_type) == "FloatType()"
+
+
+# ========== Errors ==========
+def test_errors_fall_back_to_full_parse():
+    """5. Region errors re-parse everything and raise like a full parse"""
+    parser = IncrementalParser(SOURCE)
+    at = SOURCE.index("return a + b;")
+    with pytest.raises(Exception) as full_error:
+        generate_ast(SOURCE[:at] + "return a + ;" + SOURCE[at + len("return a + b;"):])
+    with pytest.raises(Exception) as edit_error:
+        parser.edit(at, at + len("return a + b;"), "return a + ;")
+    assert str(edit_error.value) == str(full_error.value)
+    assert parser.program is None
+    program = parser.edit(at, at + len("return a + ;"), "return a + b;")
+    assert str(program) == str(generate_ast(SOURCE))
+
+
+def test_comment_spanning_declarations():
+    """6. Opening a comment that ends past the edited declaration"""
+    source = "int a() {}\nint b() {}\n// */\nint c() {}\n"
+    parser = IncrementalParser(source)
+    at = source.index("int b")
+    program = edit_matches_full_parse(parser, at, at, "/*")
+    assert [d.name for d in program.decls] == ["a", "c"]
+    program = edit_matches_full_parse(parser, at, at + 2, "")
+    assert [d.name for d in program.decls] == ["a", "b", "c"]
+    assert parser.full_parses == 1
+
+
+@pytest.mark.parametrize(
+    "new_text",
+    ["//", "/*", "/* x */ /*", '"', "int", "/"],
+)
+def test_tokens_crossing_region_end(new_text):
+    """7. A token running into the next declaration forces a full parse"""
+    source = "int a(){} int b(){}\nvoid c(){ /* */ }"
+    parser = IncrementalParser(source)
+    try:
+        expected = str(generate_ast(source[:9] + new_text + source[9:]))
+    except Exception as error:
+        with pytest.raises(type(error)):
+            parser.edit(9, 9, new_text)
+    else:
+        assert str(parser.edit(9, 9, new_text)) == expected
+
+
+def test_from_existing_parse():
+    """8. An IncrementalParser can adopt an existing tree and AST"""
+    parser = make_parser(CommonTokenStream(make_lexer(InputStream(SOURCE))))
+    tree, _ = parse_program(parser)
+    program = generate_ast(SOURCE)
+    incremental = IncrementalParser.from_tree(SOURCE, tree, program)
+    at = SOURCE.index("int b")
+    assert edit_matches_full_parse(incremental, at, at + 5, "int c") is program
+    assert incremental.full_parses == 0
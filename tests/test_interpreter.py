@@ -0,0 +1,185 @@
+"""
+Tests for the TyC interpreter.
+Programs come from ASTGenerator and run with in-memory stdin and stdout.
+"""
+
+import io
+
+import pytest
+from tests.utils import ASTGenerator
+from src.runtime.interpreter import Console, interpret
+from src.runtime.runtime_error import DivisionByZero, InvalidInput, StackOverflow
+from src.semantics.static_error import TypeMismatchInStatement, Undeclared
+
+
+def run(source, stdin=""):
+    stdout = io.StringIO()
+    interpret(ASTGenerator(source).generate(), io.StringIO(stdin), stdout)
+    return stdout.getvalue().splitlines()
+
+
+# ========== Specification examples ==========
+def test_calculator_and_loops():
+    """1. Input, functions, while and for loops"""
+    source = """
+    int add(int x, int y) { return x + y; }
+    multiply(int x, int y) { return x * y; }
+    void main() {
+        auto a = readInt(); auto b = readInt();
+        printInt(add(a, b)); printInt(multiply(a, b));
+        auto i = 0;
+        while (i < b) { printInt(i); ++i; }
+        for (auto j = 0; j < b; ++j) { if (j % 2 == 0) { printInt(j); } }
+    }
+    """
+    assert run(source, "3\n4\n") == ["7", "12", "0", "1", "2", "3", "0", "2"]
+
+
+def test_recursion_and_io_builtins():
+    """2. Recursive calls and every builtin"""
+    source = """
+    int factorial(int n) { if (n <= 1) { return 1; } else { return n * factorial(n - 1); } }
+    void main() {
+        printInt(factorial(readInt()));
+        auto f = readFloat(); printFloat(f * 2);
+        auto name = readString(); printString("Hello, \\""); printString(name);
+    }
+    """
+    assert run(source, "10\n1.25\n  Ada  \n") == ["3628800", "2.5", 'Hello, "', "  Ada  "]
+
+
+def test_structs_are_values():
+    """3. Struct assignment, arguments and returns copy every member"""
+    source = """
+    struct Point { int x; int y; };
+    struct Line { Point a; Point b; };
+    Point moved(Point p) { p.x = p.x + 100; return p; }
+    void main() {
+        Point p1; p1.x = 10;
+        Point p2 = {30, 40};
+        p1 = p2; p2.x = 99;
+        Line l = {p1, {1, 2}};
+        Point q = moved(l.a);
+        l.a.y++;
+        printInt(p1.x); printInt(p1.y); printInt(l.a.y); printInt(q.x); printInt(l.a.x);
+        Line empty; printInt(empty.b.y);
+    }
+    """
+    assert run(source) == ["30", "40", "41", "130", "30", "0"]
+
+
+# ========== Control flow ==========
+def test_switch_fall_through():
+    """4. Cases fall through until break; default runs when nothing matches"""
+    source = """
+    void show(int n) {
+        switch (n) {
+            case 1: printInt(1);
+            case 2: case 1+2: printInt(3); break;
+            case -4: printInt(-4); nothing(); break;
+            default: printInt(0);
+        }
+    }
+    void nothing() {}
+    void main() {
+        for (int i = -4; i <= 4; ++i) { show(i); }
+        auto k = 2;
+        switch (k) { case k: printInt(100); }
+        for (auto i = 0; i < 3; i++) { switch (i) { case 1: continue; } printInt(i); }
+    }
+    """
+    expected = ["-4", "0", "0", "0", "0", "1", "3", "3", "3", "0", "100", "0", "2"]
+    assert run(source) == expected
+
+
+def test_default_between_cases():
+    """5. A default written between cases falls through in source order"""
+    source = """
+    void show(int n) { switch (n) { case 1: printInt(1); default: printInt(0); case 2: printInt(2); } }
+    void main() { show(1); show(5); show(2); }
+    """
+    assert run(source) == ["1", "0", "2", "0", "2", "2"]
+
+
+def test_loops_break_continue_return():
+    """6. break and continue affect the innermost loop; return leaves any depth"""
+    source = """
+    int find(int target) {
+        for (int i = 0; ; i++) { while (1) { if (i == target) return i * 10; break; } }
+    }
+    void main() {
+        int i = 0;
+        while (i < 10) { i++; if (i % 3) continue; if (i > 7) break; printInt(i); }
+        for (int j = 0; j < 3; j = j + 1) {}
+        printInt(find(4));
+    }
+    """
+    assert run(source) == ["3", "6", "40"]
+
+
+# ========== Values ==========
+def test_arithmetic_follows_c():
+    """7. Integer division and remainder truncate toward zero"""
+    source = """
+    void main() {
+        auto a = -7; auto b = 2;
+        printInt(a / b); printInt(a % b); printInt(7 % -2); printInt(-7 / 2); printInt(-8 % 4);
+        printFloat(7.0 / 2); printFloat(1 + 0.5);
+        printInt(2 < 3); printInt(3 && 4); printInt(0 || 0); printInt(!5); printInt(-(+a));
+        int x; x = 5; int y = (x = 6) + 1; printInt(x); printInt(y); printInt(x++); printInt(--x);
+        printString("tab\\there");
+    }
+    """
+    assert run(source) == ["-3", "-1", "1", "-3", "0", "3.5", "1.5", "1", "1", "0", "0", "7", "6", "7", "6", "6", "tab\there"]
+
+
+def test_deep_and_runaway_recursion():
+    """8. Deep recursion runs; runaway recursion raises Stack Overflow after flushing output"""
+    depth = "int depth(int n) { if (n == 0) return 0; return depth(n - 1) + 1; }"
+    assert run(depth + " void main() { printInt(depth(20000)); }") == ["20000"]
+    source = "int f(int n) { return f(n + 1) + 1; } void main() { printInt(depth(100)); printInt(f(0)); }"
+    stdout = io.StringIO()
+    with pytest.raises(StackOverflow):
+        interpret(ASTGenerator(depth + source).generate(), io.StringIO(), stdout)
+    assert stdout.getvalue() == "100\n"
+
+
+# ========== I/O and errors ==========
+def test_output_is_buffered_and_flushed_before_reads():
+    """9. Output is written in chunks and before each read"""
+
+    class Recorder(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = []
+
+        def write(self, text):
+            self.writes.append(text)
+            return super().write(text)
+
+    stdout = Recorder()
+    source = 'void main() { printString("name?"); auto s = readString(); printString(s); printInt(1); printInt(2); }'
+    interpret(ASTGenerator(source).generate(), io.StringIO("Bo\n"), stdout)
+    assert stdout.writes == ["name?\n", "Bo\n1\n2\n"]
+    console = Console(io.StringIO(), stdout, limit=4)
+    console.write("ab")
+    console.write("cd")
+    assert stdout.writes[-1] == "abcd"
+
+
+@pytest.mark.parametrize(
+    "source, stdin, error, message",
+    [
+        ("void main() { auto z = 0; printInt(1 / z); }", "", DivisionByZero, "Division By Zero: BinaryOp(IntLiteral(1), /, Identifier(z))"),
+        ("void main() { printInt(5 % 0); }", "", DivisionByZero, "Division By Zero: BinaryOp(IntLiteral(5), %, IntLiteral(0))"),
+        ("void main() { printInt(readInt()); }", "1.5\n", InvalidInput, "Invalid Input For readInt: '1.5'"),
+        ("void main() { printFloat(readFloat()); }", "", InvalidInput, "Invalid Input For readFloat: ''"),
+        ("void f() {}", "", Undeclared, "Undeclared Function: main"),
+        ("void main() { int x = 1.5; }", "", TypeMismatchInStatement, "Type Mismatch In Statement: VarDecl(IntType(), x = FloatLiteral(1.5))"),
+    ],
+)
+def test_errors(source, stdin, error, message):
+    """10. Runtime and static errors are raised as exceptions"""
+    with pytest.raises(error) as info:
+        run(source, stdin)
+    assert str(info.value) == message
@@ -0,0 +1,76 @@
+"""
+Tests for parallel parsing across processes.
+Results and errors are compared with a sequential parse of the same text.
+"""
+
+import pytest
+from tests.utils import SOURCE, positions
+from src.astgen.ast_generation import generate_ast
+from src.astgen.parallel import make_executor, parse_parallel, plan_chunks, split_declarations
+
+BIG_SOURCE = SOURCE * 60
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with make_executor(2) as pool:
+        yield pool
+
+
+def sequential_error(source):
+    with pytest.raises(Exception) as error:
+        generate_ast(source)
+    return str(error.value)
+
+
+# ========== Pre-scan ==========
+def test_split_declarations():
+    """1. Cuts fall after each declaration, ignoring braces in strings and comments"""
+    source = 'struct S { int a; };\nint f() { printString("}{;"); } // }\nvoid g() { /* } */ }\n'
+    cuts = split_declarations(source)
+    assert cuts == [source.index("};") + 2, source.index("} //") + 1, source.rindex("}") + 1]
+    assert split_declarations("int f() { {") == []
+
+
+def test_plan_chunks_covers_text():
+    """2. Chunks are contiguous, cover the text and end at declaration ends"""
+    ranges = plan_chunks(BIG_SOURCE, 8)
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(BIG_SOURCE)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(BIG_SOURCE[end - 1] in "};" for _, end in ranges[:-1])
+
+
+# ========== Parsing ==========
+def test_matches_sequential_parse(executor):
+    """3. Same AST and positions as a sequential parse"""
+    program = parse_parallel(BIG_SOURCE, 2, executor)
+    expected = generate_ast(BIG_SOURCE)
+    assert str(program) == str(expected)
+    assert positions(program) == positions(expected)
+
+
+def test_own_pool_and_small_sources():
+    """4. Works without a pool; small sources parse in-process"""
+    assert str(parse_parallel(BIG_SOURCE, 2)) == str(generate_ast(BIG_SOURCE))
+    assert str(parse_parallel(SOURCE, 2)) == str(generate_ast(SOURCE))
+
+
+# ========== Errors ==========
+def test_first_error_wins(executor):
+    """5. With errors in several chunks the sequential first error is raised"""
+    lines = BIG_SOURCE.split("\n")
+    lines[len(lines) // 2] += " int"
+    lines[-5] += " @"
+    source = "\n".join(lines)
+    with pytest.raises(Exception) as error:
+        parse_parallel(source, 2, executor)
+    assert str(error.value) == sequential_error(source)
+
+
+def test_lexer_error_in_late_chunk(executor):
+    """6. Lexer errors are reported like a sequential parse"""
+    source = BIG_SOURCE + 'void h() { printString("bad \\q"); }\n'
+    with pytest.raises(Exception) as error:
+        parse_parallel(source, 2, executor)
+    assert str(error.value) == sequential_error(source)
@@ -0,0 +1,148 @@
+"""
+Tests for the on-disk parse cache.
+"""
+
+import os
+
+from tests.utils import ASTGenerator, SOURCE, positions
+from src.astgen import ast_generation
+from src.astgen.parse_cache import ParseCache
+from src.utils.nodes import Program
+
+
+def entry_paths(cache):
+    return {path for _, path, _ in cache._entries()}
+
+
+# ========== Hits and misses ==========
+def test_hit_returns_same_ast(tmp_path):
+    """1. A second generate() is a hit with an identical AST"""
+    cache = ParseCache(tmp_path)
+    first = ASTGenerator(SOURCE, cache=cache).generate()
+    second = ASTGenerator(SOURCE, cache=cache).generate()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert isinstance(second, Program) and second is not first
+    assert str(second) == str(first)
+    assert positions(second) == positions(first)
+
+
+def test_errors_are_cached(tmp_path):
+    """2. Lexer and parser error strings are cached like ASTs"""
+    cache = ParseCache(tmp_path)
+    for source in ('void main() { string s = "abc; }', "void main() { int x = ; }"):
+        expected = ASTGenerator(source).generate()
+        assert isinstance(expected, str)
+        assert cache.generate(source) == expected
+        assert cache.generate(source) == expected
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_hit_skips_parsing(tmp_path, monkeypatch):
+    """3. Hits never call the parser; a new source misses"""
+    cache = ParseCache(tmp_path)
+    expected = str(cache.generate(SOURCE))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed on a cache hit")
+
+    monkeypatch.setattr(ast_generation, "generate_ast", fail)
+    assert str(ParseCache(tmp_path).generate(SOURCE)) == expected
+    generator = ASTGenerator(SOURCE, cache=ParseCache(tmp_path))
+    assert str(generator.generate()) == expected
+    assert generator.lexer is None and generator.parser is None
+    assert ParseCache(tmp_path).generate(SOURCE + " ").startswith("AST Generation Error")
+
+
+def test_key_depends_on_source_and_generator(tmp_path, monkeypatch):
+    """4. Keys change with the source text, deep and the generator digest"""
+    from src.astgen import parse_cache
+
+    cache = ParseCache(tmp_path)
+    key = cache.key("void main() {}")
+    assert cache.key("void main() { }") != key
+    assert cache.key("void main() {}", deep=True) != key
+    monkeypatch.setattr(parse_cache, "generator_digest", lambda: b"other")
+    assert cache.key("void main() {}") != key
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """5. Unreadable entries are deleted and parsed again"""
+    cache = ParseCache(tmp_path)
+    cache.generate(SOURCE)
+    (path,) = entry_paths(cache)
+    with open(path, "r+b") as f:
+        f.write(b"garbage!")
+    assert isinstance(cache.generate(SOURCE), Program)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert isinstance(cache.generate(SOURCE), Program)
+    assert cache.hits == 1
+
+
+# ========== Eviction ==========
+def test_lru_eviction_by_size(tmp_path):
+    """6. Past max_bytes the least recently used entries go first"""
+    sources = [f"void f{i}() {{ int x = {i}; }}" for i in range(4)]
+    cache = ParseCache(tmp_path)
+    for age, source in enumerate(sources):
+        cache.generate(source)
+        for path in entry_paths(cache):
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    size = os.path.getsize(next(iter(entry_paths(cache))))
+    # sources[0] is the oldest write, but this hit makes it the newest use
+    assert cache.get(sources[0]) is not None
+
+    small = ParseCache(tmp_path, max_bytes=2 * size)
+    small.evict()
+    assert len(small) == 2
+    assert small.get(sources[0]) is not None
+    assert small.get(sources[3]) is not None
+    assert small.get(sources[1]) is None
+
+
+def test_put_evicts_and_clear(tmp_path):
+    """7. put() keeps the cache within budget; clear() empties it"""
+    cache = ParseCache(tmp_path, max_bytes=1)
+    cache.generate(SOURCE)
+    assert len(cache) == 0
+    cache = ParseCache(tmp_path)
+    cache.generate(SOURCE)
+    cache.generate("void main() { int x = ; }")
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0 and cache.get(SOURCE) is None
+
+
+def test_overwrite_and_touch_race(tmp_path, monkeypatch):
+    """8. Overwriting an entry keeps the size exact; a hit survives a lost touch"""
+    cache = ParseCache(tmp_path)
+    program = ASTGenerator(SOURCE).generate()
+    for _ in range(3):
+        cache.put(SOURCE, program)
+    assert cache._size == sum(size for _, _, size in cache._entries())
+
+    def evicted(path, *args, **kwargs):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "utime", evicted)
+    assert str(cache.get(SOURCE)) == str(program)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+# ========== Environment errors ==========
+def test_recursion_error_is_not_cached(tmp_path, monkeypatch):
+    """9. A RecursionError is reported but not stored; the next call parses again"""
+    cache = ParseCache(tmp_path)
+
+    def overflow(*args, **kwargs):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(ast_generation, "generate_ast", overflow)
+    assert cache.generate(SOURCE) == "AST Generation Error: maximum recursion depth exceeded"
+    generator = ASTGenerator(SOURCE, cache=cache)
+    monkeypatch.setattr(generator.ast_generator, "visit", overflow)
+    assert generator.generate().startswith("AST Generation Error: maximum recursion")
+    assert len(cache) == 0
+    monkeypatch.undo()
+    assert isinstance(cache.generate(SOURCE), Program)
+    assert cache.misses == 3 and cache.get(SOURCE, deep=True) is None
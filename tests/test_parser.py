@@ -633,4 +633,106 @@ def test_error_empty_function_params():
 def test_error_invalid_member():
     """100. Error: invalid member access"""
     source = "void main() { auto x = a.; }"
-    assert Parser(source).parse() != "success"
\ No newline at end of file
+    assert Parser(source).parse() != "success"
+
+
+# ========== Two-stage SLL/LL parsing ==========
+def test_parse_mode_sll_fast_path():
+    """101. Valid program finishes on the SLL fast path"""
+    parser = Parser("int f(int x) { return x * 2; } void main() { printInt(f(3)); }")
+    assert parser.parse() == "success"
+    assert parser.parse_mode == "SLL"
+
+
+def test_parse_mode_error_matches_ll():
+    """102. Syntax error is reported by the LL pass with the usual message"""
+    parser = Parser("void main() { int x }")
+    assert parser.parse() == "Error on line 1 col 20: }"
+    assert parser.parse_mode is None
+
+
+def test_parse_stats_hit_rate():
+    """103. Parse statistics record the mode of each successful parse"""
+    from src.utils.parsing import ParseStats, parse_program
+    from build.TyCParser import TyCParser
+    from tests.utils import TyCLexer, InputStream, CommonTokenStream
+
+    stats = ParseStats()
+    for source in ["void main() {}", "struct P { int x; };"]:
+        parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+        parse_program(parser, stats)
+    assert stats.sll == 2 and stats.ll == 0
+    assert stats.hit_rate == 1.0
+
+
+# ========== Shared prediction caches ==========
+def test_warm_up_populates_shared_dfa():
+    """104. Warm-up fills the shared DFA and parsing its corpus adds no states"""
+    from src.utils.parsing import dfa_state_count
+    from src.utils.warmup import WARMUP_CORPUS, warm_up
+
+    states = warm_up()
+    assert states > 0
+    assert warm_up() == states == dfa_state_count()
+    for source in WARMUP_CORPUS:
+        assert Parser(source).parse() == "success"
+
+
+def test_private_caches_start_empty():
+    """105. Parsers built with shared=False use their own empty DFA"""
+    from src.utils.parsing import make_lexer, make_parser, parse_program
+    from tests.utils import CommonTokenStream, InputStream
+
+    parser = make_parser(
+        CommonTokenStream(make_lexer(InputStream("void main() {}"), shared=False)),
+        shared=False,
+    )
+    assert all(len(dfa.states) == 0 for dfa in parser._interp.decisionToDFA)
+    assert parse_program(parser)[1] == "SLL"
+    assert any(len(dfa.states) > 0 for dfa in parser._interp.decisionToDFA)
+
+
+# ========== Parity with the original expression grammar ==========
+# Verdicts of the grammar before the expression rules were flattened, except
+# that only a function name can be called
+@pytest.mark.parametrize(
+    "expr, accepted",
+    [
+        ("a.b()", False),
+        ("f()()", False),
+        ("x++()", False),
+        ("(f)()", False),
+        ("f()++", True),
+        ("-++x", True),
+        ("++ ++x", True),
+        ("- -!x", True),
+        ("(f()).x", True),
+        ("{1, 2}.x", True),
+        ("a.b.c", True),
+        ("1 + 2 * -f(a) % b.c", True),
+        ("++-x", False),
+        ("++!x", False),
+        ("f().x", False),
+        ("x++.y", False),
+        ("-f(a).x", False),
+    ],
+)
+def test_expression_forms_match_original_grammar(expr, accepted):
+    """106. Operand forms are accepted as by the original grammar; calls need a name"""
+    result = Parser("void main() { " + expr + "; }").parse()
+    assert (result == "success") == accepted, result
+
+
+# ========== Warm-up corpus errors ==========
+def test_warm_up_skips_only_lex_and_parse_errors(monkeypatch):
+    """107. Bad corpus entries are skipped; other failures propagate"""
+    from src.utils import warmup
+
+    assert warmup.warm_up(["void main() { int }", 'void main() { "open', "void main() {}"]) > 0
+
+    def broken(parser, stats):
+        raise RuntimeError("broken parser")
+
+    monkeypatch.setattr(warmup, "parse_program", broken)
+    with pytest.raises(RuntimeError, match="broken parser"):
+        warmup.warm_up(["void main() {}"])
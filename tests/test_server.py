@@ -0,0 +1,140 @@
+"""
+Tests for the compile server and its client.
+A server runs on a background thread with its socket under tmp_path.
+"""
+
+import json
+import socket
+import struct
+import threading
+
+import pytest
+from tests.utils import ASTGenerator, SOURCE
+from src.astgen import client as client_module
+from src.astgen.client import Client, main, recv_message
+from src.astgen.server import serve
+
+
+@pytest.fixture
+def server_path(tmp_path):
+    path = str(tmp_path / "tyc.sock")
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(path, str(tmp_path / "cache")), kwargs={"warm": False, "ready": ready})
+    thread.start()
+    assert ready.wait(10)
+    yield path
+    try:
+        with Client(path) as client:
+            client.request("shutdown")
+    except OSError:
+        pass  # the test already shut it down
+    thread.join(10)
+    assert not thread.is_alive()
+
+
+# ========== Requests ==========
+def test_compile_matches_generator(server_path):
+    """1. compile returns the same AST and errors as ASTGenerator"""
+    with Client(server_path) as client:
+        response = client.compile(SOURCE)
+        assert response["ok"] and response["ast"] == str(ASTGenerator(SOURCE).generate())
+        assert response["ms"] >= 0
+        assert "ast" not in client.compile(SOURCE, include_ast=False)
+        response = client.compile("void main() { int }")
+        assert not response["ok"]
+        assert response["error"] == ASTGenerator("void main() { int }").generate()
+        stats = client.request("stats")
+        assert stats["requests"] == 4 and stats["cache_hits"] == 1
+
+
+def test_parse_and_tokenize(server_path):
+    """2. parse reports syntax errors; tokenize lists tokens with positions"""
+    with Client(server_path) as client:
+        assert client.parse(SOURCE)["ok"]
+        assert not client.parse("void main() {")["ok"]
+        tokens = client.tokenize("int x;\n  x = 1;")["tokens"]
+        assert tokens[0] == ["INT", "int", 1, 0]
+        assert tokens[-2][1:] == ["1", 2, 6]
+        assert not client.tokenize('"bad \\q"')["ok"]
+
+
+def test_bad_requests(server_path):
+    """3. Unknown ops and missing sources are errors; bad frames close the connection"""
+    with Client(server_path) as client:
+        assert client.request("optimize")["error"] == "unknown op 'optimize'"
+        assert not client.request("compile")["ok"]
+        assert client.request("ping")["ok"]
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(server_path)
+        payload = b"[1, 2]"
+        sock.sendall(struct.pack(">I", len(payload)) + payload)
+        assert recv_message(sock) == {"ok": False, "error": "frame is not a JSON object"}
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(server_path)
+        sock.sendall(struct.pack(">I", 3) + b"{x}")
+        assert recv_message(sock)["error"].startswith("bad JSON frame")
+        with pytest.raises(ConnectionError):
+            recv_message(sock)
+
+
+def test_oversized_response(server_path, monkeypatch):
+    """4. A response too large for one frame becomes an error frame"""
+    monkeypatch.setattr(client_module, "MAX_FRAME", 4096)
+    with Client(server_path) as client:
+        response = client.tokenize("int x = 1;\n" * 200)
+        assert not response["ok"] and "exceeds 4096" in response["error"]
+        assert client.request("ping")["ok"]
+
+
+# ========== Lifecycle ==========
+def test_second_server_refused(server_path):
+    """5. A live socket is not replaced by a second server"""
+    with pytest.raises(OSError, match="already listening"):
+        serve(server_path, warm=False)
+    with Client(server_path) as client:
+        assert client.request("ping")["ok"]
+
+
+def test_stale_socket_replaced(tmp_path):
+    """6. A socket file left by a dead server is removed on start-up"""
+    path = str(tmp_path / "stale.sock")
+    dead = socket.socket(socket.AF_UNIX)
+    dead.bind(path)
+    dead.close()
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(path,), kwargs={"warm": False, "ready": ready})
+    thread.start()
+    assert ready.wait(10)
+    with Client(path) as client:
+        assert client.request("shutdown")["ok"]
+    thread.join(10)
+    assert not thread.is_alive()
+    assert not (tmp_path / "stale.sock").exists()
+
+
+def test_non_socket_not_replaced(tmp_path):
+    """7. A regular file at the socket path is left alone"""
+    path = tmp_path / "notes.sock"
+    path.write_text("keep me")
+    with pytest.raises(OSError, match="not a socket"):
+        serve(str(path), warm=False)
+    assert path.read_text() == "keep me"
+
+
+# ========== Command line ==========
+def test_client_main(server_path, tmp_path, capsys):
+    """8. The client prints one JSON line per file and fails if any file fails"""
+    good = tmp_path / "good.tyc"
+    bad = tmp_path / "bad.tyc"
+    good.write_text(SOURCE)
+    bad.write_text("void main() { int }")
+    assert main(["compile", str(good), "--socket", server_path, "--no-ast"]) == 0
+    assert main(["compile", str(good), str(bad), "--socket", server_path]) == 1
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(line["file"], line["ok"]) for line in lines] == [
+        (str(good), True),
+        (str(good), True),
+        (str(bad), False),
+    ]
+    assert "ast" not in lines[0] and "ast" in lines[1]
+    assert main(["shutdown", "--socket", server_path]) == 0
@@ -0,0 +1,69 @@
+"""
+Tests for ChunkedInputStream: TyCLexer over a chunked or memory-mapped
+source must produce exactly the tokens it produces over InputStream.
+"""
+
+import io
+
+import pytest
+from tests.utils import InputStream, CommonTokenStream
+from tests.test_fast_lexer import EXTRA_CASES, lexer_corpus, token_stream
+from src.utils.parsing import make_lexer, make_parser, parse_program
+from src.utils.streams import ChunkedInputStream, open_source
+
+
+def texts_after_drain(lexer):
+    """Token stream entries, read again after the lexer has moved past them"""
+    tokens = []
+    while True:
+        try:
+            token = lexer.nextToken()
+        except Exception:
+            continue
+        tokens.append(token)
+        if token.type == -1:
+            return [(t.type, t.text, t.line, t.column, t.start, t.stop) for t in tokens]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_chunked_stream_matches_input_stream(chunk_size):
+    """TyCLexer sees the same characters through either stream"""
+    for source in lexer_corpus() + EXTRA_CASES:
+        expected = token_stream(make_lexer(InputStream(source)))
+        stream = ChunkedInputStream(io.StringIO(source), chunk_size)
+        assert token_stream(make_lexer(stream)) == expected, source
+
+
+def test_chunked_stream_releases_consumed_input():
+    """Only about one chunk plus the current token stays buffered"""
+    source = "int x = 1;\n" * 5000
+    stream = ChunkedInputStream(io.StringIO(source), 256)
+    lexer = make_lexer(stream)
+    tokens = texts_after_drain(lexer)
+    assert len(tokens) == 5 * 5000 + 1
+    assert tokens[0][1] == "int" and tokens[-2][1] == ";"
+    assert len(stream._buffer) < 3 * 256
+
+
+def test_open_source_parses_file(tmp_path):
+    """A memory-mapped file parses, and syntax errors still quote token text"""
+    path = tmp_path / "prog.tyc"
+    path.write_text('void main() {\n  string s = "héllo";\n  printString(s);\n}\n' * 3, encoding="utf-8")
+    with open_source(path, chunk_size=8) as stream:
+        tree, mode = parse_program(make_parser(CommonTokenStream(make_lexer(stream))))
+    assert mode == "SLL"
+    assert tree.getText().count('"héllo"') == 0 and tree.getText().count("héllo") == 3
+
+    path.write_text("void main() {\n  int x\n}\n", encoding="utf-8")
+    with open_source(path, chunk_size=4) as stream:
+        parser = make_parser(CommonTokenStream(make_lexer(stream)))
+        with pytest.raises(Exception) as info:
+            parse_program(parser)
+    assert str(info.value) == "Error on line 3 col 0: }"
+
+
+def test_open_source_empty_file(tmp_path):
+    path = tmp_path / "empty.tyc"
+    path.write_bytes(b"")
+    with open_source(path) as stream:
+        assert make_lexer(stream).nextToken().type == -1
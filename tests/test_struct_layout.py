@@ -0,0 +1,71 @@
+"""
+Tests for struct layouts and member slot annotation.
+"""
+
+import pytest
+from tests.utils import ASTGenerator
+from src.astgen.interning import FLOAT_TYPE, INT_TYPE, STRING_TYPE
+from src.semantics.static_error import Redeclared, Undeclared
+from src.semantics.struct_layout import StructLayout, build_layouts
+from src.semantics.type_inference import infer_types
+from src.utils.nodes import IntType, MemberAccess, MemberDecl, Program, StructDecl, StructLiteral, StructType, walk
+
+SOURCE = """
+struct Point { int x; float y; };
+struct Line { string label; Point a; Point b; };
+void main() {
+    Line l = {"l", {1, 2.0}, {3, 4.5}};
+    l.b.y = l.a.y + l.b.x;
+    auto p = l.a;
+    p = {p.x, 0.5};
+}
+"""
+
+
+# ========== Layouts ==========
+def test_slots_follow_declaration_order():
+    """1. Members get consecutive slots and canonical types"""
+    program = ASTGenerator(SOURCE).generate()
+    layouts = build_layouts(program)
+    point, line = layouts["Point"], layouts["Line"]
+    assert list(layouts) == ["Point", "Line"] and program.decls[0].layout is point
+    assert point.names == ["x", "y"] and point.types == [INT_TYPE, FLOAT_TYPE]
+    assert line.index == {"label": (0, STRING_TYPE), "a": (1, point.type), "b": (2, point.type)}
+    assert (len(line), line.slot("b"), line.slot("z")) == (3, 2, None)
+
+
+def test_hand_built_types_are_canonical():
+    """2. Member types of hand-built trees map to the shared instances"""
+    program = Program([StructDecl("S", [MemberDecl(IntType(), "n")])])
+    assert build_layouts(program)["S"].types == [INT_TYPE]
+    layout = StructLayout("T")
+    assert layout.add("a", INT_TYPE) == 0 and layout.add("b", FLOAT_TYPE) == 1
+
+
+@pytest.mark.parametrize(
+    "source, error, message",
+    [
+        ("struct A { A next; };", Undeclared, "Undeclared Struct: A"),
+        ("struct A { B b; }; struct B { A a; };", Undeclared, "Undeclared Struct: B"),
+        ("struct A { Missing m; };", Undeclared, "Undeclared Struct: Missing"),
+        ("struct A { int a; float a; };", Redeclared, "Redeclared Member: a"),
+        ("struct A {}; struct A {};", Redeclared, "Redeclared Struct: A"),
+    ],
+)
+def test_layout_errors(source, error, message):
+    """3. Recursive, undefined and duplicate declarations are rejected once"""
+    with pytest.raises(error) as info:
+        build_layouts(ASTGenerator(source + " void main() {}").generate())
+    assert str(info.value) == message
+
+
+# ========== Annotation ==========
+def test_member_access_and_literals_annotated():
+    """4. Type inference records member slots and literal layouts"""
+    program = infer_types(ASTGenerator(SOURCE).generate())
+    point, line = (decl.layout for decl in program.decls[:2])
+    accesses = [(node.member, node.slot) for node in walk(program) if isinstance(node, MemberAccess)]
+    assert accesses == [("y", 1), ("b", 2), ("y", 1), ("a", 1), ("x", 0), ("b", 2), ("a", 1), ("x", 0)]
+    literals = [node.layout for node in walk(program) if isinstance(node, StructLiteral)]
+    assert literals == [line, point, point, point]
+    assert all(isinstance(node.inferred_type, StructType) for node in walk(program) if isinstance(node, StructLiteral))
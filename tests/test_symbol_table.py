@@ -0,0 +1,109 @@
+"""
+Tests for the scoped symbol table and name resolution.
+"""
+
+import pytest
+from tests.utils import ASTGenerator
+from src.semantics.static_error import Redeclared, Undeclared
+from src.semantics.symbol_table import BUILTINS, Symbol, SymbolTable, resolve_names
+from src.utils.nodes import FuncCall, Identifier, StructType, walk
+
+
+def resolve(source):
+    program = ASTGenerator(source).generate()
+    return program, resolve_names(program)
+
+
+def references(program, cls):
+    return [(node.name if cls is not StructType else node.struct_name, node.symbol_id) for node in walk(program) if isinstance(node, cls)]
+
+
+# ========== SymbolTable ==========
+def test_shadowing_and_undo():
+    """1. Inner declarations shadow outer ones until their scope is popped"""
+    table = SymbolTable()
+    table.push()
+    outer = Symbol(0, "x", "Variable", None)
+    table.declare(outer)
+    table.push()
+    assert table.lookup("x") is outer and not table.declared_here("x")
+    inner = Symbol(1, "x", "Variable", None)
+    table.declare(inner)
+    table.declare(Symbol(2, "y", "Variable", None))
+    assert table.lookup("x") is inner and table.declared_here("x") and table.depth == 2
+    table.pop()
+    assert table.lookup("x") is outer and table.lookup("y") is None
+    table.pop()
+    assert table.lookup("x") is None and table.depth == 0
+
+
+# ========== Resolution ==========
+def test_ids_follow_scopes():
+    """2. References resolve to the innermost visible declaration"""
+    program, symbols = resolve(
+        """
+        struct P { int v; };
+        int f(int x) {
+            int y = x;
+            { auto x = 1.5; y = y + 1; printFloat(x); }
+            for (auto i = 0; i < x; ++i) { P p = {i}; }
+            switch (y) { case 1: auto z = 1; break; default: z = 2; }
+            return f(x);
+        }
+        void main() {}
+        """
+    )
+    builtins = len(BUILTINS)
+    p, f, main = builtins, builtins + 1, builtins + 2
+    x, y, inner_x, i, pv, z = range(builtins + 3, builtins + 9)
+    assert [(s.name, s.kind) for s in symbols[builtins:]] == [
+        ("P", "Struct"), ("f", "Function"), ("main", "Function"),
+        ("x", "Parameter"), ("y", "Variable"), ("x", "Variable"), ("i", "Variable"), ("p", "Variable"), ("z", "Variable"),
+    ]
+    assert references(program, Identifier) == [
+        ("x", x), ("y", y), ("y", y), ("x", inner_x), ("i", i), ("x", x), ("i", i), ("i", i), ("y", y), ("z", z), ("x", x),
+    ]
+    assert references(program, FuncCall) == [("printFloat", list(BUILTINS).index("printFloat")), ("f", f)]
+    assert references(program, StructType) == [("P", p)]
+    assert program.decls[1].symbol_id == f and program.decls[2].symbol_id == main
+
+
+def test_ids_are_stable():
+    """3. Resolving the same program twice gives the same IDs"""
+    source = "int g(int a) { auto b = a; { int c = b; } return b; } void main() { g(1); }"
+    first, _ = resolve(source)
+    second, _ = resolve(source)
+    ids = lambda program: [getattr(n, "symbol_id", None) for n in walk(program)]
+    assert ids(first) == ids(second)
+
+
+# ========== Errors ==========
+@pytest.mark.parametrize(
+    "source, error, message",
+    [
+        ("void main() { x = 1; }", Undeclared, "Undeclared Variable: x"),
+        ("void main() { { int x; } x = 1; }", Undeclared, "Undeclared Variable: x"),
+        ("void main() { auto x = x; }", Undeclared, "Undeclared Variable: x"),
+        ("void main() { f(); }", Undeclared, "Undeclared Function: f"),
+        ("struct A { A next; }; void main() {}", Undeclared, "Undeclared Struct: A"),
+        ("void f(int a) { int a; } void main() {}", Redeclared, "Redeclared Variable: a"),
+        ("void f(int a, float a) {} void main() {}", Redeclared, "Redeclared Parameter: a"),
+        ("void main() {} void main() {}", Redeclared, "Redeclared Function: main"),
+        ("void readInt() {} void main() {}", Redeclared, "Redeclared Function: readInt"),
+        ("struct S {}; struct S {}; void main() {}", Redeclared, "Redeclared Struct: S"),
+        ("struct S { int a; float a; }; void main() {}", Redeclared, "Redeclared Member: a"),
+    ],
+)
+def test_resolution_errors(source, error, message):
+    """4. Unknown and duplicate names are reported"""
+    with pytest.raises(error) as info:
+        resolve(source)
+    assert str(info.value) == message
+
+
+def test_shadowing_allowed_in_nested_scopes():
+    """5. Blocks, for statements and switch bodies may redeclare outer names"""
+    program, symbols = resolve(
+        "void main() { int a = 1; { int a = 2; } for (int a = 0; a < 1; ++a) {} switch (a) { default: int a; } }"
+    )
+    assert [s.name for s in symbols if s.kind == "Variable"] == ["a"] * 4
@@ -0,0 +1,150 @@
+"""
+Tests for union-find type inference.
+Programs come from ASTGenerator; results are read from inferred_type.
+"""
+
+import pytest
+from tests.utils import ASTGenerator
+from src.astgen.interning import FLOAT_TYPE, INT_TYPE, STRING_TYPE, VOID_TYPE
+from src.semantics.static_error import TypeCannotBeInferred
+from src.semantics.type_inference import TypeInference, infer_types
+from src.utils.nodes import Expr, StructType, VarDecl, walk
+
+
+def infer(source):
+    return infer_types(ASTGenerator(source).generate())
+
+
+def var_types(program):
+    return {node.name: node.inferred_type for node in walk(program) if isinstance(node, VarDecl)}
+
+
+def error(source):
+    with pytest.raises(Exception) as info:
+        infer(source)
+    return info.value
+
+
+# ========== Inference ==========
+def test_spec_examples():
+    """1. Rule 2 examples: auto from initializers and from first usage"""
+    program = infer(
+        """
+        void main() {
+            auto x = 10; auto y = 3.14; auto msg = "hello"; auto sum = x + y;
+            auto flag = x < y; auto r = flag && 1; auto e = ++x;
+            auto a; a = 10;
+            auto b; b = 3.14;
+            auto c; c = a + b;
+            auto d; d = readInt();
+            auto p; printInt(p);
+            auto unused;
+        }
+        """
+    )
+    assert var_types(program) == {
+        "x": INT_TYPE, "y": FLOAT_TYPE, "msg": STRING_TYPE, "sum": FLOAT_TYPE,
+        "flag": INT_TYPE, "r": INT_TYPE, "e": INT_TYPE,
+        "a": INT_TYPE, "b": FLOAT_TYPE, "c": FLOAT_TYPE, "d": INT_TYPE, "p": INT_TYPE,
+        "unused": None,
+    }
+
+
+def test_return_types_and_calls():
+    """2. Omitted return types come from the first value return, else void"""
+    program = infer(
+        """
+        add(int x, int y) { return x + y; }
+        multiply(float a, float b) { return a * b; }
+        greet(string name) { printString(name); }
+        void main() { auto s = add(3, 5); auto p = multiply(2.5, 3.0); greet("W"); }
+        """
+    )
+    add, multiply, greet, main = program.decls
+    assert (add.inferred_type, multiply.inferred_type, greet.inferred_type) == (INT_TYPE, FLOAT_TYPE, VOID_TYPE)
+    assert var_types(program) == {"s": INT_TYPE, "p": FLOAT_TYPE}
+
+
+def test_structs_and_every_expression():
+    """3. Struct literals, member access and every expression get a type"""
+    program = infer(
+        """
+        struct Point { int x; float y; };
+        struct Line { Point a; Point b; };
+        float len(Line l) { return l.b.y - l.a.y; }
+        void main() {
+            Line l = {{1, 2.0}, {3, 4.5}};
+            auto p = l.a;
+            auto f = len({p, {0, 0.0}}) + p.x;
+        }
+        """
+    )
+    types = var_types(program)
+    assert isinstance(types["l"], StructType) and types["l"].struct_name == "Line"
+    assert types["p"].struct_name == "Point" and types["f"] is FLOAT_TYPE
+    assert all(node.inferred_type is not None for node in walk(program) if isinstance(node, Expr))
+
+
+def test_open_operands_follow_context():
+    """4. An open arithmetic operand takes the result's or the other operand's type"""
+    types = var_types(infer("void main() { auto a; float f = a * 2; auto b; auto c = b - 1; auto d; auto e = d < 2.5; }"))
+    assert (types["a"], types["b"], types["c"], types["d"]) == (FLOAT_TYPE, INT_TYPE, INT_TYPE, FLOAT_TYPE)
+
+
+# ========== Errors ==========
+@pytest.mark.parametrize(
+    "source, kind, culprit",
+    [
+        ("void main() { auto a; auto b; a = b; }", TypeCannotBeInferred, "ExprStmt(AssignExpr(Identifier(a) = Identifier(b)))"),
+        ("void main() { auto x = {1, 2}; }", TypeCannotBeInferred, "VarDecl(auto, x"),
+        ("void main() { auto a; auto b = a + a; }", TypeCannotBeInferred, "VarDecl(auto, b"),
+        ("f() { return f(); } void main() {}", TypeCannotBeInferred, "ReturnStmt"),
+    ],
+)
+def test_cannot_be_inferred(source, kind, culprit):
+    """5. Types that no usage determines are reported on their statement"""
+    exc = error(source)
+    assert type(exc) is kind and str(exc).startswith(f"Type Cannot Be Inferred: {culprit}")
+
+
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ("void main() { int x = 1.5; }", "Type Mismatch In Statement: VarDecl(IntType(), x = FloatLiteral(1.5))"),
+        ('void main() { auto x = 1; x = "s"; }', "Type Mismatch In Statement: ExprStmt(AssignExpr(Identifier(x) = StringLiteral('s')))"),
+        ("f() { return; return 1; } void main() {}", "Type Mismatch In Statement: ReturnStmt(return)"),
+        ('void main() { auto s = "a" + 1; }', "Type Mismatch In Expression: BinaryOp(StringLiteral('a'), +, IntLiteral(1))"),
+        ("void main() { auto f = 1.5; f++; }", "Type Mismatch In Expression: PostfixOp(Identifier(f)++)"),
+        ("void main() { if (1.5) {} }", "Type Mismatch In Statement: IfStmt(if FloatLiteral(1.5) then BlockStmt([]))"),
+        ("void main() { auto x = printInt(1); }", "Type Mismatch In Statement: VarDecl(auto, x = FuncCall(printInt, [IntLiteral(1)]))"),
+        ("void main() { printInt(1, 2); }", "Type Mismatch In Expression: FuncCall(printInt, [IntLiteral(1), IntLiteral(2)])"),
+        ("void main() { x = 1; }", "Undeclared Variable: x"),
+        ("void main() { f(); }", "Undeclared Function: f"),
+        ("void main() { P p; }", "Undeclared Struct: P"),
+    ],
+)
+def test_mismatches_and_undeclared(source, message):
+    """6. Conflicting constraints and unknown names raise static errors"""
+    assert str(error(source)) == message
+
+
+# ========== Scaling ==========
+def test_long_chains_use_few_classes():
+    """7. A long chain of auto variables is solved in one pass"""
+    n = 2000
+    lines = ["auto v0;"] + [f"auto v{i} = v{i - 1};" for i in range(1, n)] + [f"v{n - 1} = 1.5;"]
+    program = ASTGenerator("void main() {" + "\n".join(lines) + "}").generate()
+    inference = TypeInference()
+    inference.visit(program)
+    assert set(var_types(program).values()) == {FLOAT_TYPE}
+    # Near-linear: a handful of variables per node and short find() paths
+    assert len(inference._parent) < 3 * n + 20
+    assert max(_depth(inference, v) for v in range(len(inference._parent))) <= 12
+
+
+def _depth(inference, var):
+    depth = 0
+    while inference._parent[var] != var:
+        var = inference._parent[var]
+        depth += 1
+    return depth
@@ -0,0 +1,214 @@
+"""
+Tests for AST visitor dispatch and traversal helpers.
+"""
+
+import gc
+import weakref
+
+import pytest
+from tests.utils import ASTGenerator, SOURCE
+from src.utils import visitor as visitor_module
+from src.utils.arena import NODE_CLASSES
+from src.utils.nodes import *
+from src.utils.visitor import BaseVisitor, NodeTransformer, dispatch
+
+class KindCounter(BaseVisitor):
+    """Counts visited nodes by class name using BaseVisitor's traversal"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def visit(self, node, o=None):
+        name = type(node).__name__
+        self.counts[name] = self.counts.get(name, 0) + 1
+        return super().visit(node, o)
+
+
+class AcceptCounter(KindCounter):
+    """The same traversal dispatched through node.accept()"""
+
+    def visit(self, node, o=None):
+        name = type(node).__name__
+        self.counts[name] = self.counts.get(name, 0) + 1
+        return node.accept(self, o)
+
+
+# ========== Dispatch ==========
+def test_cached_dispatch_matches_accept():
+    """1. Cached dispatch visits exactly what accept() dispatch visits"""
+    program = ASTGenerator(SOURCE).generate()
+    cached, plain = KindCounter(), AcceptCounter()
+    cached.visit(program)
+    plain.visit(program)
+    assert cached.counts == plain.counts
+    assert cached.counts["FuncCall"] == 3
+
+
+def test_dispatch_without_subclassing():
+    """2. dispatch() works for visitors that do not subclass ASTVisitor"""
+
+    class Names:
+        def visit_identifier(self, node, o=None):
+            return o + node.name
+
+        def visit_int_literal(self, node, o=None):
+            return o + str(node.value)
+
+    names = Names()
+    assert dispatch(names, Identifier("x"), "id:") == "id:x"
+    assert dispatch(names, IntLiteral(3), "int:") == "int:3"
+    with pytest.raises(AttributeError):
+        dispatch(names, FloatLiteral(1.5))
+
+
+def test_dispatch_falls_back_to_accept():
+    """3. Nodes whose accept() does not simply name a method still work"""
+
+    class Wrapped(Identifier):
+        __slots__ = ()
+
+        def accept(self, visitor, o=None):
+            return ("wrapped", visitor.visit_identifier(self, o))
+
+    class Echo(BaseVisitor):
+        def visit_identifier(self, node, o=None):
+            return node.name
+
+    assert Echo().visit(Wrapped("w")) == ("wrapped", "w")
+    assert Echo().visit(Identifier("v")) == "v"
+
+
+def test_visit_names_and_weak_handler_cache():
+    """4. _visit_name names what accept() calls; handler tables do not keep visitors alive"""
+
+    class Recorder:
+        def __getattr__(self, name):
+            return lambda node, o=None: name
+
+    for cls in NODE_CLASSES:
+        assert cls._visit_name == cls.accept(object.__new__(cls), Recorder())
+
+    class Renamed(Identifier):
+        __slots__ = ()
+        _visit_name = "visit_renamed"
+
+        def accept(self, visitor, o=None):
+            return visitor.visit_renamed(self, o)
+
+    class Visitor(BaseVisitor):
+        def visit_renamed(self, node, o=None):
+            return "renamed " + node.name
+
+    assert Visitor().visit(Renamed("r")) == "renamed r"
+    assert visitor_module.handlers_for(Visitor)[Renamed] is Visitor.visit_renamed
+    assert Visitor in visitor_module._HANDLERS
+    visitor_cls = weakref.ref(Visitor)
+    del Visitor
+    gc.collect()
+    assert visitor_cls() is None
+
+
+# ========== Traversal ==========
+def test_walk_matches_visitor_traversal():
+    """5. walk() reaches every node BaseVisitor's traversal reaches"""
+    program = ASTGenerator(SOURCE).generate()
+    counter = KindCounter()
+    counter.visit(program)
+    walked = {}
+    for node in walk(program):
+        name = type(node).__name__
+        walked[name] = walked.get(name, 0) + 1
+    assert walked == counter.counts
+
+
+def test_walk_and_iter_children_order():
+    """6. Children come in field order and walk() is pre-order"""
+    call = FuncCall("f", [Identifier("a"), IntLiteral(1)])
+    stmt = IfStmt(BinaryOp(Identifier("x"), "<", call), ExprStmt(call), None)
+    assert [type(c).__name__ for c in iter_children(stmt)] == ["BinaryOp", "ExprStmt"]
+    assert list(iter_children(call)) == call.args
+    assert dict(iter_fields(call)) == {"name": "f", "args": call.args}
+    assert [type(n).__name__ for n in walk(stmt)] == [
+        "IfStmt", "BinaryOp", "Identifier", "FuncCall", "Identifier", "IntLiteral",
+        "ExprStmt", "FuncCall", "Identifier", "IntLiteral",
+    ]
+
+
+# ========== NodeTransformer ==========
+class ConstantFolder(NodeTransformer):
+    """Folds integer + and * once the operands are folded"""
+
+    def visit_binary_op(self, node, o=None):
+        self.generic_visit(node, o)
+        left, right = node.left, node.right
+        if isinstance(left, IntLiteral) and isinstance(right, IntLiteral):
+            if node.operator == "+":
+                return IntLiteral(left.value + right.value)
+            if node.operator == "*":
+                return IntLiteral(left.value * right.value)
+        return node
+
+
+def test_transformer_rewrites_in_place():
+    """7. Folded subtrees are replaced and untouched nodes are kept"""
+    program = ASTGenerator(
+        "void main() { int x = 1 + 2 * 3; int y = x + 1; printInt(x * (2 + 2)); }"
+    ).generate()
+    body = program.decls[0].body
+    statements = body.statements
+    y_init = statements[1].init_value
+    result = ConstantFolder().visit(program)
+    assert result is program
+    assert body.statements is statements
+    assert statements[1].init_value is y_init
+    assert str(statements[0].init_value) == "IntLiteral(7)"
+    assert str(statements[2]) == (
+        "ExprStmt(FuncCall(printInt, [BinaryOp(Identifier(x), *, IntLiteral(4))]))"
+    )
+
+
+def test_transformer_removes_and_splices():
+    """8. Returning None drops a list item; returning a list splices it in"""
+
+    class Rewrite(NodeTransformer):
+        def visit_expr_stmt(self, node, o=None):
+            call = node.expr
+            if isinstance(call, FuncCall) and call.name == "drop":
+                return None
+            if isinstance(call, FuncCall) and call.name == "twice":
+                return [ExprStmt(FuncCall("once", [])), ExprStmt(FuncCall("once", []))]
+            return node
+
+    program = ASTGenerator("void main() { drop(); keep(); twice(); }").generate()
+    statements = program.decls[0].body.statements
+    kept = statements[1]
+    Rewrite().visit(program)
+    assert program.decls[0].body.statements is statements
+    assert [s.expr.name for s in statements] == ["keep", "once", "once"]
+    assert statements[0] is kept
+
+
+def test_transformer_on_deep_trees():
+    """9. Nodes left to generic_visit are walked without recursion, in source order"""
+
+    class Rename(NodeTransformer):
+        def __init__(self):
+            self.seen = []
+
+        def visit_identifier(self, node, o=None):
+            self.seen.append(node.name)
+            return Identifier(node.name.upper())
+
+    inner = ExprStmt(Identifier("deep"))
+    root = inner
+    for _ in range(100_000):
+        root = BlockStmt([root])
+    Rename().visit(root)
+    assert inner.expr.name == "DEEP"
+
+    program = ASTGenerator(SOURCE).generate()
+    expected = [node.name for node in walk(program) if isinstance(node, Identifier)]
+    rename = Rename()
+    rename.visit(program)
+    assert rename.seen == expected
+    assert all(node.name.isupper() for node in walk(program) if isinstance(node, Identifier))
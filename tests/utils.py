@@ -12,27 +12,51 @@ sys.path.insert(0, project_root)
 sys.path.insert(0, build_dir)
 
 from build.TyCLexer import TyCLexer
-from build.TyCParser import TyCParser
 from antlr4 import InputStream, CommonTokenStream
-from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import walk
+from src.utils.parsing import make_lexer, make_parser, parse_program, run_deep
+
+
+# A small program touching structs, calls, loops and switches, shared by tests
+SOURCE = """
+struct Point { int x; int y; };
+int add(int a, int b) { return a + b; }
+void main() {
+    Point p = {1, 2};
+    for (auto i = 0; i < 10; ++i) { p.x = add(p.x, i); }
+    switch (p.x) { case 1: printInt(1); break; default: printInt(-p.y); }
+}
+"""
+
+
+def positions(root):
+    """(class name, line, column) of every node under root, in walk() order."""
+    return [(type(n).__name__, n.line, n.column) for n in walk(root)]
 
 
 class ASTGenerator:
-    """Class to generate AST from TyC source code."""
+    """Class to generate AST from TyC source code.
 
-    def __init__(self, input_string: str):
+    With deep=True the parse runs on a deep-stack thread and the AST is built
+    without recursion, for very deeply nested input. With a ParseCache,
+    generate() returns the cached result when there is one; the lexer and
+    parser are only built on a miss.
+    """
+
+    def __init__(self, input_string: str, deep: bool = False, cache=None):
         self.input_string = input_string
-        self.input_stream = InputStream(input_string)
-        self.lexer = TyCLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
-        self.parser = TyCParser(self.token_stream)
-        self.parser.removeErrorListeners()
-        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+        self.deep = deep
+        self.cache = cache
+        self.input_stream = None
+        self.lexer = None
+        self.token_stream = None
+        self.parser = None
+        self.parse_mode = None
         # Import here to avoid circular dependency issues during build
         try:
-            from src.astgen.ast_generation import ASTGeneration
+            from src.astgen.ast_generation import ASTGeneration, IterativeASTGeneration
 
-            self.ast_generator = ASTGeneration()
+            self.ast_generator = IterativeASTGeneration() if deep else ASTGeneration()
         except ImportError:
             self.ast_generator = None
 
@@ -40,16 +64,29 @@ class ASTGenerator:
         """Generate AST from the input string."""
         if self.ast_generator is None:
             return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+        if self.cache is not None:
+            return self.cache.fetch(self.input_string, self._generate, self.deep)
         try:
-            # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
-
-            # Generate AST using the visitor
-            ast = self.ast_generator.visit(parse_tree)
-            return ast
+            return self._generate()
         except Exception as e:
             return f"AST Generation Error: {str(e)}"
 
+    def _generate(self):
+        """Parse and build the AST, raising on any error."""
+        self.input_stream = InputStream(self.input_string)
+        self.lexer = make_lexer(self.input_stream)
+        self.token_stream = CommonTokenStream(self.lexer)
+        self.parser = make_parser(self.token_stream)
+        # Parse the program starting from the entry point
+        if self.deep:
+            parse_tree, self.parse_mode = run_deep(parse_program, self.parser)
+        else:
+            parse_tree, self.parse_mode = parse_program(self.parser)
+
+        # Generate AST using the visitor
+        ast = self.ast_generator.visit(parse_tree)
+        return ast
+
 
 class Tokenizer:
     """Lexer wrapper for testing"""
@@ -86,18 +123,17 @@ class Parser:
 
     def __init__(self, source_code: str):
         self.source_code = source_code
+        self.parse_mode = None
 
     def parse(self) -> str:
         """Parse source code and return result"""
         input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
+        lexer = make_lexer(input_stream)
         token_stream = CommonTokenStream(lexer)
-        parser = TyCParser(token_stream)
-        parser.removeErrorListeners()
-        parser.addErrorListener(NewErrorListener.INSTANCE)
+        parser = make_parser(token_stream)
 
         try:
-            tree = parser.program()
+            tree, self.parse_mode = parse_program(parser)
             return "success"
         except Exception as e:
             return str(e)